@@ -451,6 +451,9 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    # Load the integrations resolved on the previous start so unchanged
+    # integrations do not have to be resolved from disk again
+    await loader.async_load_integration_snapshot(hass)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -492,6 +495,12 @@ async def async_from_config_dict(
 
     await _async_set_up_integrations(hass, config)
 
+    hass.async_create_background_task(
+        loader.async_save_integration_snapshot(hass),
+        "save integration snapshot",
+        eager_start=True,
+    )
+
     stop = monotonic()
     _LOGGER.info("Home Assistant initialized in %.2fs", stop - start)
 
@@ -805,6 +814,7 @@ async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
     """Resolve all dependencies and return list of domains to set up."""
+    start = monotonic()
     domains_to_setup = _get_domains(hass, config)
     needed_requirements: set[str] = set()
     platform_integrations = conf_util.extract_platform_integrations(
@@ -920,6 +930,14 @@ async def _async_resolve_domains_to_setup(
                 to_resolve.add(dep)
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
+    _LOGGER.debug(
+        "Resolved %s integrations in %.3fs, %s restored from snapshot",
+        len(integration_cache),
+        monotonic() - start,
+        len(snapshot.restored)
+        if (snapshot := hass.data.get(loader.DATA_INTEGRATION_SNAPSHOT))
+        else 0,
+    )
 
     # Optimistically check if requirements are already installed
     # ahead of setting up the integrations so we can prime the cache
@@ -0,0 +1,89 @@
+"""Vectorized processing of PCM audio for Assist."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from .const import BYTES_PER_CHUNK, SAMPLE_RATE
+from .vad import AudioBuffer, chunk_samples
+
+SAMPLE_DTYPE = np.dtype("<i2")  # signed 16-bit little endian
+SAMPLE_MIN = -32768
+SAMPLE_MAX = 32767
+
+
+def multiply_volume(samples: np.ndarray, volume_multiplier: float) -> np.ndarray:
+    """Multiply 16-bit PCM samples by a constant, clipping to signed 16-bit."""
+    scaled = samples * np.float32(volume_multiplier)
+    np.clip(scaled, SAMPLE_MIN, SAMPLE_MAX, out=scaled)
+    return scaled.astype(SAMPLE_DTYPE)
+
+
+class AudioChunkProcessor:
+    """Scale, resample and split 16-bit mono PCM audio into fixed-size chunks.
+
+    The samples are processed with NumPy and split over memoryviews, so the
+    audio of a chunk is only copied when the chunk is yielded as bytes.
+    Audio which does not fill a chunk is kept for the next call.
+    """
+
+    def __init__(
+        self,
+        bytes_per_chunk: int = BYTES_PER_CHUNK,
+        sample_rate: int = SAMPLE_RATE,
+    ) -> None:
+        """Initialize the processor for audio at a sample rate."""
+        self.bytes_per_chunk = bytes_per_chunk
+        self.sample_rate = sample_rate
+        self._leftover_chunk_buffer = AudioBuffer(bytes_per_chunk)
+        self._resample_ratio = sample_rate / SAMPLE_RATE
+        self._resample_position = 0.0
+        self._resample_last: np.ndarray | None = None
+
+    def _resample(self, samples: np.ndarray) -> np.ndarray:
+        """Resample audio to SAMPLE_RATE with linear interpolation.
+
+        The last sample of the previous call is kept to interpolate across
+        the boundary of the calls.
+        """
+        if self._resample_last is not None:
+            samples = np.concatenate((self._resample_last, samples))
+        if len(samples) < 2:
+            self._resample_last = samples
+            return samples[:0].astype(np.float32)
+
+        positions = np.arange(
+            self._resample_position, len(samples) - 1, self._resample_ratio
+        )
+        resampled = np.interp(positions, np.arange(len(samples)), samples).astype(
+            np.float32
+        )
+        next_position = (
+            positions[-1] + self._resample_ratio
+            if len(positions)
+            else self._resample_position
+        )
+        self._resample_position = float(next_position) - (len(samples) - 1)
+        self._resample_last = samples[-1:]
+        return resampled
+
+    def process(self, audio: bytes, volume_multiplier: float = 1.0) -> Iterable[bytes]:
+        """Yield the processed chunks of audio."""
+        if volume_multiplier == 1.0 and self.sample_rate == SAMPLE_RATE:
+            yield from chunk_samples(
+                audio, self.bytes_per_chunk, self._leftover_chunk_buffer
+            )
+            return
+
+        samples: np.ndarray = np.frombuffer(audio, dtype=SAMPLE_DTYPE)
+        if self.sample_rate != SAMPLE_RATE:
+            samples = self._resample(samples)
+        samples = multiply_volume(samples, volume_multiplier)
+
+        yield from chunk_samples(
+            memoryview(samples).cast("B"),
+            self.bytes_per_chunk,
+            self._leftover_chunk_buffer,
+        )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import array
 import asyncio
 from collections import defaultdict, deque
 from collections.abc import AsyncGenerator, AsyncIterable, Callable
@@ -49,9 +48,9 @@ from homeassistant.util import (
 )
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
+from .audio import AudioChunkProcessor
 from .audio_enhancer import AudioEnhancer, EnhancedAudioChunk, MicroVadSpeexEnhancer
 from .const import (
-    BYTES_PER_CHUNK,
     CONF_DEBUG_RECORDING_DIR,
     DATA_CONFIG,
     DATA_LAST_WAKE_UP,
@@ -75,7 +74,7 @@ from .error import (
     WakeWordDetectionError,
     WakeWordTimeoutError,
 )
-from .vad import AudioBuffer, VoiceActivityTimeout, VoiceCommandSegmenter, chunk_samples
+from .vad import VoiceActivityTimeout, VoiceCommandSegmenter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -560,10 +559,10 @@ class PipelineRun:
     audio_enhancer: AudioEnhancer | None = None
     """VAD/noise suppression/auto gain"""
 
-    audio_chunking_buffer: AudioBuffer = field(
-        default_factory=lambda: AudioBuffer(BYTES_PER_CHUNK)
+    audio_chunk_processor: AudioChunkProcessor = field(
+        default_factory=AudioChunkProcessor
     )
-    """Buffer used when splitting audio into chunks for audio processing"""
+    """Volume scaling and splitting of audio into chunks for audio processing"""
 
     _device_id: str | None = None
     """Optional device id set during run start."""
@@ -1212,11 +1211,8 @@ class PipelineRun:
         """Apply volume transformation only (no VAD/audio enhancements) with optional chunking."""
         timestamp_ms = 0
         async for chunk in audio_stream:
-            if self.audio_settings.volume_multiplier != 1.0:
-                chunk = _multiply_volume(chunk, self.audio_settings.volume_multiplier)
-
-            for sub_chunk in chunk_samples(
-                chunk, BYTES_PER_CHUNK, self.audio_chunking_buffer
+            for sub_chunk in self.audio_chunk_processor.process(
+                chunk, self.audio_settings.volume_multiplier
             ):
                 yield EnhancedAudioChunk(
                     audio=sub_chunk,
@@ -1233,33 +1229,14 @@ class PipelineRun:
 
         timestamp_ms = 0
         async for dirty_samples in audio_stream:
-            if self.audio_settings.volume_multiplier != 1.0:
-                # Static gain
-                dirty_samples = _multiply_volume(
-                    dirty_samples, self.audio_settings.volume_multiplier
-                )
-
-            # Split into chunks for audio enhancements/VAD
-            for dirty_chunk in chunk_samples(
-                dirty_samples, BYTES_PER_CHUNK, self.audio_chunking_buffer
+            # Static gain and split into chunks for audio enhancements/VAD
+            for dirty_chunk in self.audio_chunk_processor.process(
+                dirty_samples, self.audio_settings.volume_multiplier
             ):
                 yield self.audio_enhancer.enhance_chunk(dirty_chunk, timestamp_ms)
                 timestamp_ms += MS_PER_CHUNK
 
 
-def _multiply_volume(chunk: bytes, volume_multiplier: float) -> bytes:
-    """Multiplies 16-bit PCM samples by a constant."""
-
-    def _clamp(val: float) -> float:
-        """Clamp to signed 16-bit."""
-        return max(-32768, min(32767, val))
-
-    return array.array(
-        "h",
-        (int(_clamp(value * volume_multiplier)) for value in array.array("h", chunk)),
-    ).tobytes()
-
-
 def _pipeline_debug_recording_thread_proc(
     run_recording_dir: Path,
     queue: Queue[str | bytes | None],
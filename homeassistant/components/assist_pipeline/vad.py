@@ -49,7 +49,7 @@ class AudioBuffer:
         """Clear the buffer."""
         self._length = 0
 
-    def append(self, data: bytes) -> None:
+    def append(self, data: bytes | memoryview) -> None:
         """Append bytes to the buffer, increasing the internal length."""
         data_len = len(data)
         if (self._length + data_len) > len(self._buffer):
@@ -60,7 +60,7 @@ class AudioBuffer:
 
     def bytes(self) -> bytes:
         """Convert written portion of buffer to bytes."""
-        return bytes(self._buffer[: self._length])
+        return bytes(memoryview(self._buffer)[: self._length])
 
     def __len__(self) -> int:
         """Get the number of bytes currently in the buffer."""
@@ -269,11 +269,15 @@ class VoiceActivityTimeout:
 
 
 def chunk_samples(
-    samples: bytes,
+    samples: bytes | memoryview,
     bytes_per_chunk: int,
     leftover_chunk_buffer: AudioBuffer,
 ) -> Iterable[bytes]:
-    """Yield fixed-sized chunks from samples, keeping leftover bytes from previous call(s)."""
+    """Yield fixed-sized chunks from samples, keeping leftover bytes from previous call(s).
+
+    The samples are sliced through a memoryview, so each chunk is copied once.
+    """
+    samples = memoryview(samples)
 
     if (len(leftover_chunk_buffer) + len(samples)) < bytes_per_chunk:
         # Extend leftover chunk, but not enough samples to complete it
@@ -294,7 +298,7 @@ def chunk_samples(
 
     while next_chunk_idx < len(samples) - bytes_per_chunk + 1:
         # Process full chunk
-        yield samples[next_chunk_idx : next_chunk_idx + bytes_per_chunk]
+        yield bytes(samples[next_chunk_idx : next_chunk_idx + bytes_per_chunk])
         next_chunk_idx += bytes_per_chunk
 
     # Capture leftover chunks
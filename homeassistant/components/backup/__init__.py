@@ -1,11 +1,13 @@
 """The Backup integration."""
 
+import voluptuous as vol
+
 from homeassistant.components.hassio import is_hassio
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DATA_MANAGER, DOMAIN, LOGGER
+from .const import ATTR_INCREMENTAL, DATA_MANAGER, DOMAIN, LOGGER
 from .http import async_register_http_views
 from .manager import BackupManager
 from .websocket import async_register_websocket_handlers
@@ -32,9 +34,14 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     async def async_handle_create_service(call: ServiceCall) -> None:
         """Service handler for creating backups."""
-        await backup_manager.generate_backup()
-
-    hass.services.async_register(DOMAIN, "create", async_handle_create_service)
+        await backup_manager.generate_backup(incremental=call.data[ATTR_INCREMENTAL])
+
+    hass.services.async_register(
+        DOMAIN,
+        "create",
+        async_handle_create_service,
+        schema=vol.Schema({vol.Optional(ATTR_INCREMENTAL, default=False): cv.boolean}),
+    )
 
     async_register_http_views(hass)
 
@@ -0,0 +1,269 @@
+"""Content addressed chunk store for incremental backups."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+import hashlib
+import io
+import os
+from pathlib import Path, PurePath
+import stat
+import tarfile
+from typing import Any
+import zlib
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import JsonObjectType, json_loads_object
+
+CHUNK_SIZE = 2**20 * 4  # 4MB
+COMPRESSION_LEVEL = 6
+INDEX_FILE = "index.json"
+
+ENTRY_DIR = "dir"
+ENTRY_FILE = "file"
+ENTRY_SYMLINK = "symlink"
+
+
+@dataclass(slots=True)
+class ManifestEntry:
+    """A file, directory or symlink in an incremental backup."""
+
+    name: str
+    type: str
+    mode: int
+    mtime: int
+    size: int = 0
+    chunks: list[str] = field(default_factory=list)
+    linkname: str = ""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of this entry."""
+        return asdict(self)
+
+
+def manifest_from_json(data: JsonObjectType) -> list[ManifestEntry]:
+    """Return the entries of a manifest."""
+    return [
+        ManifestEntry(**entry)  # type: ignore[arg-type]
+        for entry in data["entries"]  # type: ignore[union-attr]
+    ]
+
+
+def manifest_as_json(entries: list[ManifestEntry]) -> bytes:
+    """Return a manifest as JSON."""
+    return json_bytes({"entries": [entry.as_dict() for entry in entries]})
+
+
+def _is_excluded(path: PurePath, excludes: list[str]) -> bool:
+    """Return if a path is excluded, like securetar does."""
+    return any(path.match(exclude) for exclude in excludes)
+
+
+def _walk(
+    origin_path: Path, excludes: list[str], name: str = ""
+) -> Iterator[tuple[str, Path]]:
+    """Walk a directory in the same order as securetar adds it to a tar."""
+    if _is_excluded(origin_path, excludes):
+        return
+    yield name, origin_path
+    for item in origin_path.iterdir():
+        if _is_excluded(item, excludes):
+            continue
+        item_name = f"{name}/{item.name}" if name else item.name
+        if item.is_dir() and not item.is_symlink():
+            yield from _walk(item, excludes, item_name)
+            continue
+        yield item_name, item
+
+
+class _ChunkReader(io.RawIOBase):
+    """Read the content of a file from its chunks."""
+
+    def __init__(self, paths: list[Path]) -> None:
+        """Initialize the reader."""
+        super().__init__()
+        self._paths = deque(paths)
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        """Return if the reader is readable."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read the next decompressed bytes into a buffer."""
+        while not self._buffer and self._paths:
+            self._buffer = memoryview(
+                zlib.decompress(self._paths.popleft().read_bytes())
+            )
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class ChunkStore:
+    """Store the files of incremental backups as chunks named by their hash.
+
+    A chunk is compressed only when it is stored the first time, so the
+    files which did not change are not compressed again. The files which
+    have the same size and modification time as in the previous backup
+    are not read at all.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the chunk store."""
+        self.path = path
+        self._index_path = path / INDEX_FILE
+
+    def _chunk_path(self, digest: str) -> Path:
+        """Return the path of a chunk."""
+        return self.path / digest[:2] / digest
+
+    def _load_index(self) -> dict[str, Any]:
+        """Load the sizes, modification times and chunks of the last backup."""
+        try:
+            return json_loads_object(self._index_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_chunk(self, digest: str, data: bytes) -> None:
+        """Compress a chunk and write it to the store."""
+        chunk_path = self._chunk_path(digest)
+        chunk_path.parent.mkdir(exist_ok=True)
+        tmp_path = chunk_path.with_suffix(".tmp")
+        tmp_path.write_bytes(zlib.compress(data, COMPRESSION_LEVEL))
+        os.replace(tmp_path, chunk_path)
+
+    def store(
+        self,
+        origin_path: Path,
+        excludes: list[str],
+        snapshots: dict[str, Path | None],
+    ) -> list[ManifestEntry]:
+        """Store the files of a directory and return the manifest.
+
+        The snapshots replace the files with the same name, relative to the
+        directory.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        previous_index = self._load_index()
+        index: dict[str, Any] = {}
+        entries: list[ManifestEntry] = []
+        workers = os.cpu_count() or 1
+        pending: deque[Future[None]] = deque()
+        stored: set[str] = set()
+
+        def _store_chunks(path: Path) -> tuple[list[str], int]:
+            """Split a file into chunks and store the new ones."""
+            chunks: list[str] = []
+            size = 0
+            with path.open("rb") as file:
+                while data := file.read(CHUNK_SIZE):
+                    digest = hashlib.sha256(data).hexdigest()
+                    chunks.append(digest)
+                    size += len(data)
+                    if digest in stored or self._chunk_path(digest).exists():
+                        continue
+                    stored.add(digest)
+                    # Limit the memory used by the chunks waiting to be written
+                    if len(pending) >= workers * 2:
+                        pending.popleft().result()
+                    pending.append(executor.submit(self._write_chunk, digest, data))
+            return chunks, size
+
+        # zlib releases the GIL while it compresses, so the chunks are
+        # compressed in parallel by the threads of the executor.
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="BackupChunkStore"
+        ) as executor:
+            files = [
+                (name, path, False)
+                for name, path in _walk(origin_path, [*excludes, *snapshots])
+            ]
+            files.extend(
+                (name, path, True)
+                for name, path in snapshots.items()
+                if path is not None
+            )
+            for name, path, is_snapshot in files:
+                try:
+                    path_stat = path.lstat()
+                except FileNotFoundError:
+                    continue
+                entry = ManifestEntry(
+                    name=name,
+                    type=ENTRY_FILE,
+                    mode=stat.S_IMODE(path_stat.st_mode),
+                    mtime=int(path_stat.st_mtime),
+                )
+                if stat.S_ISLNK(path_stat.st_mode):
+                    entry.type = ENTRY_SYMLINK
+                    entry.linkname = os.readlink(path)
+                elif stat.S_ISDIR(path_stat.st_mode):
+                    entry.type = ENTRY_DIR
+                else:
+                    key = [path_stat.st_size, path_stat.st_mtime_ns]
+                    if (
+                        not is_snapshot
+                        and (cached := previous_index.get(name))
+                        and cached[:2] == key
+                        and all(
+                            self._chunk_path(digest).exists() for digest in cached[2]
+                        )
+                    ):
+                        entry.chunks = cached[2]
+                        entry.size = path_stat.st_size
+                    else:
+                        try:
+                            entry.chunks, entry.size = _store_chunks(path)
+                        except FileNotFoundError:
+                            continue
+                    if not is_snapshot:
+                        index[name] = [*key, entry.chunks]
+                entries.append(entry)
+
+            for future in pending:
+                future.result()
+
+        self._index_path.write_bytes(json_bytes(index))
+        return entries
+
+    def export(
+        self, entries: list[ManifestEntry], tar_file: tarfile.TarFile, arcname: str
+    ) -> None:
+        """Add the files of a manifest to a tar file."""
+        for entry in entries:
+            tar_info = tarfile.TarInfo(
+                f"{arcname}/{entry.name}" if entry.name else arcname
+            )
+            tar_info.mode = entry.mode
+            tar_info.mtime = entry.mtime
+            if entry.type == ENTRY_DIR:
+                tar_info.type = tarfile.DIRTYPE
+                tar_file.addfile(tar_info)
+            elif entry.type == ENTRY_SYMLINK:
+                tar_info.type = tarfile.SYMTYPE
+                tar_info.linkname = entry.linkname
+                tar_file.addfile(tar_info)
+            else:
+                tar_info.size = entry.size
+                reader = _ChunkReader(
+                    [self._chunk_path(digest) for digest in entry.chunks]
+                )
+                with io.BufferedReader(reader, CHUNK_SIZE) as fileobj:
+                    tar_file.addfile(tar_info, fileobj)
+
+    def remove_unreferenced(self, referenced: set[str]) -> int:
+        """Remove the chunks which are not referenced and return their number."""
+        removed = 0
+        for chunk_dir in self.path.iterdir():
+            if not chunk_dir.is_dir():
+                continue
+            for chunk_path in chunk_dir.iterdir():
+                if chunk_path.name not in referenced:
+                    chunk_path.unlink(missing_ok=True)
+                    removed += 1
+        return removed
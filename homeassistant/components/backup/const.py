@@ -14,13 +14,21 @@ DOMAIN = "backup"
 DATA_MANAGER: HassKey[BackupManager] = HassKey(DOMAIN)
 LOGGER = getLogger(__package__)
 
+ATTR_INCREMENTAL = "incremental"
+
+CHUNK_STORE_DIR = "chunks"
+EXPORT_DIR = "exports"
+
 EXCLUDE_FROM_BACKUP = [
     "__pycache__/*",
     ".DS_Store",
     "*.db-shm",
     "*.log.*",
     "*.log",
+    "backups/*.snapshot",
     "backups/*.tar",
+    f"backups/{CHUNK_STORE_DIR}",
+    f"backups/{EXPORT_DIR}",
     "OZW_Log.txt",
     "tts/*",
 ]
@@ -42,8 +42,11 @@ class DownloadBackupView(HomeAssistantView):
         if backup is None or not backup.path.exists():
             return Response(status=HTTPStatus.NOT_FOUND)
 
+        # Incremental backups are downloaded in the tar format
+        path = await manager.export_backup(backup)
+
         return FileResponse(
-            path=backup.path.as_posix(),
+            path=path.as_posix(),
             headers={
                 CONTENT_DISPOSITION: f"attachment; filename={slugify(backup.name)}.tar"
             },
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from dataclasses import asdict, dataclass
+from functools import partial
 import hashlib
 import io
 import json
 from pathlib import Path
+import shutil
 import tarfile
 from tarfile import TarError
 import time
@@ -16,17 +19,20 @@ from typing import Any, Protocol, cast
 from securetar import SecureTarFile, atomic_contents_add
 
 from homeassistant.const import __version__ as HAVERSION
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import integration_platform
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads_object
 
-from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
+from .chunk_store import ChunkStore, ManifestEntry, manifest_as_json, manifest_from_json
+from .const import CHUNK_STORE_DIR, DOMAIN, EXCLUDE_FROM_BACKUP, EXPORT_DIR, LOGGER
 
 BUF_SIZE = 2**20 * 4  # 4MB
 
+type BackupProgressListener = Callable[[dict[str, Any]], None]
+
 
 @dataclass(slots=True)
 class Backup:
@@ -37,6 +43,7 @@ class Backup:
     date: str
     path: Path
     size: float
+    incremental: bool = False
 
     def as_dict(self) -> dict:
         """Return a dict representation of this backup."""
@@ -53,6 +60,28 @@ class BackupPlatformProtocol(Protocol):
         """Perform operations after a backup finishes."""
 
 
+class BackupSnapshotPlatformProtocol(BackupPlatformProtocol, Protocol):
+    """Define the format of backup platforms which can snapshot their files.
+
+    The backups generated by the backup manager contain the snapshots instead
+    of the live files, and async_pre_backup and async_post_backup are not
+    called for these platforms.
+    """
+
+    async def async_snapshot_backup(
+        self,
+        hass: HomeAssistant,
+        snapshot_dir: Path,
+        progress_callback: Callable[[float], None],
+    ) -> dict[str, Path | None]:
+        """Copy files which are in use to the snapshot directory.
+
+        Return the snapshots keyed by the path of the file they replace,
+        relative to the configuration directory. Files mapped to None are
+        left out of the backup.
+        """
+
+
 class BackupManager:
     """Backup manager for the Backup integration."""
 
@@ -60,11 +89,16 @@ class BackupManager:
         """Initialize the backup manager."""
         self.hass = hass
         self.backup_dir = Path(hass.config.path("backups"))
+        self.chunk_store = ChunkStore(Path(self.backup_dir, CHUNK_STORE_DIR))
         self.backing_up = False
+        # Held while chunks are stored or removed, so chunks which a backup
+        # in progress found in the store are not removed before it is done
+        self._chunk_store_lock = asyncio.Lock()
         self.backups: dict[str, Backup] = {}
         self.platforms: dict[str, BackupPlatformProtocol] = {}
         self.loaded_backups = False
         self.loaded_platforms = False
+        self._progress_listeners: set[BackupProgressListener] = set()
 
     @callback
     def _add_platform(
@@ -84,7 +118,70 @@ class BackupManager:
             return
         self.platforms[integration_domain] = platform
 
-    async def pre_backup_actions(self) -> None:
+    @callback
+    def async_subscribe_progress(
+        self, listener: BackupProgressListener
+    ) -> CALLBACK_TYPE:
+        """Subscribe to the progress of the backups."""
+        self._progress_listeners.add(listener)
+        return partial(self._progress_listeners.discard, listener)
+
+    @callback
+    def _async_report_progress(self, progress: dict[str, Any]) -> None:
+        """Send the progress of a backup to the subscribers."""
+        for listener in list(self._progress_listeners):
+            listener(progress)
+
+    @callback
+    def _async_report_snapshot_progress(self, domain: str, progress: float) -> None:
+        """Send the progress of the snapshot of a platform to the subscribers."""
+        self._async_report_progress(
+            {"stage": "snapshot", "domain": domain, "progress": progress}
+        )
+
+    def _get_platforms(
+        self, skip_snapshot_platforms: bool
+    ) -> list[BackupPlatformProtocol]:
+        """Return the platforms, optionally without the snapshot platforms."""
+        return [
+            platform
+            for platform in self.platforms.values()
+            if not skip_snapshot_platforms
+            or not hasattr(platform, "async_snapshot_backup")
+        ]
+
+    async def snapshot_actions(self, snapshot_dir: Path) -> dict[str, Path | None]:
+        """Snapshot the files of the platforms which support it.
+
+        Return the snapshots keyed by the path of the file they replace.
+        """
+        if not self.loaded_platforms:
+            await self.load_platforms()
+
+        snapshot_platforms = {
+            domain: cast(BackupSnapshotPlatformProtocol, platform)
+            for domain, platform in self.platforms.items()
+            if hasattr(platform, "async_snapshot_backup")
+        }
+        snapshot_results = await asyncio.gather(
+            *(
+                platform.async_snapshot_backup(
+                    self.hass,
+                    snapshot_dir,
+                    partial(self._async_report_snapshot_progress, domain),
+                )
+                for domain, platform in snapshot_platforms.items()
+            ),
+            return_exceptions=True,
+        )
+        snapshots: dict[str, Path | None] = {}
+        for result in snapshot_results:
+            if isinstance(result, BaseException):
+                raise result
+            snapshots.update(result)
+        return snapshots
+
+    async def pre_backup_actions(self, skip_snapshot_platforms: bool = False) -> None:
         """Perform pre backup actions."""
         if not self.loaded_platforms:
             await self.load_platforms()
@@ -92,7 +189,7 @@ class BackupManager:
         pre_backup_results = await asyncio.gather(
             *(
                 platform.async_pre_backup(self.hass)
-                for platform in self.platforms.values()
+                for platform in self._get_platforms(skip_snapshot_platforms)
             ),
             return_exceptions=True,
         )
@@ -100,7 +197,7 @@ class BackupManager:
             if isinstance(result, Exception):
                 raise result
 
-    async def post_backup_actions(self) -> None:
+    async def post_backup_actions(self, skip_snapshot_platforms: bool = False) -> None:
         """Perform post backup actions."""
         if not self.loaded_platforms:
             await self.load_platforms()
@@ -108,7 +205,7 @@ class BackupManager:
         post_backup_results = await asyncio.gather(
             *(
                 platform.async_post_backup(self.hass)
-                for platform in self.platforms.values()
+                for platform in self._get_platforms(skip_snapshot_platforms)
             ),
             return_exceptions=True,
         )
@@ -145,6 +242,7 @@ class BackupManager:
                             date=cast(str, data["date"]),
                             path=backup_path,
                             size=round(backup_path.stat().st_size / 1_048_576, 2),
+                            incremental=data.get("incremental") is True,
                         )
                         backups[backup.slug] = backup
             except (OSError, TarError, json.JSONDecodeError, KeyError) as err:
@@ -188,18 +286,102 @@ class BackupManager:
         await self.hass.async_add_executor_job(backup.path.unlink, True)
         LOGGER.debug("Removed backup located at %s", backup.path)
         self.backups.pop(slug)
+        if backup.incremental:
+            async with self._chunk_store_lock:
+                await self.hass.async_add_executor_job(
+                    self._remove_incremental_backup_files, backup
+                )
 
-    async def generate_backup(self) -> Backup:
-        """Generate a backup."""
+    def _remove_incremental_backup_files(self, backup: Backup) -> None:
+        """Remove the export and the chunks only used by an incremental backup."""
+        Path(self.backup_dir, EXPORT_DIR, f"{backup.slug}.tar").unlink(True)
+        referenced: set[str] = set()
+        for other_backup in self.backups.values():
+            if not other_backup.incremental:
+                continue
+            try:
+                referenced.update(
+                    digest
+                    for entry in self._read_manifest(other_backup)[1]
+                    for digest in entry.chunks
+                )
+            except (OSError, TarError, json.JSONDecodeError, KeyError) as err:
+                LOGGER.warning(
+                    "Not removing unused chunks, unable to read backup %s: %s",
+                    other_backup.path,
+                    err,
+                )
+                return
+        removed = self.chunk_store.remove_unreferenced(referenced)
+        LOGGER.debug("Removed %s unused chunks", removed)
+
+    def _read_manifest(
+        self, backup: Backup
+    ) -> tuple[dict[str, Any], list[ManifestEntry]]:
+        """Read the backup data and the manifest of an incremental backup."""
+        with tarfile.open(backup.path, "r:", bufsize=BUF_SIZE) as backup_file:
+            data_file = backup_file.extractfile("./backup.json")
+            manifest_file = backup_file.extractfile("./manifest.json")
+            if data_file is None or manifest_file is None:
+                raise KeyError("manifest.json")
+            return (
+                json_loads_object(data_file.read()),
+                manifest_from_json(json_loads_object(manifest_file.read())),
+            )
+
+    async def export_backup(self, backup: Backup) -> Path:
+        """Return the path of a backup in the tar format.
+
+        Incremental backups are exported to a tar file the first time.
+        """
+        if not backup.incremental:
+            return backup.path
+        return await self.hass.async_add_executor_job(self._export_backup, backup)
+
+    def _export_backup(self, backup: Backup) -> Path:
+        """Export an incremental backup to a tar file and return its path."""
+        export_path = Path(self.backup_dir, EXPORT_DIR, f"{backup.slug}.tar")
+        if export_path.exists():
+            return export_path
+        export_path.parent.mkdir(exist_ok=True)
+        backup_data, entries = self._read_manifest(backup)
+        del backup_data["incremental"]
+        tmp_path = export_path.with_suffix(".tmp")
+        outer_secure_tarfile = SecureTarFile(
+            tmp_path, "w", gzip=False, bufsize=BUF_SIZE
+        )
+        with outer_secure_tarfile as outer_secure_tarfile_tarfile:
+            _add_bytes(
+                outer_secure_tarfile_tarfile, "./backup.json", json_bytes(backup_data)
+            )
+            with outer_secure_tarfile.create_inner_tar(
+                "./homeassistant.tar.gz", gzip=True
+            ) as core_tar:
+                self.chunk_store.export(entries, core_tar, "data")
+        tmp_path.rename(export_path)
+        LOGGER.debug("Exported backup %s to %s", backup.slug, export_path)
+        return export_path
+
+    async def generate_backup(self, incremental: bool = False) -> Backup:
+        """Generate a backup.
+
+        Incremental backups only store the files which changed since the
+        previous incremental backup.
+        """
         if self.backing_up:
             raise HomeAssistantError("Backup already in progress")
 
+        backup_name = f"Core {HAVERSION}"
+        date_str = dt_util.now().isoformat()
+        slug = _generate_slug(date_str, backup_name)
+        snapshot_dir = Path(self.backup_dir, f"{slug}.snapshot")
         try:
             self.backing_up = True
-            await self.pre_backup_actions()
-            backup_name = f"Core {HAVERSION}"
-            date_str = dt_util.now().isoformat()
-            slug = _generate_slug(date_str, backup_name)
+            await self.hass.async_add_executor_job(
+                partial(snapshot_dir.mkdir, parents=True, exist_ok=True)
+            )
+            snapshots = await self.snapshot_actions(snapshot_dir)
+            await self.pre_backup_actions(skip_snapshot_platforms=True)
 
             backup_data = {
                 "slug": slug,
@@ -210,31 +392,40 @@ class BackupManager:
                 "homeassistant": {"version": HAVERSION},
                 "compressed": True,
             }
+            if incremental:
+                backup_data["incremental"] = True
             tar_file_path = Path(self.backup_dir, f"{backup_data['slug']}.tar")
-            size_in_bytes = await self.hass.async_add_executor_job(
-                self._mkdir_and_generate_backup_contents,
-                tar_file_path,
-                backup_data,
-            )
-            backup = Backup(
-                slug=slug,
-                name=backup_name,
-                date=date_str,
-                path=tar_file_path,
-                size=round(size_in_bytes / 1_048_576, 2),
-            )
-            if self.loaded_backups:
-                self.backups[slug] = backup
+            self._async_report_progress({"stage": "archive"})
+            async with self._chunk_store_lock:
+                size_in_bytes = await self.hass.async_add_executor_job(
+                    self._mkdir_and_generate_backup_contents,
+                    tar_file_path,
+                    backup_data,
+                    snapshots,
+                )
+                backup = Backup(
+                    slug=slug,
+                    name=backup_name,
+                    date=date_str,
+                    path=tar_file_path,
+                    size=round(size_in_bytes / 1_048_576, 2),
+                    incremental=incremental,
+                )
+                if self.loaded_backups:
+                    self.backups[slug] = backup
             LOGGER.debug("Generated new backup with slug %s", slug)
             return backup
         finally:
             self.backing_up = False
-            await self.post_backup_actions()
+            await self.hass.async_add_executor_job(shutil.rmtree, snapshot_dir, True)
+            self._async_report_progress({"stage": "done"})
+            await self.post_backup_actions(skip_snapshot_platforms=True)
 
     def _mkdir_and_generate_backup_contents(
         self,
         tar_file_path: Path,
         backup_data: dict[str, Any],
+        snapshots: dict[str, Path | None],
     ) -> int:
         """Generate backup contents and return the size."""
         if not self.backup_dir.exists():
@@ -245,25 +436,43 @@ class BackupManager:
             tar_file_path, "w", gzip=False, bufsize=BUF_SIZE
         )
         with outer_secure_tarfile as outer_secure_tarfile_tarfile:
-            raw_bytes = json_bytes(backup_data)
-            fileobj = io.BytesIO(raw_bytes)
-            tar_info = tarfile.TarInfo(name="./backup.json")
-            tar_info.size = len(raw_bytes)
-            tar_info.mtime = int(time.time())
-            outer_secure_tarfile_tarfile.addfile(tar_info, fileobj=fileobj)
-            with outer_secure_tarfile.create_inner_tar(
-                "./homeassistant.tar.gz", gzip=True
-            ) as core_tar:
-                atomic_contents_add(
-                    tar_file=core_tar,
-                    origin_path=Path(self.hass.config.path()),
-                    excludes=EXCLUDE_FROM_BACKUP,
-                    arcname="data",
+            _add_bytes(
+                outer_secure_tarfile_tarfile, "./backup.json", json_bytes(backup_data)
+            )
+            if backup_data.get("incremental"):
+                entries = self.chunk_store.store(
+                    Path(self.hass.config.path()), EXCLUDE_FROM_BACKUP, snapshots
                 )
+                _add_bytes(
+                    outer_secure_tarfile_tarfile,
+                    "./manifest.json",
+                    manifest_as_json(entries),
+                )
+            else:
+                with outer_secure_tarfile.create_inner_tar(
+                    "./homeassistant.tar.gz", gzip=True
+                ) as core_tar:
+                    atomic_contents_add(
+                        tar_file=core_tar,
+                        origin_path=Path(self.hass.config.path()),
+                        excludes=[*EXCLUDE_FROM_BACKUP, *snapshots],
+                        arcname="data",
+                    )
+                    for name, snapshot_path in snapshots.items():
+                        if snapshot_path is not None:
+                            core_tar.add(snapshot_path, arcname=f"data/{name}")
 
         return tar_file_path.stat().st_size
 
 
+def _add_bytes(tar_file: tarfile.TarFile, name: str, raw_bytes: bytes) -> None:
+    """Add a file with the given content to a tar file."""
+    tar_info = tarfile.TarInfo(name=name)
+    tar_info.size = len(raw_bytes)
+    tar_info.mtime = int(time.time())
+    tar_file.addfile(tar_info, fileobj=io.BytesIO(raw_bytes))
+
+
 def _generate_slug(date: str, name: str) -> str:
     """Generate a backup slug."""
     return hashlib.sha1(f"{date} - {name}".lower().encode()).hexdigest()[:8]
@@ -21,6 +21,7 @@ def async_register_websocket_handlers(hass: HomeAssistant, with_hassio: bool) ->
     websocket_api.async_register_command(hass, handle_info)
     websocket_api.async_register_command(hass, handle_create)
     websocket_api.async_register_command(hass, handle_remove)
+    websocket_api.async_register_command(hass, handle_subscribe_progress)
 
 
 @websocket_api.require_admin
@@ -62,7 +63,12 @@ async def handle_remove(
 
 
 @websocket_api.require_admin
-@websocket_api.websocket_command({vol.Required("type"): "backup/generate"})
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "backup/generate",
+        vol.Optional("incremental", default=False): bool,
+    }
+)
 @websocket_api.async_response
 async def handle_create(
     hass: HomeAssistant,
@@ -70,10 +76,32 @@ async def handle_create(
     msg: dict[str, Any],
 ) -> None:
     """Generate a backup."""
-    backup = await hass.data[DATA_MANAGER].generate_backup()
+    backup = await hass.data[DATA_MANAGER].generate_backup(
+        incremental=msg["incremental"]
+    )
     connection.send_result(msg["id"], backup)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "backup/subscribe_progress"})
+@callback
+def handle_subscribe_progress(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to the progress of backups."""
+
+    @callback
+    def _forward_progress(progress: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], progress))
+
+    connection.subscriptions[msg["id"]] = hass.data[
+        DATA_MANAGER
+    ].async_subscribe_progress(_forward_progress)
+    connection.send_result(msg["id"])
+
+
 @websocket_api.ws_require_user(only_supervisor=True)
 @websocket_api.websocket_command({vol.Required("type"): "backup/start"})
 @websocket_api.async_response
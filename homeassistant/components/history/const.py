@@ -5,3 +5,5 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+MIN_DOWNSAMPLE_RESOLUTION = 1.0  # seconds
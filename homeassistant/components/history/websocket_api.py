@@ -15,6 +15,7 @@ from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
     COMPRESSED_STATE_ATTRIBUTES,
     COMPRESSED_STATE_LAST_CHANGED,
     COMPRESSED_STATE_LAST_UPDATED,
@@ -38,7 +39,11 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+    MIN_DOWNSAMPLE_RESOLUTION,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -93,6 +98,62 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_get_downsampled_states(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    downsample_entity_ids: list[str],
+    bucket_seconds: float,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> bytes:
+    """Fetch history with result numeric states and convert it to json."""
+    result: dict[str, list[Any]] = {}
+    if downsample_entity_ids:
+        result.update(
+            history.get_downsampled_states(
+                hass,
+                start_time,
+                end_time,
+                downsample_entity_ids,
+                bucket_seconds,
+                include_start_time_state,
+                no_attributes,
+            )
+        )
+    if other_entity_ids := [
+        entity_id for entity_id in entity_ids if entity_id not in downsample_entity_ids
+    ]:
+        result.update(
+            history.get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                other_entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            )
+        )
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            {
+                entity_id: result[entity_id]
+                for entity_id in entity_ids
+                if entity_id in result
+            },
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +164,10 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Exclusive("max_points", "downsample"): vol.All(int, vol.Range(min=1)),
+        vol.Exclusive("resolution", "downsample"): vol.All(
+            vol.Coerce(float), vol.Range(min=MIN_DOWNSAMPLE_RESOLUTION)
+        ),
     }
 )
 @websocket_api.async_response
@@ -155,8 +220,39 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if "max_points" in msg or "resolution" in msg:
+        if not (bucket_seconds := msg.get("resolution")):
+            period = (end_time or dt_util.utcnow()) - start_time
+            bucket_seconds = max(
+                period.total_seconds() / msg["max_points"], MIN_DOWNSAMPLE_RESOLUTION
+            )
+        # Only the entities which are drawn as a line graph are downsampled
+        downsample_entity_ids = [
+            entity_id
+            for entity_id in entity_ids
+            if (state := hass.states.get(entity_id))
+            and ATTR_UNIT_OF_MEASUREMENT in state.attributes
+        ]
+        connection.send_message(
+            await get_instance(hass).async_add_read_executor_job(
+                _ws_get_downsampled_states,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                downsample_entity_ids,
+                bucket_seconds,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        )
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -279,7 +375,7 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
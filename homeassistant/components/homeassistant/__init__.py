@@ -16,6 +16,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
+    EVENT_HOMEASSISTANT_STOP,
     RESTART_EXIT_CODE,
     SERVICE_RELOAD,
     SERVICE_SAVE_PERSISTENT_STATES,
@@ -24,6 +25,7 @@ from homeassistant.const import (
     SERVICE_TURN_ON,
 )
 from homeassistant.core import (
+    Event,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -41,6 +43,7 @@ from homeassistant.helpers.service import (
 from homeassistant.helpers.signal import KEY_HA_STOP
 from homeassistant.helpers.template import async_load_custom_templates
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.yaml import clear_parse_cache
 
 # The scene integration will do a late import of scene
 # so we want to make sure its loaded with the component
@@ -262,6 +265,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
 
     async def async_handle_reload_config(call: ServiceCall) -> None:
         """Service handler for reloading core config."""
+        # Parse all the files again, in case a change went unnoticed
+        clear_parse_cache()
         try:
             conf = await conf_util.async_hass_config_yaml(hass)
         except HomeAssistantError as err:
@@ -386,6 +391,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
     hass.data[DATA_EXPOSED_ENTITIES] = exposed_entities
     async_set_stop_handler(hass, _async_stop)
 
+    @callback
+    def _async_clear_parse_cache(event: Event) -> None:
+        """Clear the cache of parsed YAML files when stopping."""
+        clear_parse_cache()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_clear_parse_cache)
+
     return True
 
 
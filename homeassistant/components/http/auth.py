@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
 from datetime import timedelta
+from functools import partial
 from ipaddress import ip_address
 import logging
 import secrets
@@ -14,13 +15,14 @@ from aiohttp import hdrs
 from aiohttp.web import Application, Request, StreamResponse, middleware
 import jwt
 from jwt import api_jws
+from lru import LRU
 from yarl import URL
 
-from homeassistant.auth import jwt_wrapper
+from homeassistant.auth import EVENT_USER_REMOVED, jwt_wrapper
 from homeassistant.auth.const import GROUP_ID_READ_ONLY
-from homeassistant.auth.models import User
+from homeassistant.auth.models import RefreshToken, User
 from homeassistant.components import websocket_api
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.http import current_request
 from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.network import is_cloud_connection
@@ -40,6 +42,8 @@ STORAGE_VERSION = 1
 STORAGE_KEY = "http.auth"
 CONTENT_USER_NAME = "Home Assistant Content"
 
+VERIFIED_TOKEN_CACHE_SIZE: Final = 256
+
 
 @callback
 def async_sign_path(
@@ -117,6 +121,112 @@ def async_user_not_allowed_do_auth(
     return "User cannot authenticate remotely"
 
 
+class _VerifiedTokenCache:
+    """Cache of verified tokens, keyed by token.
+
+    Verifying the signature of a token for every request is expensive when
+    the same token is used over and over again, like the signed paths of
+    camera thumbnails. Entries expire with the token, and are removed when
+    their refresh token is revoked or their user is removed.
+    """
+
+    __slots__ = ("_hass", "_revoke_listeners", "_tokens")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._tokens: LRU[str, tuple[RefreshToken, float, Any]] = LRU(
+            VERIFIED_TOKEN_CACHE_SIZE
+        )
+        self._revoke_listeners: set[str] = set()
+
+    @callback
+    def async_get(self, token: str) -> tuple[RefreshToken, Any] | None:
+        """Return the refresh token and data of a verified token."""
+        if (entry := self._tokens.get(token)) is None:
+            return None
+        refresh_token, expire_at, data = entry
+        if time.time() >= expire_at:
+            self._tokens.pop(token, None)
+            return None
+        return refresh_token, data
+
+    @callback
+    def async_set(
+        self, token: str, refresh_token: RefreshToken, expire_at: float, data: Any
+    ) -> None:
+        """Store a verified token until it expires."""
+        if refresh_token.id not in self._revoke_listeners:
+            self._revoke_listeners.add(refresh_token.id)
+            self._hass.auth.async_register_revoke_token_callback(
+                refresh_token.id, partial(self._async_revoke, refresh_token.id)
+            )
+        self._tokens[token] = (refresh_token, expire_at, data)
+
+    @callback
+    def _async_revoke(self, refresh_token_id: str) -> None:
+        """Remove the tokens of a revoked refresh token."""
+        self._revoke_listeners.discard(refresh_token_id)
+        for token in [
+            token
+            for token, (refresh_token, _, _) in self._tokens.items()
+            if refresh_token.id == refresh_token_id
+        ]:
+            del self._tokens[token]
+
+    @callback
+    def async_remove_user(self, user_id: str) -> None:
+        """Remove the tokens of a removed user."""
+        for token in [
+            token
+            for token, (refresh_token, _, _) in self._tokens.items()
+            if refresh_token.user.id == user_id
+        ]:
+            del self._tokens[token]
+
+
+@callback
+def _async_validate_access_token(
+    hass: HomeAssistant, cache: _VerifiedTokenCache, token: str
+) -> RefreshToken | None:
+    """Return the refresh token of a valid access token."""
+    refresh_token: RefreshToken | None
+    if (cached := cache.async_get(token)) is not None:
+        refresh_token = cached[0]
+        return refresh_token if refresh_token.user.is_active else None
+
+    if (refresh_token := hass.auth.async_validate_access_token(token)) is not None:
+        cache.async_set(
+            token,
+            refresh_token,
+            jwt_wrapper.unverified_hs256_token_decode(token)["exp"],
+            None,
+        )
+    return refresh_token
+
+
+@callback
+def _async_verify_signature(
+    cache: _VerifiedTokenCache, signature: str, secret: str
+) -> tuple[dict[str, Any], RefreshToken | None] | None:
+    """Return the claims of a valid signature.
+
+    The refresh token is returned too if the signature was verified before.
+    """
+    # Signatures are only valid with the secret they were verified with
+    if (cached := cache.async_get(signature)) is not None and cached[1][0] is secret:
+        refresh_token, (_, claims) = cached
+        return claims, refresh_token
+
+    try:
+        claims = jwt_wrapper.verify_and_decode(
+            signature, secret, algorithms=["HS256"], options={"verify_iss": False}
+        )
+    except jwt.InvalidTokenError:
+        return None
+    return claims, None
+
+
 async def async_setup_auth(
     hass: HomeAssistant,
     app: Application,
@@ -142,6 +252,17 @@ async def async_setup_auth(
 
     hass.data[STORAGE_KEY] = refresh_token.id
 
+    access_tokens = _VerifiedTokenCache(hass)
+    signatures = _VerifiedTokenCache(hass)
+
+    @callback
+    def _async_user_removed(event: Event) -> None:
+        """Remove the cached tokens of a removed user."""
+        access_tokens.async_remove_user(event.data["user_id"])
+        signatures.async_remove_user(event.data["user_id"])
+
+    hass.bus.async_listen(EVENT_USER_REMOVED, _async_user_removed)
+
     @callback
     def async_validate_auth_header(request: Request) -> bool:
         """Test authorization header against access token.
@@ -159,7 +280,7 @@ async def async_setup_auth(
         if auth_type != "Bearer":
             return False
 
-        refresh_token = hass.auth.async_validate_access_token(auth_val)
+        refresh_token = _async_validate_access_token(hass, access_tokens, auth_val)
 
         if refresh_token is None:
             return False
@@ -180,13 +301,11 @@ async def async_setup_auth(
         if (signature := request.query.get(SIGN_QUERY_PARAM)) is None:
             return False
 
-        try:
-            claims = jwt_wrapper.verify_and_decode(
-                signature, secret, algorithms=["HS256"], options={"verify_iss": False}
-            )
-        except jwt.InvalidTokenError:
+        if (verified := _async_verify_signature(signatures, signature, secret)) is None:
             return False
 
+        claims, refresh_token = verified
+
         if claims["path"] != request.path:
             return False
 
@@ -198,10 +317,15 @@ async def async_setup_auth(
         if claims["params"] != params:
             return False
 
-        refresh_token = hass.auth.async_get_refresh_token(claims["iss"])
-
         if refresh_token is None:
-            return False
+            refresh_token = hass.auth.async_get_refresh_token(claims["iss"])
+
+            if refresh_token is None:
+                return False
+
+            signatures.async_set(
+                signature, refresh_token, claims["exp"], (secret, claims)
+            )
 
         request[KEY_HASS_USER] = refresh_token.user
         request[KEY_HASS_REFRESH_TOKEN_ID] = refresh_token.id
@@ -3,21 +3,13 @@
 from __future__ import annotations
 
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
+from homeassistant.components.recorder.const import (  # noqa: F401
+    ALWAYS_CONTINUOUS_DOMAINS,
+    CONDITIONALLY_CONTINUOUS_DOMAINS,
+)
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
-from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.const import EVENT_CALL_SERVICE, EVENT_LOGBOOK_ENTRY
 
-#
-# Domains that are always continuous
-#
-# These are hard coded here to avoid importing
-# the entire counter and proximity integrations
-# to get the name of the domain.
-ALWAYS_CONTINUOUS_DOMAINS = {"counter", "proximity"}
-
-# Domains that are continuous if there is a UOM set on the entity
-CONDITIONALLY_CONTINUOUS_DOMAINS = {SENSOR_DOMAIN}
-
 ATTR_MESSAGE = "message"
 
 DOMAIN = "logbook"
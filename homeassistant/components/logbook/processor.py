@@ -179,6 +179,7 @@ class EventProcessor:
                 self.device_ids,
                 self.filters,
                 self.context_id,
+                instance.use_event_data_targets,
             )
             return self.humanify(
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
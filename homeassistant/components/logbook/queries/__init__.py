@@ -26,6 +26,7 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    use_event_data_targets: bool = True,
 ) -> StatementLambdaElement:
     """Generate the logbook statement for a logbook request."""
     start_day = start_day_dt.timestamp()
@@ -54,8 +55,11 @@ def statement_for_request(
             end_day,
             event_type_ids,
             states_metadata_ids or [],
+            entity_ids,
             [json_dumps(entity_id) for entity_id in entity_ids],
+            device_ids,
             [json_dumps(device_id) for device_id in device_ids],
+            use_event_data_targets,
         )
 
     # entities: logbook sends everything for the timeframe for the entities
@@ -65,7 +69,9 @@ def statement_for_request(
             end_day,
             event_type_ids,
             states_metadata_ids or [],
+            entity_ids,
             [json_dumps(entity_id) for entity_id in entity_ids],
+            use_event_data_targets,
         )
 
     # devices: logbook sends everything for the timeframe for the devices
@@ -74,5 +80,7 @@ def statement_for_request(
         start_day,
         end_day,
         event_type_ids,
+        device_ids,
         [json_dumps(device_id) for device_id in device_ids],
+        use_event_data_targets,
     )
@@ -201,7 +201,22 @@ def _missing_state_matcher() -> ColumnElement[bool]:
 
 
 def _not_continuous_entity_matcher() -> ColumnElement[bool]:
-    """Match non continuous entities."""
+    """Match non continuous entities.
+
+    The recorder stores if an entity is continuous in the states_meta
+    table. Entities that have not been recorded since the flag was added
+    fall back to matching the entity_id and the attributes.
+    """
+    return sqlalchemy.or_(
+        StatesMeta.continuous.is_(False),
+        sqlalchemy.and_(
+            StatesMeta.continuous.is_(None), _legacy_not_continuous_entity_matcher()
+        ).self_group(),
+    )
+
+
+def _legacy_not_continuous_entity_matcher() -> ColumnElement[bool]:
+    """Match non continuous entities by their entity_id and attributes."""
     return sqlalchemy.or_(
         # First exclude domains that may be continuous
         _not_possible_continuous_domain_matcher(),
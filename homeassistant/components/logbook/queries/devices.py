@@ -6,13 +6,14 @@ from collections.abc import Iterable
 
 import sqlalchemy
 from sqlalchemy import lambda_stmt, select
-from sqlalchemy.sql.elements import BooleanClauseList
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import CTE, CompoundSelect, Select
 
 from homeassistant.components.recorder.db_schema import (
     DEVICE_ID_IN_EVENT,
     EventData,
+    EventDataTargets,
     Events,
     EventTypes,
     States,
@@ -33,12 +34,18 @@ def _select_device_id_context_ids_sub_query(
     start_day: float,
     end_day: float,
     event_type_ids: tuple[int, ...],
-    json_quotable_device_ids: list[str],
+    device_ids: list[str],
+    json_quoted_device_ids: list[str],
+    use_event_data_targets: bool,
 ) -> Select:
     """Generate a subquery to find context ids for multiple devices."""
     inner = (
         select_events_context_id_subquery(start_day, end_day, event_type_ids)
-        .where(apply_event_device_id_matchers(json_quotable_device_ids))
+        .where(
+            apply_event_device_id_matchers(
+                device_ids, json_quoted_device_ids, use_event_data_targets
+            )
+        )
         .subquery()
     )
     return select(inner.c.context_id_bin).group_by(inner.c.context_id_bin)
@@ -49,14 +56,18 @@ def _apply_devices_context_union(
     start_day: float,
     end_day: float,
     event_type_ids: tuple[int, ...],
-    json_quotable_device_ids: list[str],
+    device_ids: list[str],
+    json_quoted_device_ids: list[str],
+    use_event_data_targets: bool,
 ) -> CompoundSelect:
     """Generate a CTE to find the device context ids and a query to find linked row."""
     devices_cte: CTE = _select_device_id_context_ids_sub_query(
         start_day,
         end_day,
         event_type_ids,
-        json_quotable_device_ids,
+        device_ids,
+        json_quoted_device_ids,
+        use_event_data_targets,
     ).cte()
     return sel.union_all(
         apply_events_context_hints(
@@ -79,26 +90,45 @@ def devices_stmt(
     start_day: float,
     end_day: float,
     event_type_ids: tuple[int, ...],
-    json_quotable_device_ids: list[str],
+    device_ids: list[str],
+    json_quoted_device_ids: list[str],
+    use_event_data_targets: bool,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple devices."""
     return lambda_stmt(
         lambda: _apply_devices_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
-                apply_event_device_id_matchers(json_quotable_device_ids)
+                apply_event_device_id_matchers(
+                    device_ids, json_quoted_device_ids, use_event_data_targets
+                )
             ),
             start_day,
             end_day,
             event_type_ids,
-            json_quotable_device_ids,
-        ).order_by(Events.time_fired_ts)
+            device_ids,
+            json_quoted_device_ids,
+            use_event_data_targets,
+        ).order_by(Events.time_fired_ts),
+        track_on=[use_event_data_targets],
     )
 
 
 def apply_event_device_id_matchers(
-    json_quotable_device_ids: Iterable[str],
-) -> BooleanClauseList:
-    """Create matchers for the device_ids in the event_data."""
-    return DEVICE_ID_IN_EVENT.is_not(None) & sqlalchemy.cast(
-        DEVICE_ID_IN_EVENT, sqlalchemy.Text()
-    ).in_(json_quotable_device_ids)
+    device_ids: Iterable[str],
+    json_quoted_device_ids: Iterable[str],
+    use_event_data_targets: bool,
+) -> ColumnElement[bool]:
+    """Create matchers for the device_ids in the event_data.
+
+    Until the recorder has extracted the targets of the existing
+    event data, the device_id is matched in the event_data json.
+    """
+    if not use_event_data_targets:
+        return DEVICE_ID_IN_EVENT.is_not(None) & sqlalchemy.cast(
+            DEVICE_ID_IN_EVENT, sqlalchemy.Text()
+        ).in_(json_quoted_device_ids)
+    return Events.data_id.in_(
+        select(EventDataTargets.data_id).where(
+            EventDataTargets.device_id.in_(device_ids)
+        )
+    )
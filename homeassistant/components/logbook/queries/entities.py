@@ -15,6 +15,7 @@ from homeassistant.components.recorder.db_schema import (
     METADATA_ID_LAST_UPDATED_INDEX_TS,
     OLD_ENTITY_ID_IN_EVENT,
     EventData,
+    EventDataTargets,
     Events,
     EventTypes,
     States,
@@ -38,12 +39,16 @@ def _select_entities_context_ids_sub_query(
     end_day: float,
     event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
+    entity_ids: list[str],
     json_quoted_entity_ids: list[str],
+    use_event_data_targets: bool,
 ) -> Select:
     """Generate a subquery to find context ids for multiple entities."""
     union = union_all(
         select_events_context_id_subquery(start_day, end_day, event_type_ids).where(
-            apply_event_entity_id_matchers(json_quoted_entity_ids)
+            apply_event_entity_id_matchers(
+                entity_ids, json_quoted_entity_ids, use_event_data_targets
+            )
         ),
         apply_entities_hints(select(States.context_id_bin))
         .filter(
@@ -60,7 +65,9 @@ def _apply_entities_context_union(
     end_day: float,
     event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
+    entity_ids: list[str],
     json_quoted_entity_ids: list[str],
+    use_event_data_targets: bool,
 ) -> CompoundSelect:
     """Generate a CTE to find the entity and device context ids and a query to find linked row."""
     entities_cte: CTE = _select_entities_context_ids_sub_query(
@@ -68,7 +75,9 @@ def _apply_entities_context_union(
         end_day,
         event_type_ids,
         states_metadata_ids,
+        entity_ids,
         json_quoted_entity_ids,
+        use_event_data_targets,
     ).cte()
     # We used to optimize this to exclude rows we already in the union with
     # a StatesMeta.metadata_ids.not_in(states_metadata_ids) but that made the
@@ -98,20 +107,27 @@ def entities_stmt(
     end_day: float,
     event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
+    entity_ids: list[str],
     json_quoted_entity_ids: list[str],
+    use_event_data_targets: bool,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
     return lambda_stmt(
         lambda: _apply_entities_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
-                apply_event_entity_id_matchers(json_quoted_entity_ids)
+                apply_event_entity_id_matchers(
+                    entity_ids, json_quoted_entity_ids, use_event_data_targets
+                )
             ),
             start_day,
             end_day,
             event_type_ids,
             states_metadata_ids,
+            entity_ids,
             json_quoted_entity_ids,
-        ).order_by(Events.time_fired_ts)
+            use_event_data_targets,
+        ).order_by(Events.time_fired_ts),
+        track_on=[use_event_data_targets],
     )
 
 
@@ -125,14 +141,30 @@ def states_select_for_entity_ids(
 
 
 def apply_event_entity_id_matchers(
+    entity_ids: Iterable[str],
     json_quoted_entity_ids: Iterable[str],
+    use_event_data_targets: bool,
 ) -> ColumnElement[bool]:
-    """Create matchers for the entity_id in the event_data."""
+    """Create matchers for the entity_id in the event_data.
+
+    Until the recorder has extracted the targets of the existing
+    event data, the entity_id is matched in the event_data json.
+    Events recorded before the event_data table was added have the
+    entity_id in the legacy event_data column.
+    """
+    event_data_matcher: ColumnElement[bool]
+    if use_event_data_targets:
+        event_data_matcher = Events.data_id.in_(
+            select(EventDataTargets.data_id).where(
+                EventDataTargets.entity_id.in_(entity_ids)
+            )
+        )
+    else:
+        event_data_matcher = ENTITY_ID_IN_EVENT.is_not(None) & sqlalchemy.cast(
+            ENTITY_ID_IN_EVENT, sqlalchemy.Text()
+        ).in_(json_quoted_entity_ids)
     return sqlalchemy.or_(
-        ENTITY_ID_IN_EVENT.is_not(None)
-        & sqlalchemy.cast(ENTITY_ID_IN_EVENT, sqlalchemy.Text()).in_(
-            json_quoted_entity_ids
-        ),
+        event_data_matcher,
         OLD_ENTITY_ID_IN_EVENT.is_not(None)
         & sqlalchemy.cast(OLD_ENTITY_ID_IN_EVENT, sqlalchemy.Text()).in_(
             json_quoted_entity_ids
@@ -38,14 +38,21 @@ def _select_entities_device_id_context_ids_sub_query(
     end_day: float,
     event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
+    entity_ids: list[str],
     json_quoted_entity_ids: list[str],
+    device_ids: list[str],
     json_quoted_device_ids: list[str],
+    use_event_data_targets: bool,
 ) -> Select:
     """Generate a subquery to find context ids for multiple entities and multiple devices."""
     union = union_all(
         select_events_context_id_subquery(start_day, end_day, event_type_ids).where(
             _apply_event_entity_id_device_id_matchers(
-                json_quoted_entity_ids, json_quoted_device_ids
+                entity_ids,
+                json_quoted_entity_ids,
+                device_ids,
+                json_quoted_device_ids,
+                use_event_data_targets,
             )
         ),
         apply_entities_hints(select(States.context_id_bin))
@@ -63,16 +70,22 @@ def _apply_entities_devices_context_union(
     end_day: float,
     event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
+    entity_ids: list[str],
     json_quoted_entity_ids: list[str],
+    device_ids: list[str],
     json_quoted_device_ids: list[str],
+    use_event_data_targets: bool,
 ) -> CompoundSelect:
     devices_entities_cte: CTE = _select_entities_device_id_context_ids_sub_query(
         start_day,
         end_day,
         event_type_ids,
         states_metadata_ids,
+        entity_ids,
         json_quoted_entity_ids,
+        device_ids,
         json_quoted_device_ids,
+        use_event_data_targets,
     ).cte()
     # We used to optimize this to exclude rows we already in the union with
     # a States.metadata_id.not_in(states_metadata_ids) but that made the
@@ -106,31 +119,48 @@ def entities_devices_stmt(
     end_day: float,
     event_type_ids: tuple[int, ...],
     states_metadata_ids: Collection[int],
+    entity_ids: list[str],
     json_quoted_entity_ids: list[str],
+    device_ids: list[str],
     json_quoted_device_ids: list[str],
+    use_event_data_targets: bool,
 ) -> StatementLambdaElement:
     """Generate a logbook query for multiple entities."""
     return lambda_stmt(
         lambda: _apply_entities_devices_context_union(
             select_events_without_states(start_day, end_day, event_type_ids).where(
                 _apply_event_entity_id_device_id_matchers(
-                    json_quoted_entity_ids, json_quoted_device_ids
+                    entity_ids,
+                    json_quoted_entity_ids,
+                    device_ids,
+                    json_quoted_device_ids,
+                    use_event_data_targets,
                 )
             ),
             start_day,
             end_day,
             event_type_ids,
             states_metadata_ids,
+            entity_ids,
             json_quoted_entity_ids,
+            device_ids,
             json_quoted_device_ids,
-        ).order_by(Events.time_fired_ts)
+            use_event_data_targets,
+        ).order_by(Events.time_fired_ts),
+        track_on=[use_event_data_targets],
     )
 
 
 def _apply_event_entity_id_device_id_matchers(
-    json_quoted_entity_ids: Iterable[str], json_quoted_device_ids: Iterable[str]
+    entity_ids: Iterable[str],
+    json_quoted_entity_ids: Iterable[str],
+    device_ids: Iterable[str],
+    json_quoted_device_ids: Iterable[str],
+    use_event_data_targets: bool,
 ) -> ColumnElement[bool]:
     """Create matchers for the device_id and entity_id in the event_data."""
     return apply_event_entity_id_matchers(
-        json_quoted_entity_ids
-    ) | apply_event_device_id_matchers(json_quoted_device_ids)
+        entity_ids, json_quoted_entity_ids, use_event_data_targets
+    ) | apply_event_device_id_matchers(
+        device_ids, json_quoted_device_ids, use_event_data_targets
+    )
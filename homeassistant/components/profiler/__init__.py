@@ -17,16 +17,24 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import (
+    DEFAULT_STALL_THRESHOLD,
+    SIGNAL_LOOP_MONITOR_UPDATE,
+    LoopMonitor,
+)
+from .sampler import DEFAULT_SAMPLE_INTERVAL, StackSampler
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -40,6 +48,11 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_SAMPLER = "start_sampler"
+SERVICE_STOP_SAMPLER = "stop_sampler"
+SERVICE_DUMP_SAMPLER = "dump_sampler"
+SERVICE_START_LOOP_MONITOR = "start_loop_monitor"
+SERVICE_STOP_LOOP_MONITOR = "stop_loop_monitor"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -50,6 +63,7 @@ _KNOWN_LRU_CLASSES = (
     "StatesMetaManager",
     "StateAttributesManager",
     "StatisticsMetaManager",
+    "TargetResolutionCache",
 )
 
 SERVICES = (
@@ -63,8 +77,15 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_SAMPLER,
+    SERVICE_STOP_SAMPLER,
+    SERVICE_DUMP_SAMPLER,
+    SERVICE_START_LOOP_MONITOR,
+    SERVICE_STOP_LOOP_MONITOR,
 )
 
+PLATFORMS = [Platform.SENSOR]
+
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
@@ -72,8 +93,11 @@ DEFAULT_MAX_OBJECTS = 5
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_INTERVAL = "interval"
+CONF_STALL_THRESHOLD = "stall_threshold"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+SAMPLER = "sampler"
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -273,6 +297,69 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    async def _async_start_sampler(call: ServiceCall) -> None:
+        """Start the sampling profiler."""
+        sampler: StackSampler | None = domain_data.get(SAMPLER)
+        if sampler is not None and sampler.running:
+            raise HomeAssistantError("Sampler already running")
+
+        sampler = domain_data[SAMPLER] = StackSampler(
+            hass.loop_thread_id, call.data[CONF_INTERVAL]
+        )
+        sampler.start()
+
+    async def _async_stop_sampler(call: ServiceCall) -> None:
+        """Stop the sampling profiler and keep its samples."""
+        sampler: StackSampler | None = domain_data.get(SAMPLER)
+        if sampler is None or not sampler.running:
+            raise HomeAssistantError("Sampler not running")
+
+        await hass.async_add_executor_job(sampler.stop)
+
+    async def _async_dump_sampler(call: ServiceCall) -> None:
+        """Write the samples as speedscope and collapsed stack files."""
+        if (sampler := domain_data.get(SAMPLER)) is None:
+            raise HomeAssistantError("Sampler not started")
+
+        start_time = int(time.time() * 1000000)
+        speedscope_path = hass.config.path(f"sampler.{start_time}.speedscope.json")
+        collapsed_path = hass.config.path(f"sampler.{start_time}.collapsed")
+        await hass.async_add_executor_job(
+            _write_sampler, sampler, start_time, speedscope_path, collapsed_path
+        )
+        persistent_notification.async_create(
+            hass,
+            (
+                f"Wrote speedscope data to {speedscope_path} and collapsed stacks to"
+                f" {collapsed_path}"
+            ),
+            title="Sampler dump completed",
+            notification_id=f"sampler_{start_time}",
+        )
+
+    @callback
+    def _async_start_loop_monitor(call: ServiceCall) -> None:
+        """Start instrumenting the event loop."""
+        monitor: LoopMonitor | None = domain_data.get(LOOP_MONITOR)
+        if monitor is not None and monitor.running:
+            raise HomeAssistantError("Event loop monitor already running")
+
+        monitor = domain_data[LOOP_MONITOR] = LoopMonitor(
+            hass, call.data[CONF_STALL_THRESHOLD]
+        )
+        monitor.async_start()
+        async_dispatcher_send(hass, SIGNAL_LOOP_MONITOR_UPDATE)
+
+    @callback
+    def _async_stop_loop_monitor(call: ServiceCall) -> None:
+        """Stop instrumenting the event loop."""
+        monitor: LoopMonitor | None = domain_data.get(LOOP_MONITOR)
+        if monitor is None or not monitor.running:
+            raise HomeAssistantError("Event loop monitor not running")
+
+        monitor.async_stop()
+        async_dispatcher_send(hass, SIGNAL_LOOP_MONITOR_UPDATE)
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,15 +469,117 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_SAMPLER,
+        _async_start_sampler,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_INTERVAL, default=DEFAULT_SAMPLE_INTERVAL): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.001, max=1)
+                )
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_SAMPLER,
+        _async_stop_sampler,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_SAMPLER,
+        _async_dump_sampler,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_LOOP_MONITOR,
+        _async_start_loop_monitor,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_STALL_THRESHOLD, default=DEFAULT_STALL_THRESHOLD
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.001, max=60))
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_LOOP_MONITOR,
+        _async_stop_loop_monitor,
+    )
+
+    websocket_api.async_register_command(hass, websocket_sampler_report)
+    websocket_api.async_register_command(hass, websocket_subscribe_loop_monitor)
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/sampler"})
+@websocket_api.async_response
+async def websocket_sampler_report(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the flamegraph and integration attribution of the sampler."""
+    if (sampler := hass.data.get(DOMAIN, {}).get(SAMPLER)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Sampler not started"
+        )
+        return
+
+    report = await hass.async_add_executor_job(sampler.get_report)
+    connection.send_result(msg["id"], report)
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "profiler/loop_monitor/subscribe"}
+)
+@callback
+def websocket_subscribe_loop_monitor(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to the reports and stalls of the event loop monitor."""
+    monitor: LoopMonitor | None = hass.data.get(DOMAIN, {}).get(LOOP_MONITOR)
+    if monitor is None or not monitor.running:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Event loop monitor not running"
+        )
+        return
+
+    @callback
+    def _async_forward(message: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], message))
+
+    connection.subscriptions[msg["id"]] = monitor.async_subscribe(_async_forward)
+    connection.send_result(msg["id"])
+    _async_forward({"type": "report", "report": monitor.async_get_report()})
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    if (sampler := hass.data[DOMAIN].get(SAMPLER)) is not None:
+        await hass.async_add_executor_job(sampler.stop)
+    if (monitor := hass.data[DOMAIN].get(LOOP_MONITOR)) is not None:
+        monitor.async_stop()
     hass.data.pop(DOMAIN)
     return True
 
@@ -478,6 +667,18 @@ def _write_memory_profile(heap, heap_path):
     heap.byrcs.dump(heap_path)
 
 
+def _write_sampler(
+    sampler: StackSampler,
+    start_time: int,
+    speedscope_path: str,
+    collapsed_path: str,
+) -> None:
+    with open(speedscope_path, "wb") as file:
+        file.write(json_bytes(sampler.get_speedscope(f"Sampler {start_time}")))
+    with open(collapsed_path, "w", encoding="utf-8") as file:
+        file.write(sampler.get_collapsed())
+
+
 def _log_objects(*_):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -0,0 +1,295 @@
+"""Event loop lag and callback latency instrumentation."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+import logging
+import time
+from types import CodeType
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .sampler import INTEGRATION_OTHER, get_integration_from_path
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STALL_THRESHOLD = 0.1
+HEARTBEAT_INTERVAL = 1
+REPORT_INTERVAL = 10
+MAX_STALLS = 50
+TOP_ENTRIES = 20
+
+# Upper bounds of the histogram buckets in seconds
+HISTOGRAM_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+SIGNAL_LOOP_MONITOR_UPDATE = "profiler_loop_monitor_update"
+
+type LoopMonitorListener = Callable[[dict[str, Any]], None]
+
+
+class Histogram:
+    """Histogram of durations."""
+
+    __slots__ = ("buckets", "count", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record a duration."""
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(duration, self.max)
+
+    def percentile(self, percentile: int) -> float:
+        """Return the upper bound of the bucket of a percentile."""
+        rank = self.count * percentile / 100
+        seen = 0
+        for bound, count in zip(HISTOGRAM_BUCKETS, self.buckets, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": dict(
+                zip((*map(str, HISTOGRAM_BUCKETS), "+Inf"), self.buckets, strict=True)
+            ),
+        }
+
+
+def _get_code(target: Any) -> CodeType | None:
+    """Return the code object run by a callback."""
+    while isinstance(target, partial):
+        target = target.func
+    if isinstance(task := getattr(target, "__self__", None), asyncio.Task):
+        # The callback runs a step of a task
+        return getattr(task.get_coro(), "cr_code", None)
+    return getattr(target, "__code__", None)
+
+
+class LoopMonitor:
+    """Record how long the event loop runs callbacks, jobs and event listeners.
+
+    The monitor wraps asyncio.Handle._run and HomeAssistant.async_run_hass_job
+    while it is running and restores them when stopped, so there is no
+    overhead when it is not running.
+    """
+
+    def __init__(self, hass: HomeAssistant, stall_threshold: float) -> None:
+        """Initialize the monitor."""
+        self.hass = hass
+        self.stall_threshold = stall_threshold
+        self.jobs: dict[str, Histogram] = {}
+        self.events: dict[str, Histogram] = {}
+        self.integrations: dict[str, Histogram] = {}
+        self.lag = Histogram()
+        self.stalls: deque[dict[str, Any]] = deque(maxlen=MAX_STALLS)
+        self.stall_count = 0
+        self.utilization = 0.0
+        self.max_lag = 0.0
+        self._interval_busy = 0.0
+        self._interval_max_lag = 0.0
+        self._interval_start = 0.0
+        self._listeners: set[LoopMonitorListener] = set()
+        self._descriptions: dict[CodeType, tuple[str, str]] = {}
+        self._original_handle_run: Callable[[asyncio.Handle], None] | None = None
+        self._heartbeat: asyncio.TimerHandle | None = None
+        self._report: asyncio.TimerHandle | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return if the monitor is running."""
+        return self._original_handle_run is not None
+
+    @callback
+    def async_start(self) -> None:
+        """Start instrumenting the event loop."""
+        hass = self.hass
+        loop = hass.loop
+        original_handle_run = self._original_handle_run = getattr(
+            asyncio.Handle, "_run"
+        )
+        original_run_hass_job = hass.async_run_hass_job
+        record_handle = self._record_handle
+        perf_counter = time.perf_counter
+
+        def _run(handle: asyncio.Handle) -> None:
+            if getattr(handle, "_loop") is not loop:
+                original_handle_run(handle)
+                return
+            start = perf_counter()
+            try:
+                original_handle_run(handle)
+            finally:
+                record_handle(handle, perf_counter() - start)
+
+        def async_run_hass_job(
+            hassjob: HassJob, *args: Any, background: bool = False
+        ) -> asyncio.Future[Any] | None:
+            start = perf_counter()
+            try:
+                return original_run_hass_job(hassjob, *args, background=background)
+            finally:
+                self._record_job(hassjob, args, perf_counter() - start)
+
+        setattr(asyncio.Handle, "_run", _run)
+        hass.async_run_hass_job = async_run_hass_job  # type: ignore[method-assign]
+        self._interval_start = perf_counter()
+        self._async_schedule_heartbeat()
+        self._report = loop.call_later(REPORT_INTERVAL, self._async_report)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop instrumenting the event loop."""
+        if self._original_handle_run is None:
+            return
+        setattr(asyncio.Handle, "_run", self._original_handle_run)
+        self._original_handle_run = None
+        # Remove the instance attribute to use the method of the class again
+        del self.hass.async_run_hass_job
+        for timer in (self._heartbeat, self._report):
+            if timer is not None:
+                timer.cancel()
+        self._heartbeat = self._report = None
+        self._listeners.clear()
+
+    @callback
+    def async_subscribe(self, listener: LoopMonitorListener) -> CALLBACK_TYPE:
+        """Subscribe to the periodic reports and to the stalls."""
+        self._listeners.add(listener)
+        return partial(self._listeners.discard, listener)
+
+    def _describe(self, target: Any) -> tuple[str, str]:
+        """Return the name and the integration of a callback."""
+        if (code := _get_code(target)) is None:
+            return (
+                getattr(target, "__qualname__", type(target).__qualname__),
+                INTEGRATION_OTHER,
+            )
+        if (description := self._descriptions.get(code)) is None:
+            description = self._descriptions[code] = (
+                code.co_qualname,
+                get_integration_from_path(code.co_filename) or INTEGRATION_OTHER,
+            )
+        return description
+
+    def _record_handle(self, handle: asyncio.Handle, duration: float) -> None:
+        """Record the duration of a callback run by the event loop."""
+        self._interval_busy += duration
+        name, integration = self._describe(getattr(handle, "_callback"))
+        _record(self.integrations, integration, duration)
+        if duration < self.stall_threshold:
+            return
+        self.stall_count += 1
+        stall = {
+            "time": time.time(),
+            "duration": duration,
+            "callback": name,
+            "integration": integration,
+        }
+        self.stalls.append(stall)
+        _LOGGER.warning(
+            "Event loop blocked for %.3fs by %s (%s)", duration, name, integration
+        )
+        self._async_notify({"type": "stall", "stall": stall})
+
+    def _record_job(
+        self, hassjob: HassJob, args: tuple[Any, ...], duration: float
+    ) -> None:
+        """Record the duration of a HassJob and of the event it handled."""
+        target_name = self._describe(hassjob.target)[0]
+        _record(
+            self.jobs,
+            f"{hassjob.name}: {target_name}" if hassjob.name else target_name,
+            duration,
+        )
+        if len(args) == 1 and isinstance(event := args[0], Event):
+            _record(self.events, str(event.event_type), duration)
+
+    @callback
+    def _async_schedule_heartbeat(self) -> None:
+        """Schedule the next heartbeat measuring the event loop lag."""
+        loop = self.hass.loop
+        expected = loop.time() + HEARTBEAT_INTERVAL
+        self._heartbeat = loop.call_at(expected, self._async_heartbeat, expected)
+
+    @callback
+    def _async_heartbeat(self, expected: float) -> None:
+        """Record how late the heartbeat was run."""
+        lag = max(0.0, self.hass.loop.time() - expected)
+        self.lag.record(lag)
+        self._interval_max_lag = max(lag, self._interval_max_lag)
+        self._async_schedule_heartbeat()
+
+    @callback
+    def _async_report(self) -> None:
+        """Update the sensors and send a report to the subscribers."""
+        now = time.perf_counter()
+        if elapsed := now - self._interval_start:
+            self.utilization = min(100.0, self._interval_busy / elapsed * 100)
+        self.max_lag = self._interval_max_lag
+        self._interval_start = now
+        self._interval_busy = self._interval_max_lag = 0.0
+        self._report = self.hass.loop.call_later(REPORT_INTERVAL, self._async_report)
+        async_dispatcher_send(self.hass, SIGNAL_LOOP_MONITOR_UPDATE)
+        if self._listeners:
+            self._async_notify({"type": "report", "report": self.async_get_report()})
+
+    @callback
+    def _async_notify(self, message: dict[str, Any]) -> None:
+        """Send a message to the subscribers."""
+        for listener in list(self._listeners):
+            listener(message)
+
+    @callback
+    def async_get_report(self) -> dict[str, Any]:
+        """Return the recorded durations, slowest first."""
+        return {
+            "running": self.running,
+            "stall_threshold": self.stall_threshold,
+            "utilization": self.utilization,
+            "max_lag": self.max_lag,
+            "lag": self.lag.as_dict(),
+            "stall_count": self.stall_count,
+            "stalls": list(self.stalls),
+            "jobs": _top(self.jobs),
+            "events": _top(self.events),
+            "integrations": _top(self.integrations),
+        }
+
+
+def _record(histograms: dict[str, Histogram], key: str, duration: float) -> None:
+    """Record a duration in the histogram of a key."""
+    if (histogram := histograms.get(key)) is None:
+        histogram = histograms[key] = Histogram()
+    histogram.record(duration)
+
+
+def _top(histograms: dict[str, Histogram]) -> dict[str, dict[str, Any]]:
+    """Return the histograms with the highest total duration."""
+    return {
+        key: histogram.as_dict()
+        for key, histogram in sorted(
+            histograms.items(), key=lambda item: item[1].total, reverse=True
+        )[:TOP_ENTRIES]
+    }
@@ -0,0 +1,279 @@
+"""Statistical stack sampler for the event loop and executor threads."""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from functools import lru_cache
+import os
+import re
+import sys
+import threading
+import time
+from types import CodeType, FrameType
+from typing import Any
+
+THREAD_EVENT_LOOP = "event_loop"
+THREAD_EXECUTOR = "executor"
+
+EXECUTOR_THREAD_PREFIX = "SyncWorker"
+
+DEFAULT_SAMPLE_INTERVAL = 0.01
+WINDOW_SECONDS = 60
+MAX_WINDOWS = 10
+MAX_STACK_DEPTH = 128
+MIN_FLAMEGRAPH_FRACTION = 0.001
+
+INTEGRATION_CORE = "homeassistant"
+INTEGRATION_OTHER = "other"
+
+_INTEGRATION_PATH = re.compile(
+    r"[/\\](?:homeassistant[/\\]components|custom_components)[/\\]([^/\\]+)"
+)
+_CORE_PATH = re.compile(r"[/\\]homeassistant[/\\]")
+
+# Leaf frames of threads waiting for work, which are not counted as samples
+_IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("thread.py", "_worker"),
+    ("threading.py", "wait"),
+}
+
+type Stack = tuple[CodeType, ...]
+
+
+class StackSampler:
+    """Periodically sample the stacks of the event loop and executor threads.
+
+    Samples are aggregated in windows of WINDOW_SECONDS seconds and only the
+    last MAX_WINDOWS windows are kept, so the sampler can run continuously.
+    """
+
+    def __init__(
+        self, loop_thread_id: int, interval: float = DEFAULT_SAMPLE_INTERVAL
+    ) -> None:
+        """Initialize the sampler."""
+        self.interval = interval
+        self._loop_thread_id = loop_thread_id
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._windows: deque[Counter[tuple[str, Stack]]] = deque(maxlen=MAX_WINDOWS)
+        self._window_start = 0.0
+        self._labels: dict[CodeType, str] = {}
+        self._executor_threads: set[int] = set()
+        self._threads_refreshed = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Return if the sampler is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ProfilerSampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampling thread to exit."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Take samples until stopped."""
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def _refresh_executor_threads(self, now: float) -> None:
+        """Refresh the idents of the executor threads once per second."""
+        if now - self._threads_refreshed < 1:
+            return
+        self._threads_refreshed = now
+        self._executor_threads = {
+            thread.ident
+            for thread in threading.enumerate()
+            if thread.ident is not None
+            and thread.name.startswith(EXECUTOR_THREAD_PREFIX)
+        }
+
+    def sample(self) -> None:
+        """Take a sample of the stacks of the threads."""
+        now = time.monotonic()
+        self._refresh_executor_threads(now)
+        frames = sys._current_frames()  # noqa: SLF001
+        samples: list[tuple[str, Stack]] = []
+        try:
+            for ident, frame in frames.items():
+                if ident == self._loop_thread_id:
+                    thread_type = THREAD_EVENT_LOOP
+                elif ident in self._executor_threads:
+                    thread_type = THREAD_EXECUTOR
+                else:
+                    continue
+                if stack := _get_stack(frame):
+                    samples.append((thread_type, stack))
+        finally:
+            # Break reference cycles with the frames
+            del frames
+
+        with self._lock:
+            if not self._windows or now - self._window_start >= WINDOW_SECONDS:
+                self._windows.append(Counter())
+                self._window_start = now
+            self._windows[-1].update(samples)
+
+    def _get_samples(self) -> Counter[tuple[str, Stack]]:
+        """Return the samples of all windows."""
+        samples: Counter[tuple[str, Stack]] = Counter()
+        with self._lock:
+            for window in self._windows:
+                samples.update(window)
+        return samples
+
+    def _get_label(self, code: CodeType) -> str:
+        """Return the label of a frame in the flamegraph."""
+        if (label := self._labels.get(code)) is None:
+            label = self._labels[code] = (
+                f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})"
+            )
+        return label
+
+    def _get_integration(self, stack: Stack) -> str:
+        """Return the integration a sample is attributed to.
+
+        The innermost frame of an integration wins, so time spent in a library
+        is attributed to the integration calling it.
+        """
+        in_core = False
+        for code in reversed(stack):
+            integration = get_integration_from_path(code.co_filename)
+            if integration == INTEGRATION_CORE:
+                in_core = True
+            elif integration is not None:
+                return integration
+        return INTEGRATION_CORE if in_core else INTEGRATION_OTHER
+
+    def get_report(self) -> dict[str, Any]:
+        """Return the aggregated samples with a flamegraph."""
+        samples = self._get_samples()
+        total = samples.total()
+        threads: Counter[str] = Counter()
+        integrations: Counter[str] = Counter()
+        root: dict[str, Any] = {"name": "all", "value": total, "children": {}}
+        min_value = total * MIN_FLAMEGRAPH_FRACTION
+        for (thread_type, stack), count in samples.items():
+            threads[thread_type] += count
+            integrations[self._get_integration(stack)] += count
+            node = root
+            for name in (thread_type, *map(self._get_label, stack)):
+                children = node["children"]
+                if (child := children.get(name)) is None:
+                    child = children[name] = {"name": name, "value": 0, "children": {}}
+                child["value"] += count
+                node = child
+
+        def _prune(node: dict[str, Any]) -> dict[str, Any]:
+            return {
+                "name": node["name"],
+                "value": node["value"],
+                "children": [
+                    _prune(child)
+                    for child in sorted(
+                        node["children"].values(),
+                        key=lambda child: child["value"],
+                        reverse=True,
+                    )
+                    if child["value"] >= min_value
+                ],
+            }
+
+        return {
+            "running": self.running,
+            "interval": self.interval,
+            "samples": total,
+            "threads": dict(threads),
+            "integrations": dict(integrations.most_common()),
+            "flamegraph": _prune(root),
+        }
+
+    def get_collapsed(self) -> str:
+        """Return the samples in the collapsed stack format."""
+        return "".join(
+            f"{';'.join((thread_type, *map(self._get_label, stack)))} {count}\n"
+            for (thread_type, stack), count in self._get_samples().items()
+        )
+
+    def get_speedscope(self, name: str) -> dict[str, Any]:
+        """Return the samples in the speedscope file format."""
+        frames: list[dict[str, Any]] = []
+        frame_index: dict[CodeType, int] = {}
+        profiles: dict[str, dict[str, Any]] = {}
+        for (thread_type, stack), count in self._get_samples().items():
+            if (profile := profiles.get(thread_type)) is None:
+                profile = profiles[thread_type] = {
+                    "type": "sampled",
+                    "name": thread_type,
+                    "unit": "none",
+                    "startValue": 0,
+                    "endValue": 0,
+                    "samples": [],
+                    "weights": [],
+                }
+            indexes: list[int] = []
+            for code in stack:
+                if (index := frame_index.get(code)) is None:
+                    index = frame_index[code] = len(frames)
+                    frames.append(
+                        {
+                            "name": code.co_qualname,
+                            "file": code.co_filename,
+                            "line": code.co_firstlineno,
+                        }
+                    )
+                indexes.append(index)
+            profile["samples"].append(indexes)
+            profile["weights"].append(count)
+            profile["endValue"] += count
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "Home Assistant profiler",
+            "shared": {"frames": frames},
+            "profiles": list(profiles.values()),
+        }
+
+
+@lru_cache(maxsize=4096)
+def get_integration_from_path(filename: str) -> str | None:
+    """Return the integration of a module path.
+
+    Returns INTEGRATION_CORE for the other modules of Home Assistant and None
+    for modules outside of Home Assistant.
+    """
+    if match := _INTEGRATION_PATH.search(filename):
+        return match.group(1)
+    if _CORE_PATH.search(filename):
+        return INTEGRATION_CORE
+    return None
+
+
+def _get_stack(frame: FrameType | None) -> Stack | None:
+    """Return the code objects of a stack from the root to the leaf.
+
+    Returns None if the thread is waiting for work.
+    """
+    if frame is None:
+        return None
+    code = frame.f_code
+    if (os.path.basename(code.co_filename), code.co_name) in _IDLE_FRAMES:
+        return None
+    stack: list[CodeType] = []
+    while frame is not None and len(stack) < MAX_STACK_DEPTH:
+        stack.append(frame.f_code)
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
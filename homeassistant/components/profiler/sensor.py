@@ -0,0 +1,112 @@
+"""Sensors of the event loop monitor of the profiler."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, LOOP_MONITOR
+from .loop_monitor import SIGNAL_LOOP_MONITOR_UPDATE, LoopMonitor
+
+
+@dataclass(frozen=True, kw_only=True)
+class LoopMonitorSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor of the event loop monitor."""
+
+    value_fn: Callable[[LoopMonitor], float | int]
+
+
+SENSORS: tuple[LoopMonitorSensorEntityDescription, ...] = (
+    LoopMonitorSensorEntityDescription(
+        key="event_loop_lag",
+        translation_key="event_loop_lag",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda monitor: monitor.max_lag * 1000,
+    ),
+    LoopMonitorSensorEntityDescription(
+        key="event_loop_utilization",
+        translation_key="event_loop_utilization",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda monitor: monitor.utilization,
+    ),
+    LoopMonitorSensorEntityDescription(
+        key="event_loop_stalls",
+        translation_key="event_loop_stalls",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda monitor: monitor.stall_count,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensors of the event loop monitor."""
+    async_add_entities(LoopMonitorSensor(entry, description) for description in SENSORS)
+
+
+class LoopMonitorSensor(SensorEntity):
+    """Sensor of the event loop monitor.
+
+    The sensor is unavailable while the monitor is not running.
+    """
+
+    entity_description: LoopMonitorSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self, entry: ConfigEntry, description: LoopMonitorSensorEntityDescription
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+
+    async def async_added_to_hass(self) -> None:
+        """Update the sensor with the reports of the monitor."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_LOOP_MONITOR_UPDATE, self.async_write_ha_state
+            )
+        )
+
+    @callback
+    def _get_monitor(self) -> LoopMonitor | None:
+        """Return the monitor if it is running."""
+        monitor: LoopMonitor | None = self.hass.data[DOMAIN].get(LOOP_MONITOR)
+        if monitor is None or not monitor.running:
+            return None
+        return monitor
+
+    @property
+    def available(self) -> bool:
+        """Return if the monitor is running."""
+        return self._get_monitor() is not None
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the value of the sensor."""
+        if (monitor := self._get_monitor()) is None:
+            return None
+        return self.entity_description.value_fn(monitor)
@@ -51,12 +51,14 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_DB_READ_POOL_SIZE = 4
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
+CONF_DB_READ_POOL_SIZE = "db_read_pool_size"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
@@ -110,6 +112,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_RETRY_WAIT, default=DEFAULT_DB_RETRY_WAIT
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_DB_READ_POOL_SIZE, default=DEFAULT_DB_READ_POOL_SIZE
+                    ): cv.positive_int,
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
@@ -142,6 +147,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    db_read_pool_size = conf[CONF_DB_READ_POOL_SIZE]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -161,6 +167,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
+        db_read_pool_size=db_read_pool_size,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
     )
@@ -1,11 +1,19 @@
 """Backup platform for the Recorder integration."""
 
+from collections.abc import Callable
 from logging import getLogger
+from pathlib import Path
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
-from .util import async_migration_in_progress, get_instance
+from .const import SQLITE_URL_PREFIX
+from .util import (
+    async_migration_in_progress,
+    backup_sqlite_database,
+    dburl_to_path,
+    get_instance,
+)
 
 _LOGGER = getLogger(__name__)
 
@@ -25,3 +33,39 @@ async def async_post_backup(hass: HomeAssistant) -> None:
     _LOGGER.info("Backup end notification, releasing write lock")
     if not instance.unlock_database():
         raise HomeAssistantError("Could not release database write lock")
+
+
+async def async_snapshot_backup(
+    hass: HomeAssistant,
+    snapshot_dir: Path,
+    progress_callback: Callable[[float], None],
+) -> dict[str, Path | None]:
+    """Copy the database for a backup while the recorder keeps writing to it."""
+    instance = get_instance(hass)
+    if async_migration_in_progress(hass):
+        raise HomeAssistantError("Database migration in progress")
+    if not instance.db_url.startswith(SQLITE_URL_PREFIX) or not (
+        db_file := dburl_to_path(instance.db_url)
+    ):
+        # The database is not a file in the configuration directory
+        return {}
+    db_path = Path(db_file)
+    config_dir = Path(hass.config.path())
+    if not db_path.is_relative_to(config_dir):
+        return {}
+
+    def _progress(progress: float) -> None:
+        hass.loop.call_soon_threadsafe(progress_callback, progress)
+
+    snapshot_path = snapshot_dir / db_path.name
+    _LOGGER.info("Backup start notification, copying database")
+    await instance.async_add_executor_job(
+        backup_sqlite_database, db_file, str(snapshot_path), _progress
+    )
+    name = db_path.relative_to(config_dir).as_posix()
+    return {
+        name: snapshot_path,
+        # The snapshot contains the changes in the write-ahead log
+        f"{name}-wal": None,
+        f"{name}-shm": None,
+    }
@@ -45,9 +45,19 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READER_PREFIX = "DbReader"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
+# Domains of entities that are always continuous
+#
+# These are hard coded here to avoid importing
+# the integrations to get the name of the domain.
+ALWAYS_CONTINUOUS_DOMAINS = {"counter", "proximity"}
+
+# Domains of entities that are continuous if there is a UOM set on the entity
+CONDITIONALLY_CONTINUOUS_DOMAINS = {"sensor"}
+
 ATTR_KEEP_DAYS = "keep_days"
 ATTR_REPACK = "repack"
 ATTR_APPLY_FILTER = "apply_filter"
@@ -58,6 +68,7 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+EVENT_DATA_TARGETS_SCHEMA_VERSION = 50
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
@@ -26,6 +26,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    EVENT_CORE_CONFIG_UPDATE,
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_STATE_CHANGED,
@@ -51,6 +52,7 @@ from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
 from .const import (
+    DB_READER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -69,6 +71,7 @@ from .db_schema import (
     SCHEMA_VERSION,
     Base,
     EventData,
+    EventDataTargets,
     Events,
     EventTypes,
     StateAttributes,
@@ -80,6 +83,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .migration import (
     EntityIDMigration,
+    EventDataTargetsMigration,
     EventIDPostMigration,
     EventsContextIDMigration,
     EventTypeIDMigration,
@@ -101,6 +105,7 @@ from .tasks import (
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
     CommitTask,
+    CompileMissingCalendarStatisticsTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
     ImportStatisticsTask,
@@ -120,6 +125,7 @@ from .util import (
     build_mysqldb_conv,
     dburl_to_path,
     end_incomplete_runs,
+    execute_on_connection,
     execute_stmt_lambda_element,
     is_second_sunday,
     move_away_broken_database,
@@ -171,6 +177,7 @@ class Recorder(threading.Thread):
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        db_read_pool_size: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
     ) -> None:
@@ -190,6 +197,7 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_read_pool_size = db_read_pool_size
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -227,8 +235,10 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.use_event_data_targets = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -236,6 +246,7 @@ class Recorder(threading.Thread):
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
+        self._core_config_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
         self.enabled = True
 
@@ -284,13 +295,19 @@ class Recorder(threading.Thread):
 
     @callback
     def async_start_executor(self) -> None:
-        """Start the executor."""
+        """Start the executors."""
         self._db_executor = DBInterruptibleThreadPoolExecutor(
             self.recorder_and_worker_thread_ids,
             thread_name_prefix=DB_WORKER_PREFIX,
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+            self.recorder_and_worker_thread_ids,
+            thread_name_prefix=DB_READER_PREFIX,
+            max_workers=self.db_read_pool_size,
+            shutdown_hook=self._shutdown_pool,
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -365,6 +382,18 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a read only executor job from within the event loop.
+
+        Read only jobs, like history, logbook and statistics queries, run in
+        a separate pool so they do not queue behind each other or behind the
+        other jobs of the database executor.
+        """
+        return self.hass.loop.run_in_executor(self._db_read_executor, target, *args)
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -427,6 +456,9 @@ class Recorder(threading.Thread):
         if self._periodic_listener:
             self._periodic_listener()
             self._periodic_listener = None
+        if self._core_config_listener:
+            self._core_config_listener()
+            self._core_config_listener = None
 
     async def _async_close(self, event: Event) -> None:
         """Empty the queue if its still present at close."""
@@ -662,6 +694,17 @@ class Recorder(threading.Thread):
             self.hass, self._async_five_minute_tasks, minute=range(0, 60, 5), second=10
         )
 
+        # Rebuild daily and monthly statistics when the time zone changes
+        self._core_config_listener = self.hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated
+        )
+
+    @callback
+    def _async_core_config_updated(self, event: Event) -> None:
+        """Rebuild calendar statistics if the time zone was changed."""
+        if "time_zone" in event.data:
+            self.queue_task(CompileMissingCalendarStatisticsTask())
+
     async def _async_wait_for_started(self) -> object | None:
         """Wait for the hass started future."""
         return await self._hass_started
@@ -812,6 +855,7 @@ class Recorder(threading.Thread):
                 EventTypeIDMigration,
                 EntityIDMigration,
                 EventIDPostMigration,
+                EventDataTargetsMigration,
             ):
                 migrator = migrator_cls(schema_status.start_version, migration_changes)
                 migrator.do_migrate(self, session)
@@ -1076,6 +1120,13 @@ class Recorder(threading.Thread):
             event_data_manager.add_pending(dbevent_data)
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
+            # Oversized event data is stored as an empty dict shared by
+            # all events so it must not have the targets of this event
+            if shared_data != "{}" and (
+                dbevent_data_targets := EventDataTargets.from_event_data(event.data)
+            ):
+                dbevent_data_targets.event_data_rel = dbevent_data
+                self._add_to_session(session, dbevent_data_targets)
 
         self._add_to_session(session, dbevent)
 
@@ -1135,6 +1186,11 @@ class Recorder(threading.Thread):
             self._add_to_session(session, states_meta)
             dbstate.states_meta_rel = states_meta
 
+        if new_state := event.data["new_state"]:
+            states_meta_manager.update_continuous(
+                entity_id, dbstate.metadata_id, new_state
+            )
+
         # Map the event data to the StateAttributes table
         shared_attrs = shared_attrs_bytes.decode("utf-8")
         dbstate.attributes = None
@@ -1223,6 +1279,15 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if pending_continuous := self.states_meta_manager.get_pending_continuous():
+            with session.no_autoflush:
+                session.execute(
+                    update(StatesMeta),
+                    [
+                        {"metadata_id": metadata_id, "continuous": continuous}
+                        for metadata_id, continuous in pending_continuous.items()
+                    ],
+                )
         session.commit()
 
         self._event_session_has_pending_writes = False
@@ -1376,6 +1441,12 @@ class Recorder(threading.Thread):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
+        if self._using_file_sqlite and threading.current_thread().name.startswith(
+            DB_READER_PREFIX
+        ):
+            # Connections of the RecorderPool are bound to their thread,
+            # so the connections of the readers can be made read only.
+            execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
 
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
@@ -1389,6 +1460,7 @@ class Recorder(threading.Thread):
             kwargs["pool_reset_on_return"] = None
         elif self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
+            kwargs["pool_size"] = POOL_SIZE + self.db_read_pool_size
             kwargs["recorder_and_worker_thread_ids"] = (
                 self.recorder_and_worker_thread_ids
             )
@@ -1413,6 +1485,9 @@ class Recorder(threading.Thread):
         # Disable extended logging for non SQLite databases
         if not self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["echo"] = False
+            # Keep a connection for each reader in addition to the
+            # connections of the recorder thread and the db executor
+            kwargs["pool_size"] = POOL_SIZE + self.db_read_pool_size
 
         if self._using_file_sqlite:
             validate_or_move_away_sqlite_database(self.db_url)
@@ -1446,6 +1521,7 @@ class Recorder(threading.Thread):
     def _schedule_compile_missing_statistics(self) -> None:
         """Add tasks for missing statistics runs."""
         self.queue_task(CompileMissingStatisticsTask())
+        self.queue_task(CompileMissingCalendarStatisticsTask())
 
     def _end_session(self) -> None:
         """End the recorder session."""
@@ -1479,13 +1555,18 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
-                # We shutdown the executor without forcefully
+            executors = [
+                executor
+                for executor in (self._db_executor, self._db_read_executor)
+                if executor
+            ]
+            for executor in executors:
+                # We shutdown the executors without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta
 import logging
 import time
@@ -38,6 +38,8 @@ from sqlalchemy.types import TypeDecorator
 from homeassistant.components.sensor import ATTR_STATE_CLASS
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
+    ATTR_DEVICE_ID,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_UNIT_OF_MEASUREMENT,
     MATCH_ALL,
@@ -77,12 +79,13 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 47
+SCHEMA_VERSION = 50
 
 _LOGGER = logging.getLogger(__name__)
 
 TABLE_EVENTS = "events"
 TABLE_EVENT_DATA = "event_data"
+TABLE_EVENT_DATA_TARGETS = "event_data_targets"
 TABLE_EVENT_TYPES = "event_types"
 TABLE_STATES = "states"
 TABLE_STATE_ATTRIBUTES = "state_attributes"
@@ -93,6 +96,9 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAY = "statistics_day"
+TABLE_STATISTICS_MONTH = "statistics_month"
+TABLE_STATISTICS_CALENDAR_RUNS = "statistics_calendar_runs"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -107,6 +113,7 @@ ALL_TABLES = [
     TABLE_STATE_ATTRIBUTES,
     TABLE_EVENTS,
     TABLE_EVENT_DATA,
+    TABLE_EVENT_DATA_TARGETS,
     TABLE_EVENT_TYPES,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
@@ -116,6 +123,9 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAY,
+    TABLE_STATISTICS_MONTH,
+    TABLE_STATISTICS_CALENDAR_RUNS,
 ]
 
 TABLES_TO_CHECK = [
@@ -405,6 +415,55 @@ class EventData(Base):
             return {}
 
 
+class EventDataTargets(Base):
+    """Entity and device ids of event data.
+
+    The ids are extracted from the event data when it is recorded so the
+    logbook can find the events of entities and devices with an index
+    instead of parsing the json of the event data.
+    """
+
+    __table_args__ = (_DEFAULT_TABLE_ARGS,)
+    __tablename__ = TABLE_EVENT_DATA_TARGETS
+    data_id: Mapped[int] = mapped_column(
+        ID_TYPE,
+        ForeignKey(f"{TABLE_EVENT_DATA}.data_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    entity_id: Mapped[str | None] = mapped_column(
+        String(MAX_LENGTH_STATE_ENTITY_ID), index=True
+    )
+    device_id: Mapped[str | None] = mapped_column(
+        String(MAX_LENGTH_STATE_ENTITY_ID), index=True
+    )
+    event_data_rel: Mapped[EventData | None] = relationship("EventData")
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.EventDataTargets("
+            f"id={self.data_id}, entity_id='{self.entity_id}', "
+            f"device_id='{self.device_id}'"
+            ")>"
+        )
+
+    @staticmethod
+    def from_event_data(data: Mapping[str, Any]) -> EventDataTargets | None:
+        """Create an object from event data, None if it has no targets."""
+        entity_id = _target_id(data.get(ATTR_ENTITY_ID))
+        device_id = _target_id(data.get(ATTR_DEVICE_ID))
+        if entity_id is None and device_id is None:
+            return None
+        return EventDataTargets(entity_id=entity_id, device_id=device_id)
+
+
+def _target_id(value: Any) -> str | None:
+    """Return an entity or device id of event data if it can be stored."""
+    if type(value) is str and len(value) <= MAX_LENGTH_STATE_ENTITY_ID:
+        return value
+    return None
+
+
 class EventTypes(Base):
     """Event type history."""
 
@@ -658,6 +717,9 @@ class StatesMeta(Base):
     entity_id: Mapped[str | None] = mapped_column(
         String(MAX_LENGTH_STATE_ENTITY_ID), index=True, unique=True
     )
+    # If the entity is continuous as of its last recorded state, None if the
+    # entity has not been recorded since the column was added
+    continuous: Mapped[bool | None] = mapped_column(Boolean, index=True)
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -789,6 +851,44 @@ class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     )
 
 
+class StatisticsDay(Base, StatisticsBase):
+    """Long term statistics summarized per local calendar day."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_day_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_DAY
+
+
+class StatisticsMonth(Base, StatisticsBase):
+    """Long term statistics summarized per local calendar month."""
+
+    # Nominal duration only, the real end of a row is the start of the next
+    # calendar month in the configured time zone.
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_month_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_MONTH
+
+
 class _StatisticsMeta:
     """Statistics meta data."""
 
@@ -903,6 +1003,34 @@ class StatisticsRuns(Base):
         )
 
 
+class StatisticsCalendarRuns(Base):
+    """Representation of a compiled calendar (day or month) statistics period."""
+
+    __tablename__ = TABLE_STATISTICS_CALENDAR_RUNS
+    __table_args__ = (
+        Index(
+            "ix_statistics_calendar_runs_period_start_ts",
+            "period",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+
+    run_id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    period: Mapped[str] = mapped_column(String(8))
+    start_ts: Mapped[float] = mapped_column(TIMESTAMP_TYPE)
+    time_zone: Mapped[str] = mapped_column(String(64))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StatisticsCalendarRuns(id={self.run_id},"
+            f" period='{self.period}', start_ts={self.start_ts},"
+            f" time_zone='{self.time_zone}')>"
+        )
+
+
 EVENT_DATA_JSON = type_coerce(
     EventData.shared_data.cast(JSONB_VARIANT_CAST), JSONLiteral(none_as_null=True)
 )
@@ -13,6 +13,7 @@ from homeassistant.helpers.recorder import get_instance
 from ..filters import Filters
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
+    get_downsampled_states as _modern_get_downsampled_states,
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
@@ -24,6 +25,7 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "get_downsampled_states",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
@@ -32,6 +34,46 @@ __all__ = [
 ]
 
 
+def get_downsampled_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    bucket_seconds: float,
+    include_start_time_state: bool = True,
+    no_attributes: bool = False,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return a dict of the states during a time period, downsampled to buckets."""
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        # The legacy schema is only used until the migration is done,
+        # so the states are not downsampled in the meantime.
+        return _legacy_get_significant_states(  # type: ignore[return-value]
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            True,
+            True,
+            no_attributes,
+            True,
+        )
+    return _modern_get_downsampled_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        bucket_seconds,
+        include_start_time_state,
+        no_attributes,
+    )
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -10,24 +10,30 @@ from typing import Any, cast
 
 from sqlalchemy import (
     CompoundSelect,
+    Float,
+    Integer,
     Select,
     Subquery,
     and_,
+    case,
+    cast as sql_cast,
     func,
     lambda_stmt,
     literal,
     select,
+    type_coerce,
     union_all,
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
 from homeassistant.helpers.recorder import get_instance
 import homeassistant.util.dt as dt_util
 
-from ..const import LAST_REPORTED_SCHEMA_VERSION
+from ..const import LAST_REPORTED_SCHEMA_VERSION, SupportedDialect
 from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
 from ..filters import Filters
 from ..models import (
@@ -39,6 +45,8 @@ from ..models import (
 )
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
+    DOWNSAMPLED_MAX_KEY,
+    DOWNSAMPLED_MIN_KEY,
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
@@ -286,6 +294,184 @@ def get_significant_states_with_session(
     )
 
 
+# The states which can be cast to a number without raising on PostgreSQL
+_NUMERIC_STATE_PATTERN = r"^[-+]?([0-9]+[.]?[0-9]*|[.][0-9]+)([eE][-+]?[0-9]{1,2})?$"
+
+
+def _numeric_state(dialect_name: SupportedDialect | None) -> ColumnElement:
+    """Return the state as a number, or NULL if it is not a number."""
+    if dialect_name == SupportedDialect.SQLITE:
+        # SQLite casts any text to a number, only rows which contain
+        # a digit are cast so other text is not taken as 0
+        return case((States.state.op("GLOB")("*[0-9]*"), sql_cast(States.state, Float)))
+    is_numeric = States.state.regexp_match(_NUMERIC_STATE_PATTERN)
+    if dialect_name == SupportedDialect.POSTGRESQL:
+        return case((is_numeric, sql_cast(States.state, Float)))
+    # MySQL and MariaDB can't CAST to a floating point type,
+    # adding 0 converts the text to a number instead
+    return case((is_numeric, type_coerce(States.state, Float) + 0))
+
+
+def _bucket_index(
+    start_time_ts: float, bucket_seconds: float, dialect_name: SupportedDialect | None
+) -> ColumnElement:
+    """Return the index of the bucket of the state in the period."""
+    offset = (States.last_updated_ts - start_time_ts) / bucket_seconds
+    if dialect_name == SupportedDialect.SQLITE:
+        # FLOOR is only available when SQLite is built with the math
+        # functions, the offset is positive so casting truncates it down
+        return sql_cast(offset, Integer)
+    # PostgreSQL and MySQL round when casting to an integer
+    return func.floor(offset)
+
+
+def _downsampled_states_stmt(
+    start_time_ts: float,
+    end_time_ts: float,
+    bucket_seconds: float,
+    metadata_ids: list[int],
+    dialect_name: SupportedDialect | None,
+) -> Select:
+    """Return the min, max and last state of each bucket of the period."""
+    numeric_state = _numeric_state(dialect_name)
+    buckets = (
+        select(
+            States.metadata_id.label("bucket_metadata_id"),
+            func.max(States.last_updated_ts).label("bucket_last_updated_ts"),
+            func.min(numeric_state).label("bucket_min"),
+            func.max(numeric_state).label("bucket_max"),
+        )
+        .filter(
+            States.metadata_id.in_(metadata_ids)
+            & (States.last_updated_ts > start_time_ts)
+            & (States.last_updated_ts < end_time_ts)
+        )
+        .group_by(
+            States.metadata_id,
+            _bucket_index(start_time_ts, bucket_seconds, dialect_name),
+        )
+        .subquery()
+    )
+    return (
+        select(
+            States.metadata_id,
+            States.state,
+            States.last_updated_ts,
+            buckets.c.bucket_min,
+            buckets.c.bucket_max,
+        )
+        .join(
+            buckets,
+            and_(
+                States.metadata_id == buckets.c.bucket_metadata_id,
+                States.last_updated_ts == buckets.c.bucket_last_updated_ts,
+            ),
+        )
+        .order_by(States.metadata_id, States.last_updated_ts)
+    )
+
+
+def get_downsampled_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    bucket_seconds: float,
+    include_start_time_state: bool = True,
+    no_attributes: bool = False,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the states during a period, downsampled to buckets.
+
+    The period is split into buckets of bucket_seconds and each bucket is
+    reduced to its last state with the minimum and maximum of the numeric
+    states in the bucket. The states are returned in the compressed state
+    format, and only the state at the start time has attributes.
+
+    The buckets are computed in SQL with GROUP BY.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        instance = get_instance(hass)
+        if not (
+            entity_id_to_metadata_id := instance.states_meta_manager.get_many(
+                entity_ids, session, False
+            )
+        ) or not (metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
+            return {}
+        metadata_id_to_entity_id = {
+            v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+        }
+        result: dict[str, list[dict[str, Any]]] = {
+            entity_id: [] for entity_id in entity_ids
+        }
+        start_time_ts = dt_util.utc_to_timestamp(start_time)
+        end_time_ts = dt_util.utc_to_timestamp(end_time or dt_util.utcnow())
+
+        if include_start_time_state and (
+            run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
+        ):
+            single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+            start_stmt = lambda_stmt(
+                lambda: _get_start_time_state_stmt(
+                    run_start_ts,
+                    start_time_ts,
+                    single_metadata_id,
+                    metadata_ids,
+                    no_attributes,
+                    False,
+                ),
+                track_on=[bool(single_metadata_id), no_attributes],
+            )
+            attr_cache: dict[str, dict[str, Any]] = {}
+            for row in execute_stmt_lambda_element(
+                session, start_stmt, None, end_time, orm_rows=False
+            ):
+                entity_id = metadata_id_to_entity_id[row.metadata_id]
+                result[entity_id].append(
+                    row_to_compressed_state(
+                        row,
+                        attr_cache,
+                        start_time_ts,
+                        entity_id,
+                        row.state,
+                        None,
+                        no_attributes,
+                    )
+                )
+
+        dialect_name = instance.dialect_name
+        stmt = lambda_stmt(
+            lambda: _downsampled_states_stmt(
+                start_time_ts, end_time_ts, bucket_seconds, metadata_ids, dialect_name
+            ),
+            track_on=[dialect_name],
+        )
+        prev_bucket: tuple[int, float] | None = None
+        for (
+            metadata_id,
+            state,
+            last_updated_ts,
+            min_value,
+            max_value,
+        ) in execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False):
+            # Rows which were recorded at the same time end the same bucket
+            if prev_bucket == (bucket := (metadata_id, last_updated_ts)):
+                continue
+            prev_bucket = bucket
+            comp_state: dict[str, Any] = {
+                COMPRESSED_STATE_STATE: state,
+                COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+            }
+            if min_value is not None:
+                comp_state[DOWNSAMPLED_MIN_KEY] = min_value
+                comp_state[DOWNSAMPLED_MAX_KEY] = max_value
+            result[metadata_id_to_entity_id[metadata_id]].append(comp_state)
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -30,6 +30,7 @@ from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util.enum import try_parse_enum
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.ulid import ulid_at_time, ulid_to_bytes
 
 from .auto_repairs.events.schema import (
@@ -50,6 +51,7 @@ from .auto_repairs.statistics.schema import (
 )
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
+    EVENT_DATA_TARGETS_SCHEMA_VERSION,
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
@@ -67,6 +69,7 @@ from .db_schema import (
     STATISTICS_TABLES,
     TABLE_STATES,
     Base,
+    EventDataTargets,
     Events,
     EventTypes,
     LegacyBase,
@@ -86,12 +89,14 @@ from .queries import (
     delete_duplicate_short_term_statistics_row,
     delete_duplicate_statistics_row,
     find_entity_ids_to_migrate,
+    find_event_data_to_extract_targets,
     find_event_type_to_migrate,
     find_events_context_ids_to_migrate,
     find_states_context_ids_to_migrate,
     find_unmigrated_short_term_statistics_rows,
     find_unmigrated_statistics_rows,
     has_entity_ids_to_migrate,
+    has_event_data_to_extract_targets,
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
@@ -1758,6 +1763,32 @@ class _SchemaVersion47Migrator(_SchemaVersionMigrator, target_version=47):
         )
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The statistics_day, statistics_month and statistics_calendar_runs tables
+        # are created by Base.metadata.create_all. They are populated from the
+        # hourly statistics by CompileMissingCalendarStatisticsTask in the
+        # background once the recorder is running.
+
+
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The column is left NULL for existing rows, it is set by the
+        # recorder the next time the state of the entity is recorded
+        _add_columns(self.session_maker, "states_meta", ["continuous BOOLEAN"])
+        _create_index(self.session_maker, "states_meta", "ix_states_meta_continuous")
+
+
+class _SchemaVersion50Migrator(_SchemaVersionMigrator, target_version=50):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The event_data_targets table and its indexes are created by
+        # Base.metadata.create_all, the targets of the existing event data
+        # are extracted by EventDataTargetsMigration
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2631,6 +2662,71 @@ class EventIDPostMigration(BaseRunTimeMigration):
         return DataMigrationStatus(needs_migrate=False, migration_done=True)
 
 
+class EventDataTargetsMigration(BaseRunTimeMigrationWithQuery):
+    """Migration to extract the entity and device ids of event data."""
+
+    required_schema_version = EVENT_DATA_TARGETS_SCHEMA_VERSION
+    migration_id = "event_data_targets_migration"
+    task = CommitBeforeMigrationTask
+    # We have to commit before to make sure the event data
+    # and targets the recorder is adding live are not
+    # extracted a second time
+
+    def __init__(self, schema_version: int, migration_changes: dict[str, int]) -> None:
+        """Initialize a new EventDataTargetsMigration."""
+        super().__init__(schema_version, migration_changes)
+        # Event data without targets is not changed by the migration
+        # so the last processed data_id is needed to make progress
+        self._last_data_id = 0
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Extract the targets of some event data, return True if completed."""
+        _LOGGER.debug("Extracting event data targets")
+        with session_scope(session=instance.get_session()) as session:
+            if rows := session.execute(
+                find_event_data_to_extract_targets(
+                    self._last_data_id, instance.max_bind_vars
+                )
+            ).all():
+                db_targets: list[EventDataTargets] = []
+                for data_id, shared_data in rows:
+                    # Avoid decoding the event data without any target
+                    if not shared_data or (
+                        '"entity_id":' not in shared_data
+                        and '"device_id":' not in shared_data
+                    ):
+                        continue
+                    try:
+                        data = json_loads(shared_data)
+                    except JSON_DECODE_EXCEPTIONS:
+                        continue
+                    if isinstance(data, dict) and (
+                        targets := EventDataTargets.from_event_data(data)
+                    ):
+                        targets.data_id = data_id
+                        db_targets.append(targets)
+                session.add_all(db_targets)
+                self._last_data_id = rows[-1][0]
+
+            is_done = not rows
+
+        _LOGGER.debug(
+            "Extracting event data targets up to data_id %s done=%s",
+            self._last_data_id,
+            is_done,
+        )
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def migration_done(self, instance: Recorder, session: Session) -> None:
+        """Will be called after migrate returns True or if migration is not needed."""
+        _LOGGER.debug("Using event data targets as all event data is extracted")
+        instance.use_event_data_targets = True
+
+    def needs_migrate_query(self) -> StatementLambdaElement:
+        """Check if the data is migrated."""
+        return has_event_data_to_extract_targets()
+
+
 class EntityIDPostMigration(BaseRunTimeMigrationWithQuery):
     """Migration to remove old entity_id strings from states."""
 
@@ -11,6 +11,7 @@ from sqlalchemy.sql.selectable import Select
 
 from .db_schema import (
     EventData,
+    EventDataTargets,
     Events,
     EventTypes,
     MigrationChanges,
@@ -726,6 +727,30 @@ def find_event_type_to_migrate(max_bind_vars: int) -> StatementLambdaElement:
     )
 
 
+def has_event_data_to_extract_targets() -> StatementLambdaElement:
+    """Check if there is event data without extracted targets."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .outerjoin(EventDataTargets, EventData.data_id == EventDataTargets.data_id)
+        .filter(EventDataTargets.data_id.is_(None))
+        .limit(1)
+    )
+
+
+def find_event_data_to_extract_targets(
+    last_data_id: int, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find event data after a data_id without extracted targets."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id, EventData.shared_data)
+        .outerjoin(EventDataTargets, EventData.data_id == EventDataTargets.data_id)
+        .filter(EventData.data_id > last_data_id)
+        .filter(EventDataTargets.data_id.is_(None))
+        .order_by(EventData.data_id)
+        .limit(max_bind_vars)
+    )
+
+
 def find_entity_ids_to_migrate(max_bind_vars: int) -> StatementLambdaElement:
     """Find entity_id to migrate."""
     return lambda_stmt(
@@ -60,6 +60,9 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsCalendarRuns,
+    StatisticsDay,
+    StatisticsMonth,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -157,6 +160,17 @@ UNIT_CLASSES = {
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
+CALENDAR_STATISTICS_TABLES: dict[
+    Literal["day", "month"], type[StatisticsDay | StatisticsMonth]
+] = {
+    "day": StatisticsDay,
+    "month": StatisticsMonth,
+}
+
+# Maximum number of calendar periods compiled per period type in one go,
+# the backfill of a large database is split in several recorder tasks
+CALENDAR_STATISTICS_COMPILE_BATCH_SIZE = 31
+
 
 def mean(values: list[float]) -> float | None:
     """Return the mean of the values.
@@ -445,6 +459,244 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
     )
 
 
+def _calendar_period_start_end_factory(
+    period: Literal["day", "month"],
+) -> Callable[[float], tuple[float, float]]:
+    """Return a function to find the start and end of a local calendar period."""
+    if period == "day":
+        return reduce_day_ts_factory()[1]
+    return reduce_month_ts_factory()[1]
+
+
+def _compile_calendar_statistics(
+    session: Session,
+    table: type[StatisticsDay | StatisticsMonth],
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_id: int | None = None,
+) -> None:
+    """Compile calendar statistics for one local day or month.
+
+    This will summarize hourly statistics for the period in the same way
+    _reduce_statistics does:
+    - average, min max is computed by a database query
+    - sum is taken from the last hourly entry during the period
+    """
+    mean_stmt = (
+        select(
+            Statistics.metadata_id,
+            func.avg(Statistics.mean),
+            func.min(Statistics.min),
+            func.max(Statistics.max),
+        )
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+    )
+    sum_stmt = (
+        select(
+            Statistics.metadata_id,
+            Statistics.last_reset_ts,
+            Statistics.state,
+            Statistics.sum,
+            func.row_number()
+            .over(
+                partition_by=Statistics.metadata_id,
+                order_by=Statistics.start_ts.desc(),
+            )
+            .label("rownum"),
+        )
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+    )
+    if metadata_id is not None:
+        mean_stmt = mean_stmt.filter(Statistics.metadata_id == metadata_id)
+        sum_stmt = sum_stmt.filter(Statistics.metadata_id == metadata_id)
+
+    summary: dict[int, StatisticDataTimestamp] = {}
+    for _metadata_id, _mean, _min, _max in session.execute(
+        mean_stmt.group_by(Statistics.metadata_id)
+    ):
+        summary[_metadata_id] = {
+            "start_ts": start_time_ts,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+
+    subquery = sum_stmt.subquery()
+    for _metadata_id, last_reset_ts, state, _sum, _ in session.execute(
+        select(subquery).filter(subquery.c.rownum == 1)
+    ):
+        summary[_metadata_id].update(
+            {
+                "last_reset_ts": last_reset_ts,
+                "state": state,
+                "sum": _sum,
+            }
+        )
+
+    session.add_all(
+        table.from_stats_ts(_metadata_id, summary_item)
+        for _metadata_id, summary_item in summary.items()
+    )
+
+
+def _get_calendar_statistics_coverage(
+    session: Session, period: Literal["day", "month"], time_zone: str
+) -> tuple[float, float] | None:
+    """Return the time range covered by compiled calendar statistics.
+
+    Calendar statistics compiled for another time zone are ignored.
+    """
+    first_start_ts, last_start_ts = session.execute(
+        select(
+            func.min(StatisticsCalendarRuns.start_ts),
+            func.max(StatisticsCalendarRuns.start_ts),
+        )
+        .filter(StatisticsCalendarRuns.period == period)
+        .filter(StatisticsCalendarRuns.time_zone == time_zone)
+    ).one()
+    if first_start_ts is None:
+        return None
+    period_start_end = _calendar_period_start_end_factory(period)
+    return first_start_ts, period_start_end(last_start_ts)[1]
+
+
+def _clear_calendar_statistics(session: Session) -> None:
+    """Delete all calendar statistics."""
+    for table in CALENDAR_STATISTICS_TABLES.values():
+        session.query(table).delete(synchronize_session=False)
+    session.query(StatisticsCalendarRuns).delete(synchronize_session=False)
+
+
+def _compile_missing_calendar_statistics(
+    instance: Recorder, session: Session, hourly_end_ts: float
+) -> bool:
+    """Compile calendar statistics for periods fully covered by hourly statistics.
+
+    Returns False if there are more periods to compile.
+    """
+    time_zone = instance.hass.config.time_zone
+    if session.execute(
+        select(StatisticsCalendarRuns.run_id)
+        .filter(StatisticsCalendarRuns.time_zone != time_zone)
+        .limit(1)
+    ).first():
+        _LOGGER.info("Time zone changed, rebuilding daily and monthly statistics")
+        _clear_calendar_statistics(session)
+
+    finished = True
+    for period, table in CALENDAR_STATISTICS_TABLES.items():
+        period_start_end = _calendar_period_start_end_factory(period)
+        if last_start_ts := session.execute(
+            select(func.max(StatisticsCalendarRuns.start_ts)).filter(
+                StatisticsCalendarRuns.period == period
+            )
+        ).scalar():
+            start_ts = period_start_end(last_start_ts)[1]
+        elif oldest_ts := session.execute(
+            select(func.min(Statistics.start_ts))
+        ).scalar():
+            start_ts = period_start_end(oldest_ts)[0]
+        else:
+            # No hourly statistics yet
+            continue
+
+        for _ in range(CALENDAR_STATISTICS_COMPILE_BATCH_SIZE):
+            end_ts = period_start_end(start_ts)[1]
+            if end_ts > hourly_end_ts:
+                break
+            _LOGGER.debug(
+                "Compiling %s statistics for %s-%s",
+                period,
+                dt_util.utc_from_timestamp(start_ts),
+                dt_util.utc_from_timestamp(end_ts),
+            )
+            _compile_calendar_statistics(session, table, start_ts, end_ts)
+            session.add(
+                StatisticsCalendarRuns(
+                    period=period, start_ts=start_ts, time_zone=time_zone
+                )
+            )
+            start_ts = end_ts
+        else:
+            finished = False
+
+    return finished
+
+
+def _recompile_calendar_statistics(
+    instance: Recorder,
+    session: Session,
+    metadata_id: int,
+    start_timestamps: Iterable[float],
+) -> None:
+    """Recompile compiled calendar periods after hourly statistics were modified."""
+    time_zone = instance.hass.config.time_zone
+    start_timestamps = set(start_timestamps)
+    for period, table in CALENDAR_STATISTICS_TABLES.items():
+        if not (
+            coverage := _get_calendar_statistics_coverage(session, period, time_zone)
+        ):
+            continue
+        covered_start_ts, covered_end_ts = coverage
+        period_start_end = _calendar_period_start_end_factory(period)
+        periods = {
+            period_start_end(start_ts)
+            for start_ts in start_timestamps
+            if start_ts < covered_end_ts
+        }
+        if not periods:
+            continue
+        # Statistics imported before the first compiled period extend the
+        # compiled range backwards, it must stay contiguous
+        start_ts = min(periods)[0]
+        while start_ts < covered_start_ts:
+            periods.add(period_start_end(start_ts))
+            start_ts = period_start_end(start_ts)[1]
+
+        for start_ts, end_ts in sorted(periods):
+            if start_ts < covered_start_ts:
+                _compile_calendar_statistics(session, table, start_ts, end_ts)
+                session.add(
+                    StatisticsCalendarRuns(
+                        period=period, start_ts=start_ts, time_zone=time_zone
+                    )
+                )
+                continue
+            session.query(table).filter(table.metadata_id == metadata_id).filter(
+                table.start_ts == start_ts
+            ).delete(synchronize_session=False)
+            _compile_calendar_statistics(session, table, start_ts, end_ts, metadata_id)
+
+
+def _get_hourly_statistics_end_ts(session: Session) -> float | None:
+    """Return the end of the newest compiled hourly statistics period."""
+    if not (last_run := session.query(func.max(StatisticsRuns.start)).scalar()):
+        return None
+    last_run_start: datetime = process_timestamp(last_run)
+    if last_run_start.minute == 55:
+        return (last_run_start + StatisticsShortTerm.duration).timestamp()
+    return last_run_start.replace(minute=0).timestamp()
+
+
+@retryable_database_job("compile missing calendar statistics")
+def compile_missing_calendar_statistics(instance: Recorder) -> bool:
+    """Compile missing daily and monthly statistics.
+
+    Returns False if there are more periods to compile.
+    """
+    with session_scope(
+        session=instance.get_session(),
+        exception_filter=filter_unique_constraint_integrity_error(
+            instance, "statistic"
+        ),
+    ) as session:
+        if (hourly_end_ts := _get_hourly_statistics_end_ts(session)) is None:
+            return True
+        return _compile_missing_calendar_statistics(instance, session, hourly_end_ts)
+
+
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
     """Compile missing statistics."""
@@ -601,6 +853,8 @@ def _compile_statistics(
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        # Summarize the local days and months completed by this hour
+        _compile_missing_calendar_statistics(instance, session, end.timestamp())
 
     session.add(StatisticsRuns(start=start))
 
@@ -1698,6 +1952,139 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _table_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    table: type[Statistics | StatisticsShortTerm],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return statistics from the hourly or 5-minute table, reduced to the period."""
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, table, types
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+
+    if not stats:
+        return {}
+
+    result = _sorted_statistics_to_dict(
+        hass,
+        stats,
+        statistic_ids,
+        metadata,
+        True,
+        table,
+        units,
+        types,
+    )
+
+    if period == "day":
+        result = _reduce_statistics_per_day(result, types)
+
+    if period == "week":
+        result = _reduce_statistics_per_week(result, types)
+
+    if period == "month":
+        result = _reduce_statistics_per_month(result, types)
+
+    return result
+
+
+def _calendar_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: Literal["day", "month"],
+    coverage: tuple[float, float],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return daily or monthly statistics.
+
+    Periods covered by the compiled calendar statistics are read from the
+    calendar table, periods outside of it are reduced from hourly statistics.
+    start_time and end_time must be aligned with the period.
+    """
+    covered_start = dt_util.utc_from_timestamp(coverage[0])
+    covered_end = dt_util.utc_from_timestamp(coverage[1])
+    results: list[dict[str, list[StatisticsRow]]] = []
+
+    if start_time < covered_start:
+        results.append(
+            _table_statistics_during_period(
+                hass,
+                session,
+                start_time,
+                covered_start if end_time is None else min(end_time, covered_start),
+                statistic_ids,
+                metadata,
+                metadata_ids,
+                period,
+                Statistics,
+                units,
+                types,
+            )
+        )
+
+    calendar_start = max(start_time, covered_start)
+    calendar_end = covered_end if end_time is None else min(end_time, covered_end)
+    if calendar_start < calendar_end:
+        table = CALENDAR_STATISTICS_TABLES[period]
+        stmt = _generate_statistics_during_period_stmt(
+            calendar_start, calendar_end, metadata_ids, table, types
+        )
+        if stats := cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        ):
+            calendar_result = _sorted_statistics_to_dict(
+                hass, stats, statistic_ids, metadata, True, table, units, types
+            )
+            # The length of days and months varies, the table duration is nominal
+            period_start_end = _calendar_period_start_end_factory(period)
+            for rows in calendar_result.values():
+                for row in rows:
+                    row["end"] = period_start_end(row["start"])[1]
+            results.append(calendar_result)
+
+    if end_time is None or end_time > covered_end:
+        results.append(
+            _table_statistics_during_period(
+                hass,
+                session,
+                max(start_time, covered_end),
+                end_time,
+                statistic_ids,
+                metadata,
+                metadata_ids,
+                period,
+                Statistics,
+                units,
+                types,
+            )
+        )
+
+    if len(results) == 1:
+        return results[0]
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    for partial_result in results:
+        for statistic_id, rows in partial_result.items():
+            result[statistic_id].extend(rows)
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1768,36 +2155,43 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    calendar_period = cast(Literal["day", "month"], period)
+    if period in CALENDAR_STATISTICS_TABLES and (
+        coverage := _get_calendar_statistics_coverage(
+            session, calendar_period, hass.config.time_zone
+        )
+    ):
+        result = _calendar_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            calendar_period,
+            coverage,
+            units,
+            types,
+        )
+    else:
+        result = _table_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period,
+            table,
+            units,
+            types,
+        )
 
-    if not stats:
+    if not result:
         return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
-
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
-
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
-
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
-
     if "change" in _types:
         _augment_result_with_change(
             hass, session, start_time, units, _types, table, metadata, result
@@ -2340,11 +2734,17 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    start_timestamps: set[float] = set()
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        start_timestamps.add(stat["start"].timestamp())
+
+    if table == Statistics:
+        _recompile_calendar_statistics(instance, session, metadata_id, start_timestamps)
+        return True
 
     if table != StatisticsShortTerm:
         return True
@@ -2476,6 +2876,22 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        # Adjust the calendar periods after the one containing start_time,
+        # the period containing start_time is recompiled from hourly statistics
+        start_time_ts = start_time.replace(minute=0).timestamp()
+        for period, table in CALENDAR_STATISTICS_TABLES.items():
+            period_start_end = _calendar_period_start_end_factory(period)
+            _adjust_sum_statistics(
+                session,
+                table,
+                metadata[statistic_id][0],
+                dt_util.utc_from_timestamp(period_start_end(start_time_ts)[1]),
+                sum_adjustment,
+            )
+        _recompile_calendar_statistics(
+            instance, session, metadata[statistic_id][0], (start_time_ts,)
+        )
+
     return True
 
 
@@ -2536,6 +2952,7 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            *CALENDAR_STATISTICS_TABLES.values(),
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
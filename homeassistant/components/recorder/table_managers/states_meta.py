@@ -5,11 +5,14 @@ from __future__ import annotations
 from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
-from homeassistant.core import Event, EventStateChangedData
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import Event, EventStateChangedData, State
 from homeassistant.util.collection import chunked_or_all
 
+from ..const import ALWAYS_CONTINUOUS_DOMAINS, CONDITIONALLY_CONTINUOUS_DOMAINS
 from ..db_schema import StatesMeta
 from ..queries import find_all_states_metadata_ids, find_states_metadata_ids
 from ..util import execute_stmt_lambda_element
@@ -29,6 +32,8 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the states meta manager."""
         self._did_first_load = False
+        self._continuous: LRU[str, bool] = LRU(CACHE_SIZE)
+        self._pending_continuous: dict[int, bool] = {}
         super().__init__(recorder, CACHE_SIZE)
 
     def load(
@@ -140,6 +145,59 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         for entity_id, db_states_meta in self._pending.items():
             self._id_map[entity_id] = db_states_meta.metadata_id
         self._pending.clear()
+        self._pending_continuous.clear()
+
+    def update_continuous(
+        self, entity_id: str, metadata_id: int | None, state: State
+    ) -> None:
+        """Update the continuous flag of an entity from its new state.
+
+        The flag is only written when it changes, either on the pending
+        StatesMeta or, for committed ones, with the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        domain = state.domain
+        continuous = domain in ALWAYS_CONTINUOUS_DOMAINS or (
+            domain in CONDITIONALLY_CONTINUOUS_DOMAINS
+            and ATTR_UNIT_OF_MEASUREMENT in state.attributes
+        )
+        if self._continuous.get(entity_id) is continuous:
+            return
+        self._continuous[entity_id] = continuous
+        if (db_states_meta := self._pending.get(entity_id)) is not None:
+            db_states_meta.continuous = continuous
+        elif metadata_id is not None:
+            self._pending_continuous[metadata_id] = continuous
+
+    def get_pending_continuous(self) -> dict[int, bool]:
+        """Return the continuous flags to update by metadata_id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_continuous
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the LRU cache size.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().adjust_lru_size(new_size)
+        if new_size > self._continuous.get_size():
+            self._continuous.set_size(new_size)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._continuous.clear()
+        self._pending_continuous.clear()
 
     def evict_purged(self, entity_ids: Iterable[str]) -> None:
         """Evict purged event_types from the cache when they are no longer used.
@@ -149,6 +207,7 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         """
         for entity_id in entity_ids:
             self._id_map.pop(entity_id, None)
+            self._continuous.pop(entity_id, None)
 
     def update_metadata(
         self,
@@ -165,4 +224,5 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
             {StatesMeta.entity_id: new_entity_id}
         )
         self._id_map.pop(entity_id, None)
+        self._continuous.pop(entity_id, None)
         return True
@@ -187,6 +187,18 @@ class CompileMissingStatisticsTask(RecorderTask):
         instance.queue_task(CompileMissingStatisticsTask())
 
 
+@dataclass(slots=True)
+class CompileMissingCalendarStatisticsTask(RecorderTask):
+    """An object to insert into the recorder queue to compile missing daily and monthly statistics."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task to compile missing daily and monthly statistics."""
+        if statistics.compile_missing_calendar_statistics(instance):
+            return
+        # Schedule a new statistics task if this one didn't finish
+        instance.queue_task(CompileMissingCalendarStatisticsTask())
+
+
 @dataclass(slots=True)
 class ImportStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an import statistics task."""
@@ -105,6 +105,9 @@ MIN_VERSION_SQLITE_MODERN_BIND_VARS = _simple_version("3.32.0")
 # should do a check on the sqlite3 database.
 MAX_RESTART_TIME = timedelta(minutes=10)
 
+# The number of pages copied in each step of an online backup
+SQLITE_BACKUP_PAGES = 1024
+
 # Retry when one of the following MySQL errors occurred:
 RETRYABLE_MYSQL_ERRORS = (1205, 1206, 1213)
 # 1205: Lock wait timeout exceeded; try restarting transaction
@@ -775,6 +778,33 @@ def write_lock_db_sqlite(instance: Recorder) -> Generator[None]:
             connection.execute(text("END;"))
 
 
+def backup_sqlite_database(
+    db_path: str, backup_path: str, progress_callback: Callable[[float], None]
+) -> None:
+    """Copy a consistent snapshot of a SQLite database while it is written to.
+
+    The read transaction keeps the snapshot of the source the same between
+    the steps of the backup, so the backup does not restart when the
+    recorder commits and the recorder does not have to stop writing.
+    """
+    import sqlite3  # pylint: disable=import-outside-toplevel
+
+    def _progress(status: int, remaining: int, total: int) -> None:
+        progress_callback((total - remaining) / total if total else 1.0)
+
+    with (
+        contextlib.closing(sqlite3.connect(db_path, isolation_level=None)) as source,
+        contextlib.closing(sqlite3.connect(backup_path)) as target,
+    ):
+        source.execute("BEGIN")
+        # The read transaction starts with the first read
+        source.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+        try:
+            source.backup(target, pages=SQLITE_BACKUP_PAGES, progress=_progress)
+        finally:
+            source.execute("END")
+
+
 def async_migration_in_progress(hass: HomeAssistant) -> bool:
     """Determine if a migration is in progress.
 
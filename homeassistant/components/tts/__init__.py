@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Mapping
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Mapping
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from functools import partial
 import hashlib
@@ -15,6 +17,7 @@ import os
 import re
 import subprocess
 import tempfile
+import time
 from typing import Any, Final, TypedDict, final
 
 from aiohttp import web
@@ -47,6 +50,7 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.network import get_url
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, ConfigType
 from homeassistant.util import dt as dt_util, language as language_util
 
@@ -57,13 +61,18 @@ from .const import (
     ATTR_OPTIONS,
     CONF_CACHE,
     CONF_CACHE_DIR,
+    CONF_CACHE_MAX_SIZE,
+    CONF_MEMORY_MAX_SIZE,
     CONF_TIME_MEMORY,
     DATA_COMPONENT,
     DATA_TTS_MANAGER,
     DEFAULT_CACHE,
     DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_MEMORY_MAX_SIZE,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
+    TtsAudioStreamType,
     TtsAudioType,
 )
 from .helper import get_engine_instance
@@ -74,6 +83,7 @@ from .models import Voice
 __all__ = [
     "async_default_engine",
     "async_get_media_source_audio",
+    "async_get_media_source_audio_stream",
     "async_support_options",
     "ATTR_AUDIO_OUTPUT",
     "ATTR_PREFERRED_FORMAT",
@@ -87,6 +97,7 @@ __all__ = [
     "PLATFORM_SCHEMA",
     "SampleFormat",
     "Provider",
+    "TtsAudioStreamType",
     "TtsAudioType",
     "Voice",
 ]
@@ -124,6 +135,61 @@ KEY_PATTERN = "{0}_{1}_{2}_{3}"
 
 SCHEMA_SERVICE_CLEAR_CACHE = vol.Schema({})
 
+STORAGE_KEY = f"{DOMAIN}.cache"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+
+class TTSAudioStream:
+    """Audio of a message which can be read while the engine produces it.
+
+    Every reader gets the chunks from the start, so the audio can be served
+    to several clients while it is stored in the caches.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stream."""
+        self._chunks: list[bytes] = []
+        self._closed = False
+        self._error: BaseException | None = None
+        self._updated = asyncio.Event()
+
+    @callback
+    def async_write(self, chunk: bytes) -> None:
+        """Add a chunk of audio to the stream."""
+        if chunk:
+            self._chunks.append(chunk)
+            self._async_notify()
+
+    @callback
+    def async_close(self, error: BaseException | None = None) -> None:
+        """Close the stream after the last chunk or an error."""
+        self._closed = True
+        self._error = error
+        self._async_notify()
+
+    @callback
+    def _async_notify(self) -> None:
+        """Wake up the readers waiting for the stream."""
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    async def async_iter(self) -> AsyncGenerator[bytes]:
+        """Yield the chunks of audio until the stream is closed."""
+        index = 0
+        while True:
+            if index < len(self._chunks):
+                index += 1
+                yield self._chunks[index - 1]
+                continue
+            if self._closed:
+                if self._error is not None:
+                    raise HomeAssistantError(
+                        f"Error while generating TTS audio: {self._error!r}"
+                    ) from self._error
+                return
+            await self._updated.wait()
+
 
 class TTSCache(TypedDict):
     """Cached TTS file."""
@@ -131,6 +197,33 @@ class TTSCache(TypedDict):
     filename: str
     voice: bytes
     pending: asyncio.Task | None
+    stream: TTSAudioStream | None
+
+
+class TTSCacheFile(TypedDict):
+    """TTS file in the cache directory."""
+
+    filename: str
+    size: int
+    accessed: float
+
+
+class TTSCacheIndex(TypedDict):
+    """Stored index of the files in the cache directory."""
+
+    cache_dir: str
+    files: dict[str, TTSCacheFile]
+
+
+@dataclass(slots=True)
+class TTSCacheStats:
+    """Hits, misses and evictions of the TTS caches."""
+
+    memory_hits: int = 0
+    file_hits: int = 0
+    misses: int = 0
+    memory_evictions: int = 0
+    file_evictions: int = 0
 
 
 @callback
@@ -196,6 +289,19 @@ async def async_get_media_source_audio(
     )
 
 
+async def async_get_media_source_audio_stream(
+    hass: HomeAssistant,
+    media_source_id: str,
+) -> tuple[str, AsyncGenerator[bytes]]:
+    """Get TTS audio as extension, stream of chunks.
+
+    The chunks are yielded while the engine produces them.
+    """
+    return await hass.data[DATA_TTS_MANAGER].async_stream_tts_audio(
+        **media_source_id_to_kwargs(media_source_id),
+    )
+
+
 @callback
 def async_get_text_to_speech_languages(hass: HomeAssistant) -> set[str]:
     """Return a set with the union of languages supported by tts engines."""
@@ -302,14 +408,24 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, websocket_list_engines)
     websocket_api.async_register_command(hass, websocket_get_engine)
     websocket_api.async_register_command(hass, websocket_list_engine_voices)
+    websocket_api.async_register_command(hass, websocket_get_cache_info)
 
     # Legacy config options
     conf = config[DOMAIN][0] if config.get(DOMAIN) else {}
     use_cache: bool = conf.get(CONF_CACHE, DEFAULT_CACHE)
     cache_dir: str = conf.get(CONF_CACHE_DIR, DEFAULT_CACHE_DIR)
     time_memory: int = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
-
-    tts = SpeechManager(hass, use_cache, cache_dir, time_memory)
+    cache_max_size: int = conf.get(CONF_CACHE_MAX_SIZE, DEFAULT_CACHE_MAX_SIZE)
+    memory_max_size: int = conf.get(CONF_MEMORY_MAX_SIZE, DEFAULT_MEMORY_MAX_SIZE)
+
+    tts = SpeechManager(
+        hass,
+        use_cache,
+        cache_dir,
+        time_memory,
+        cache_max_size * 2**20,
+        memory_max_size * 2**20,
+    )
 
     try:
         await tts.async_init_cache()
@@ -379,6 +495,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "default_options",
     "supported_languages",
     "supported_options",
+    "supports_streaming",
 }
 
 
@@ -392,6 +509,7 @@ class TextToSpeechEntity(RestoreEntity, cached_properties=CACHED_PROPERTIES_WITH
     _attr_default_options: Mapping[str, Any] | None = None
     _attr_supported_languages: list[str]
     _attr_supported_options: list[str] | None = None
+    _attr_supports_streaming: bool = False
 
     @property
     @final
@@ -421,6 +539,11 @@ class TextToSpeechEntity(RestoreEntity, cached_properties=CACHED_PROPERTIES_WITH
         """Return a mapping with the default options."""
         return self._attr_default_options
 
+    @cached_property
+    def supports_streaming(self) -> bool:
+        """Return if the engine yields the audio while it is produced."""
+        return self._attr_supports_streaming
+
     @callback
     def async_get_supported_voices(self, language: str) -> list[Voice] | None:
         """Return a list of supported voices for a language."""
@@ -492,12 +615,33 @@ class TextToSpeechEntity(RestoreEntity, cached_properties=CACHED_PROPERTIES_WITH
             message=message, language=language, options=options
         )
 
+    @final
+    async def internal_async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType:
+        """Process an audio stream of the TTS service."""
+        self.__last_tts_loaded = dt_util.utcnow().isoformat()
+        self.async_write_ha_state()
+        return await self.async_stream_tts_audio(
+            message=message, language=language, options=options
+        )
+
     def get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
     ) -> TtsAudioType:
         """Load tts audio file from the engine."""
         raise NotImplementedError
 
+    async def async_stream_tts_audio(
+        self, message: str, language: str, options: dict[str, Any]
+    ) -> TtsAudioStreamType:
+        """Stream tts audio from the engine.
+
+        Return a tuple of file extension and an async iterator of the chunks
+        of audio. Only called if the engine supports streaming.
+        """
+        raise NotImplementedError
+
     async def async_get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
     ) -> TtsAudioType:
@@ -521,7 +665,14 @@ def _hash_options(options: dict) -> str:
 
 
 class SpeechManager:
-    """Representation of a speech store."""
+    """Representation of a speech store.
+
+    The memory and file caches are bounded by their size in bytes and evict
+    the least recently used messages first. The files in the cache directory
+    are kept in a stored index with their size and access time. The index is
+    reconciled with the directory at startup, as files can be added or
+    removed while the index has not been saved yet.
+    """
 
     def __init__(
         self,
@@ -529,6 +680,8 @@ class SpeechManager:
         use_cache: bool,
         cache_dir: str,
         time_memory: int,
+        cache_max_size: int = DEFAULT_CACHE_MAX_SIZE * 2**20,
+        memory_max_size: int = DEFAULT_MEMORY_MAX_SIZE * 2**20,
     ) -> None:
         """Initialize a speech store."""
         self.hass = hass
@@ -537,39 +690,133 @@ class SpeechManager:
         self.use_cache = use_cache
         self.cache_dir = cache_dir
         self.time_memory = time_memory
-        self.file_cache: dict[str, str] = {}
-        self.mem_cache: dict[str, TTSCache] = {}
-
-    def _init_cache(self) -> dict[str, str]:
+        self.cache_max_size = cache_max_size
+        self.memory_max_size = memory_max_size
+        self.file_cache: OrderedDict[str, TTSCacheFile] = OrderedDict()
+        self.file_cache_size = 0
+        self.mem_cache: OrderedDict[str, TTSCache] = OrderedDict()
+        self.mem_cache_size = 0
+        self.stats = TTSCacheStats()
+        self._store = Store[TTSCacheIndex](hass, STORAGE_VERSION, STORAGE_KEY)
+
+    def _init_cache(self, index: TTSCacheIndex | None) -> dict[str, TTSCacheFile]:
         """Init cache folder and fetch files."""
         try:
             self.cache_dir = _init_tts_cache_dir(self.hass, self.cache_dir)
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
+        indexed = (
+            index["files"]
+            if index is not None and index["cache_dir"] == self.cache_dir
+            else {}
+        )
         try:
-            return _get_cache_files(self.cache_dir)
+            return _get_cache_files(self.cache_dir, indexed)
         except OSError as err:
             raise HomeAssistantError(f"Can't read cache dir {err}") from err
 
     async def async_init_cache(self) -> None:
         """Init config folder and load file cache."""
-        self.file_cache.update(await self.hass.async_add_executor_job(self._init_cache))
+        index = await self._store.async_load()
+        files = await self.hass.async_add_executor_job(self._init_cache, index)
+        for cache_key, cache_file in sorted(
+            files.items(), key=lambda item: item[1]["accessed"]
+        ):
+            self.file_cache[cache_key] = cache_file
+            self.file_cache_size += cache_file["size"]
+        await self._async_evict_file_cache()
+        self._async_schedule_save_index()
 
     async def async_clear_cache(self) -> None:
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        self.mem_cache = OrderedDict()
+        self.mem_cache_size = 0
+
+        filenames = [cache_file["filename"] for cache_file in self.file_cache.values()]
+        await self.hass.async_add_executor_job(self._remove_files, filenames)
+        self.file_cache = OrderedDict()
+        self.file_cache_size = 0
+        self._async_schedule_save_index()
+
+    def _remove_files(self, filenames: list[str]) -> None:
+        """Remove files from filesystem."""
+        for filename in filenames:
+            try:
+                os.remove(os.path.join(self.cache_dir, filename))
+            except OSError as err:
+                _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
 
-        def remove_files() -> None:
-            """Remove files from filesystem."""
-            for filename in self.file_cache.values():
-                try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except OSError as err:
-                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+    @callback
+    def _async_schedule_save_index(self) -> None:
+        """Schedule saving the index of the file cache."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
 
-        await self.hass.async_add_executor_job(remove_files)
-        self.file_cache = {}
+    @callback
+    def _data_to_save(self) -> TTSCacheIndex:
+        """Return the index of the file cache to store."""
+        return {"cache_dir": self.cache_dir, "files": dict(self.file_cache)}
+
+    @callback
+    def _async_touch(self, cache_key: str) -> None:
+        """Mark a message as the most recently used in the caches."""
+        if cache_key in self.mem_cache:
+            self.mem_cache.move_to_end(cache_key)
+        if (cache_file := self.file_cache.get(cache_key)) is not None:
+            self.file_cache.move_to_end(cache_key)
+            cache_file["accessed"] = time.time()
+            self._async_schedule_save_index()
+
+    @callback
+    def _async_remove_from_memcache(self, cache_key: str) -> None:
+        """Remove a message from the memory cache."""
+        if (cached := self.mem_cache.pop(cache_key, None)) is not None:
+            self.mem_cache_size -= len(cached["voice"])
+
+    @callback
+    def _async_evict_memcache(self, keep: str) -> None:
+        """Evict the least recently used messages from the memory cache."""
+        for cache_key in list(self.mem_cache):
+            if self.mem_cache_size <= self.memory_max_size:
+                return
+            if cache_key == keep or self.mem_cache[cache_key]["pending"] is not None:
+                continue
+            self._async_remove_from_memcache(cache_key)
+            self.stats.memory_evictions += 1
+
+    async def _async_evict_file_cache(self, keep: str | None = None) -> None:
+        """Evict the least recently used files from the file cache."""
+        filenames: list[str] = []
+        for cache_key in list(self.file_cache):
+            if self.file_cache_size <= self.cache_max_size:
+                break
+            if cache_key == keep:
+                continue
+            cache_file = self.file_cache.pop(cache_key)
+            self.file_cache_size -= cache_file["size"]
+            filenames.append(cache_file["filename"])
+        if not filenames:
+            return
+        self.stats.file_evictions += len(filenames)
+        self._async_schedule_save_index()
+        await self.hass.async_add_executor_job(self._remove_files, filenames)
+
+    @callback
+    def async_get_cache_info(self) -> dict[str, Any]:
+        """Return the size and the counters of the caches."""
+        return {
+            "memory": {
+                "entries": len(self.mem_cache),
+                "size": self.mem_cache_size,
+                "max_size": self.memory_max_size,
+            },
+            "file": {
+                "entries": len(self.file_cache),
+                "size": self.file_cache_size,
+                "max_size": self.cache_max_size,
+            },
+            **asdict(self.stats),
+        }
 
     @callback
     def async_register_legacy_engine(
@@ -643,18 +890,15 @@ class SpeechManager:
         cache_key = self._generate_cache_key(message, language, options, engine)
         use_cache = cache if cache is not None else self.use_cache
 
-        # Is speech already in memory
-        if cache_key in self.mem_cache:
-            filename = self.mem_cache[cache_key]["filename"]
-        # Is file store in file cache
-        elif use_cache and cache_key in self.file_cache:
-            filename = self.file_cache[cache_key]
-            self.hass.async_create_task(self._async_file_to_mem(cache_key))
-        # Load speech from engine into memory
-        else:
-            filename = await self._async_get_tts_audio(
-                engine_instance, cache_key, message, use_cache, language, options
-            )
+        filename = await self._async_load_message(
+            engine_instance,
+            cache_key,
+            message,
+            use_cache,
+            language,
+            options,
+            wait_for_file=False,
+        )
 
         return f"/api/tts_proxy/{filename}"
 
@@ -674,14 +918,9 @@ class SpeechManager:
         cache_key = self._generate_cache_key(message, language, options, engine)
         use_cache = cache if cache is not None else self.use_cache
 
-        # If we have the file, load it into memory if necessary
-        if cache_key not in self.mem_cache:
-            if use_cache and cache_key in self.file_cache:
-                await self._async_file_to_mem(cache_key)
-            else:
-                await self._async_get_tts_audio(
-                    engine_instance, cache_key, message, use_cache, language, options
-                )
+        await self._async_load_message(
+            engine_instance, cache_key, message, use_cache, language, options
+        )
 
         extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
         cached = self.mem_cache[cache_key]
@@ -690,6 +929,70 @@ class SpeechManager:
             cached = self.mem_cache[cache_key]
         return extension, cached["voice"]
 
+    async def async_stream_tts_audio(
+        self,
+        engine: str,
+        message: str,
+        cache: bool | None = None,
+        language: str | None = None,
+        options: dict | None = None,
+    ) -> tuple[str, AsyncGenerator[bytes]]:
+        """Fetch TTS audio as a stream of chunks."""
+        if (engine_instance := get_engine_instance(self.hass, engine)) is None:
+            raise HomeAssistantError(f"Provider {engine} not found")
+
+        language, options = self.process_options(engine_instance, language, options)
+        cache_key = self._generate_cache_key(message, language, options, engine)
+        use_cache = cache if cache is not None else self.use_cache
+
+        await self._async_load_message(
+            engine_instance, cache_key, message, use_cache, language, options
+        )
+
+        extension = os.path.splitext(self.mem_cache[cache_key]["filename"])[1][1:]
+        cached = self.mem_cache[cache_key]
+        if (stream := cached["stream"]) is not None:
+            return extension, stream.async_iter()
+        if pending := cached.get("pending"):
+            await pending
+            cached = self.mem_cache[cache_key]
+        return extension, _async_iter_voice(cached["voice"])
+
+    async def _async_load_message(
+        self,
+        engine_instance: TextToSpeechEntity | Provider,
+        cache_key: str,
+        message: str,
+        use_cache: bool,
+        language: str,
+        options: dict[str, Any],
+        wait_for_file: bool = True,
+    ) -> str:
+        """Load a message into the memory cache if needed and return its filename.
+
+        This method is a coroutine.
+        """
+        # Is speech already in memory
+        if (cached := self.mem_cache.get(cache_key)) is not None:
+            self.stats.memory_hits += 1
+            self._async_touch(cache_key)
+            return cached["filename"]
+
+        # Is file store in file cache
+        if use_cache and (cache_file := self.file_cache.get(cache_key)) is not None:
+            self.stats.file_hits += 1
+            if wait_for_file:
+                await self._async_file_to_mem(cache_key)
+            else:
+                self.hass.async_create_task(self._async_file_to_mem(cache_key))
+            return cache_file["filename"]
+
+        # Load speech from engine into memory
+        self.stats.misses += 1
+        return await self._async_get_tts_audio(
+            engine_instance, cache_key, message, use_cache, language, options
+        )
+
     @callback
     def _generate_cache_key(
         self,
@@ -758,12 +1061,63 @@ class SpeechManager:
         if sample_bytes is not None:
             sample_bytes = int(sample_bytes)
 
+        # Create file infos
+        filename = f"{cache_key}.{final_extension}".lower()
+
+        def needs_conversion(extension: str) -> bool:
+            """Return if the audio of the engine must be converted.
+
+            Only convert if we have a preferred format different than the
+            expected format from the TTS system, or if a specific sample
+            rate/format/channel count is requested.
+            """
+            return (
+                (final_extension != extension)
+                or (sample_rate is not None)
+                or (sample_channels is not None)
+                or (sample_bytes is not None)
+            )
+
+        streaming = (
+            isinstance(engine_instance, TextToSpeechEntity)
+            and engine_instance.supports_streaming
+        )
+        stream = TTSAudioStream()
+
         async def get_tts_data() -> str:
             """Handle data available."""
             if engine_instance.name is None or engine_instance.name is UNDEFINED:
                 raise HomeAssistantError("TTS engine name is not set.")
 
-            if isinstance(engine_instance, Provider):
+            # Validate filename
+            if not _RE_VOICE_FILE.match(filename) and not _RE_LEGACY_VOICE_FILE.match(
+                filename
+            ):
+                raise HomeAssistantError(
+                    f"TTS filename '{filename}' from {engine_instance.name} is invalid!"
+                )
+
+            extension: str | None
+            data: bytes | None
+            if streaming:
+                assert isinstance(engine_instance, TextToSpeechEntity)
+                (
+                    extension,
+                    chunks,
+                ) = await engine_instance.internal_async_stream_tts_audio(
+                    message, language, options
+                )
+                if not needs_conversion(extension):
+                    # Serve the audio while it is produced, ID3 tags can't be
+                    # added in front of the chunks which are already served.
+                    parts: list[bytes] = []
+                    async for chunk in chunks:
+                        stream.async_write(chunk)
+                        parts.append(chunk)
+                    self._async_store_audio(cache_key, filename, b"".join(parts), cache)
+                    return filename
+                data = b"".join([chunk async for chunk in chunks])
+            elif isinstance(engine_instance, Provider):
                 extension, data = await engine_instance.async_get_tts_audio(
                     message, language, options
                 )
@@ -777,17 +1131,7 @@ class SpeechManager:
                     f"No TTS from {engine_instance.name} for '{message}'"
                 )
 
-            # Only convert if we have a preferred format different than the
-            # expected format from the TTS system, or if a specific sample
-            # rate/format/channel count is requested.
-            needs_conversion = (
-                (final_extension != extension)
-                or (sample_rate is not None)
-                or (sample_channels is not None)
-                or (sample_bytes is not None)
-            )
-
-            if needs_conversion:
+            if needs_conversion(extension):
                 data = await async_convert_audio(
                     self.hass,
                     extension,
@@ -798,49 +1142,51 @@ class SpeechManager:
                     to_sample_bytes=sample_bytes,
                 )
 
-            # Create file infos
-            filename = f"{cache_key}.{final_extension}".lower()
-
-            # Validate filename
-            if not _RE_VOICE_FILE.match(filename) and not _RE_LEGACY_VOICE_FILE.match(
-                filename
-            ):
-                raise HomeAssistantError(
-                    f"TTS filename '{filename}' from {engine_instance.name} is invalid!"
-                )
-
             # Save to memory
             if final_extension == "mp3":
                 data = self.write_tags(
                     filename, data, engine_instance.name, message, language, options
                 )
 
-            self._async_store_to_memcache(cache_key, filename, data)
-
-            if cache:
-                self.hass.async_create_task(
-                    self._async_save_tts_audio(cache_key, filename, data)
-                )
-
+            stream.async_write(data)
+            self._async_store_audio(cache_key, filename, data, cache)
             return filename
 
         audio_task = self.hass.async_create_task(get_tts_data(), eager_start=False)
 
-        def handle_error(_future: asyncio.Future) -> None:
-            """Handle error."""
-            if audio_task.exception():
-                self.mem_cache.pop(cache_key, None)
+        def handle_done(_future: asyncio.Future) -> None:
+            """Close the stream and handle error."""
+            error = (
+                asyncio.CancelledError()
+                if audio_task.cancelled()
+                else audio_task.exception()
+            )
+            stream.async_close(error)
+            if error:
+                self._async_remove_from_memcache(cache_key)
 
-        audio_task.add_done_callback(handle_error)
+        audio_task.add_done_callback(handle_done)
 
-        filename = f"{cache_key}.{final_extension}".lower()
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": b"",
             "pending": audio_task,
+            "stream": stream if streaming else None,
         }
         return filename
 
+    @callback
+    def _async_store_audio(
+        self, cache_key: str, filename: str, data: bytes, cache: bool
+    ) -> None:
+        """Store the audio of the engine in the memory and file caches."""
+        self._async_store_to_memcache(cache_key, filename, data)
+
+        if cache:
+            self.hass.async_create_task(
+                self._async_save_tts_audio(cache_key, filename, data)
+            )
+
     async def _async_save_tts_audio(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
@@ -857,18 +1203,31 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[cache_key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        if (cache_file := self.file_cache.pop(cache_key, None)) is not None:
+            self.file_cache_size -= cache_file["size"]
+        self.file_cache[cache_key] = {
+            "filename": filename,
+            "size": len(data),
+            "accessed": time.time(),
+        }
+        self.file_cache_size += len(data)
+        self._async_schedule_save_index()
+        await self._async_evict_file_cache(cache_key)
 
     async def _async_file_to_mem(self, cache_key: str) -> None:
         """Load voice from file cache into memory.
 
         This method is a coroutine.
         """
-        if not (filename := self.file_cache.get(cache_key)):
+        if not (cache_file := self.file_cache.get(cache_key)):
             raise HomeAssistantError(f"Key {cache_key} not in file cache!")
 
+        filename = cache_file["filename"]
+
         voice_file = os.path.join(self.cache_dir, filename)
 
         def load_speech() -> bytes:
@@ -879,26 +1238,33 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[cache_key]
+            if self.file_cache.pop(cache_key, None) is not None:
+                self.file_cache_size -= cache_file["size"]
+                self._async_schedule_save_index()
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         self._async_store_to_memcache(cache_key, filename, data)
+        self._async_touch(cache_key)
 
     @callback
     def _async_store_to_memcache(
         self, cache_key: str, filename: str, data: bytes
     ) -> None:
         """Store data to memcache and set timer to remove it."""
+        self._async_remove_from_memcache(cache_key)
         self.mem_cache[cache_key] = {
             "filename": filename,
             "voice": data,
             "pending": None,
+            "stream": None,
         }
+        self.mem_cache_size += len(data)
+        self._async_evict_memcache(cache_key)
 
         @callback
         def async_remove_from_mem(_: datetime) -> None:
             """Cleanup memcache."""
-            self.mem_cache.pop(cache_key, None)
+            self._async_remove_from_memcache(cache_key)
 
         async_call_later(
             self.hass,
@@ -913,6 +1279,40 @@ class SpeechManager:
     async def async_read_tts(self, filename: str) -> tuple[str | None, bytes]:
         """Read a voice file and return binary.
 
+        This method is a coroutine.
+        """
+        cache_key = await self._async_load_voice_file(filename)
+        cached = self.mem_cache[cache_key]
+        if pending := cached.get("pending"):
+            await pending
+            cached = self.mem_cache[cache_key]
+
+        content, _ = mimetypes.guess_type(filename)
+        return content, cached["voice"]
+
+    async def async_read_tts_stream(
+        self, filename: str
+    ) -> tuple[str | None, bytes | TTSAudioStream]:
+        """Read a voice file, or the stream of a voice which is streamed.
+
+        Only engines which support streaming are read as a stream, the
+        audio of the other engines is served at once.
+
+        This method is a coroutine.
+        """
+        cache_key = await self._async_load_voice_file(filename)
+        cached = self.mem_cache[cache_key]
+        content, _ = mimetypes.guess_type(filename)
+        if (stream := cached["stream"]) is not None:
+            return content, stream
+        if pending := cached.get("pending"):
+            await pending
+            cached = self.mem_cache[cache_key]
+        return content, cached["voice"]
+
+    async def _async_load_voice_file(self, filename: str) -> str:
+        """Load a voice file into memory if needed and return its cache key.
+
         This method is a coroutine.
         """
         if not (record := _RE_VOICE_FILE.match(filename.lower())) and not (
@@ -924,18 +1324,14 @@ class SpeechManager:
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
-        if cache_key not in self.mem_cache:
-            if cache_key not in self.file_cache:
-                raise HomeAssistantError(f"{cache_key} not in cache!")
+        if cache_key in self.mem_cache:
+            self._async_touch(cache_key)
+        elif cache_key in self.file_cache:
             await self._async_file_to_mem(cache_key)
+        else:
+            raise HomeAssistantError(f"{cache_key} not in cache!")
 
-        cached = self.mem_cache[cache_key]
-        if pending := cached.get("pending"):
-            await pending
-            cached = self.mem_cache[cache_key]
-
-        content, _ = mimetypes.guess_type(filename)
-        return content, cached["voice"]
+        return cache_key
 
     @staticmethod
     def write_tags(
@@ -990,6 +1386,11 @@ class SpeechManager:
         return data_bytes.getvalue()
 
 
+async def _async_iter_voice(data: bytes) -> AsyncGenerator[bytes]:
+    """Yield the audio of a voice which is already produced."""
+    yield data
+
+
 def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     """Init cache folder."""
     if not os.path.isabs(cache_dir):
@@ -1000,19 +1401,38 @@ def _init_tts_cache_dir(hass: HomeAssistant, cache_dir: str) -> str:
     return cache_dir
 
 
-def _get_cache_files(cache_dir: str) -> dict[str, str]:
-    """Return a dict of given engine files."""
-    cache = {}
+def _get_cache_files(
+    cache_dir: str, indexed: dict[str, TTSCacheFile] | None = None
+) -> dict[str, TTSCacheFile]:
+    """Return a dict of given engine files.
 
-    folder_data = os.listdir(cache_dir)
-    for file_data in folder_data:
-        if (record := _RE_VOICE_FILE.match(file_data)) or (
-            record := _RE_LEGACY_VOICE_FILE.match(file_data)
-        ):
-            key = KEY_PATTERN.format(
-                record.group(1), record.group(2), record.group(3), record.group(4)
-            )
-            cache[key.lower()] = file_data.lower()
+    Files in the index are taken from it, so only the files which were not
+    indexed have to be stat'ed. Indexed files missing from the directory
+    are left out.
+    """
+    cache: dict[str, TTSCacheFile] = {}
+
+    with os.scandir(cache_dir) as folder_data:
+        for file_data in folder_data:
+            if (record := _RE_VOICE_FILE.match(file_data.name)) or (
+                record := _RE_LEGACY_VOICE_FILE.match(file_data.name)
+            ):
+                key = KEY_PATTERN.format(
+                    record.group(1), record.group(2), record.group(3), record.group(4)
+                ).lower()
+                if (
+                    indexed
+                    and (cache_file := indexed.get(key)) is not None
+                    and cache_file["filename"] == file_data.name.lower()
+                ):
+                    cache[key] = cache_file
+                    continue
+                file_stat = file_data.stat()
+                cache[key] = {
+                    "filename": file_data.name.lower(),
+                    "size": file_stat.st_size,
+                    "accessed": file_stat.st_mtime,
+                }
     return cache
 
 
@@ -1073,15 +1493,46 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
-        """Start a get request."""
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
+        """Start a get request.
+
+        The audio which is still produced by the engine is served with chunked
+        transfer encoding while it is produced.
+        """
+        try:
+            content, data = await self.tts.async_read_tts_stream(filename)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error on load tts: %s", err)
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        if isinstance(data, bytes):
+            return web.Response(body=data, content_type=content)
+
+        chunks = data.async_iter()
         try:
-            content, data = await self.tts.async_read_tts(filename)
+            # Errors of the engine before the first chunk are still reported
+            # with the status of the response
+            first_chunk = await anext(chunks, b"")
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
-        return web.Response(body=data, content_type=content)
+        response = web.StreamResponse()
+        if content is not None:
+            response.content_type = content
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        try:
+            await response.write(first_chunk)
+            async for chunk in chunks:
+                await response.write(chunk)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error on stream tts: %s", err)
+            response.force_close()
+            return response
+
+        await response.write_eof()
+        return response
 
 
 @websocket_api.websocket_command(
@@ -1178,6 +1629,20 @@ def websocket_get_engine(
     )
 
 
+@websocket_api.websocket_command({"type": "tts/cache/info"})
+@websocket_api.require_admin
+@callback
+def websocket_get_cache_info(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Get the size, hits, misses and evictions of the text to speech caches."""
+    connection.send_message(
+        websocket_api.result_message(
+            msg["id"], hass.data[DATA_TTS_MANAGER].async_get_cache_info()
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         "type": "tts/engine/voices",
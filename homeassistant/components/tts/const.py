@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterable
 from typing import TYPE_CHECKING
 
 from homeassistant.util.hass_dict import HassKey
@@ -18,11 +19,15 @@ ATTR_OPTIONS = "options"
 
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_MAX_SIZE = "cache_max_size"
 CONF_FIELDS = "fields"
+CONF_MEMORY_MAX_SIZE = "memory_max_size"
 CONF_TIME_MEMORY = "time_memory"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
+DEFAULT_CACHE_MAX_SIZE = 512  # MB
+DEFAULT_MEMORY_MAX_SIZE = 64  # MB
 DEFAULT_TIME_MEMORY = 300
 
 DOMAIN = "tts"
@@ -31,3 +36,4 @@ DATA_COMPONENT: HassKey[EntityComponent[TextToSpeechEntity]] = HassKey(DOMAIN)
 DATA_TTS_MANAGER: HassKey[SpeechManager] = HassKey("tts_manager")
 
 type TtsAudioType = tuple[str | None, bytes | None]
+type TtsAudioStreamType = tuple[str, AsyncIterable[bytes]]
@@ -45,11 +45,15 @@ from .const import (
     ATTR_OPTIONS,
     CONF_CACHE,
     CONF_CACHE_DIR,
+    CONF_CACHE_MAX_SIZE,
     CONF_FIELDS,
+    CONF_MEMORY_MAX_SIZE,
     CONF_TIME_MEMORY,
     DATA_TTS_MANAGER,
     DEFAULT_CACHE,
     DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_MEMORY_MAX_SIZE,
     DEFAULT_TIME_MEMORY,
     DOMAIN,
     TtsAudioType,
@@ -80,6 +84,12 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_TIME_MEMORY, default=DEFAULT_TIME_MEMORY): vol.All(
             vol.Coerce(int), vol.Range(min=60, max=57600)
         ),
+        vol.Optional(CONF_CACHE_MAX_SIZE, default=DEFAULT_CACHE_MAX_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_MEMORY_MAX_SIZE, default=DEFAULT_MEMORY_MAX_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
         vol.Optional(CONF_SERVICE_NAME): cv.string,
     }
 )
@@ -24,6 +24,7 @@ METER_TYPES = [
 
 DATA_UTILITY = "utility_meter_data"
 DATA_TARIFF_SENSORS = "utility_meter_sensors"
+DATA_SOURCE_TRACKERS = "utility_meter_source_trackers"
 
 CONF_METER = "meter"
 CONF_SOURCE_SENSOR = "source"
@@ -31,6 +31,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Event,
     EventStateChangedData,
     HomeAssistant,
@@ -69,6 +70,7 @@ from .const import (
     CONF_TARIFF_ENTITY,
     CONF_TARIFFS,
     DAILY,
+    DATA_SOURCE_TRACKERS,
     DATA_TARIFF_SENSORS,
     DATA_UTILITY,
     HOURLY,
@@ -347,6 +349,110 @@ class UtilitySensorExtraStoredData(SensorExtraStoredData):
         )
 
 
+def _validate_state(state: State | None) -> Decimal | None:
+    """Parse the state as a Decimal if available. Throws DecimalException if the state is not a number."""
+    try:
+        return (
+            None
+            if state is None or state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]
+            else Decimal(state.state)
+        )
+    except DecimalException:
+        return None
+
+
+@dataclass(slots=True, frozen=True)
+class SourceReading:
+    """A state change of a source sensor, parsed once for all utility meters."""
+
+    source_state: State | None
+    old_state: State | None
+    new_state: State | None
+    old_value: Decimal | None
+    new_value: Decimal | None
+
+
+class UtilityMeterSourceTracker:
+    """Track a source sensor and feed its readings to the utility meters using it.
+
+    Many utility meters (one per tariff and cycle) may use the same source sensor,
+    the tracker subscribes to the source once and parses each state once instead
+    of once per utility meter.
+    """
+
+    def __init__(self, hass: HomeAssistant, source_entity_id: str) -> None:
+        """Initialize the tracker."""
+        self._hass = hass
+        self._source_entity_id = source_entity_id
+        self._meters: dict[UtilityMeterSensor, None] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self._last_state: State | None = None
+        self._last_value: Decimal | None = None
+
+    @callback
+    def async_add_meter(self, meter: UtilityMeterSensor) -> CALLBACK_TYPE:
+        """Start feeding readings to a utility meter."""
+        self._meters[meter] = None
+        if self._unsub is None:
+            self._unsub = async_track_state_change_event(
+                self._hass, [self._source_entity_id], self._async_source_changed
+            )
+
+        @callback
+        def _async_remove_meter() -> None:
+            """Stop feeding readings to the utility meter."""
+            self._meters.pop(meter, None)
+            if not self._meters and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+                self._last_state = self._last_value = None
+                trackers = self._hass.data[DATA_SOURCE_TRACKERS]
+                if trackers.get(self._source_entity_id) is self:
+                    del trackers[self._source_entity_id]
+
+        return _async_remove_meter
+
+    @callback
+    def _async_source_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Parse the source state change and hand it to the utility meters."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        # The old state is the new state of the previous event, so it has
+        # usually been parsed already
+        if old_state is not None and old_state is self._last_state:
+            old_value = self._last_value
+        else:
+            old_value = _validate_state(old_state)
+        new_value = _validate_state(new_state)
+        self._last_state = new_state
+        self._last_value = new_value
+        reading = SourceReading(
+            self._hass.states.get(self._source_entity_id),
+            old_state,
+            new_state,
+            old_value,
+            new_value,
+        )
+        # A utility meter may start or stop collecting while handling the reading
+        for meter in list(self._meters):
+            meter.async_reading(reading)
+
+
+@callback
+def async_get_source_tracker(
+    hass: HomeAssistant, source_entity_id: str
+) -> UtilityMeterSourceTracker:
+    """Return the shared tracker for a source sensor."""
+    trackers: dict[str, UtilityMeterSourceTracker] = hass.data.setdefault(
+        DATA_SOURCE_TRACKERS, {}
+    )
+    if (tracker := trackers.get(source_entity_id)) is None:
+        tracker = trackers[source_entity_id] = UtilityMeterSourceTracker(
+            hass, source_entity_id
+        )
+    return tracker
+
+
 class UtilityMeterSensor(RestoreSensor):
     """Representation of an utility meter sensor."""
 
@@ -413,26 +519,29 @@ class UtilityMeterSensor(RestoreSensor):
         self._state = 0
         self.async_write_ha_state()
 
-    @staticmethod
-    def _validate_state(state: State | None) -> Decimal | None:
-        """Parse the state as a Decimal if available. Throws DecimalException if the state is not a number."""
-        try:
-            return (
-                None
-                if state is None or state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN]
-                else Decimal(state.state)
-            )
-        except DecimalException:
-            return None
-
     def calculate_adjustment(
         self, old_state: State | None, new_state: State
     ) -> Decimal | None:
         """Calculate the adjustment based on the old and new state."""
+        return self._calculate_adjustment(
+            SourceReading(
+                None,
+                old_state,
+                new_state,
+                _validate_state(old_state),
+                _validate_state(new_state),
+            )
+        )
+
+    def _calculate_adjustment(self, reading: SourceReading) -> Decimal | None:
+        """Calculate the adjustment based on a parsed source reading."""
 
         # First check if the new_state is valid (see discussion in PR #88446)
-        if (new_state_val := self._validate_state(new_state)) is None:
-            _LOGGER.warning("Invalid state %s", new_state.state)
+        if (new_state_val := reading.new_value) is None:
+            _LOGGER.warning(
+                "Invalid state %s",
+                reading.new_state.state if reading.new_state else None,
+            )
             return None
 
         if self._sensor_delta_values:
@@ -444,23 +553,23 @@ class UtilityMeterSensor(RestoreSensor):
         ):  # Fallback to old_state if sensor is periodically resetting but last_valid_state is None
             return new_state_val - self._last_valid_state
 
-        if (old_state_val := self._validate_state(old_state)) is not None:
+        if (old_state_val := reading.old_value) is not None:
             return new_state_val - old_state_val
 
         _LOGGER.debug(
             "%s received an invalid state change coming from %s (%s > %s)",
             self.name,
             self._sensor_source_id,
-            old_state.state if old_state else None,
+            reading.old_state.state if reading.old_state else None,
             new_state_val,
         )
         return None
 
     @callback
-    def async_reading(self, event: Event[EventStateChangedData]) -> None:
+    def async_reading(self, reading: SourceReading) -> None:
         """Handle the sensor state changes."""
         if (
-            source_state := self.hass.states.get(self._sensor_source_id)
+            source_state := reading.source_state
         ) is None or source_state.state == STATE_UNAVAILABLE:
             if not self._sensor_always_available:
                 self._attr_available = False
@@ -469,14 +578,13 @@ class UtilityMeterSensor(RestoreSensor):
 
         self._attr_available = True
 
-        old_state = event.data["old_state"]
-        new_state = event.data["new_state"]
+        new_state = reading.new_state
         if new_state is None:
             return
         new_state_attributes: Mapping[str, Any] = new_state.attributes or {}
 
         # First check if the new_state is valid (see discussion in PR #88446)
-        if (new_state_val := self._validate_state(new_state)) is None:
+        if (new_state_val := reading.new_value) is None:
             _LOGGER.warning(
                 "%s received an invalid new state from %s : %s",
                 self.name,
@@ -498,9 +606,9 @@ class UtilityMeterSensor(RestoreSensor):
                         _suggest_report_issue(self.hass, self._sensor_source_id),
                     )
 
-        if (
-            adjustment := self.calculate_adjustment(old_state, new_state)
-        ) is not None and (self._sensor_net_consumption or adjustment >= 0):
+        if (adjustment := self._calculate_adjustment(reading)) is not None and (
+            self._sensor_net_consumption or adjustment >= 0
+        ):
             # If net_consumption is off, the adjustment must be non-negative
             self._state += adjustment  # type: ignore[operator] # self._state will be set to by the start function if it is None, therefore it always has a valid Decimal value at this line
 
@@ -519,9 +627,9 @@ class UtilityMeterSensor(RestoreSensor):
 
     def _change_status(self, tariff: str) -> None:
         if self._tariff == tariff:
-            self._collecting = async_track_state_change_event(
-                self.hass, [self._sensor_source_id], self.async_reading
-            )
+            self._collecting = async_get_source_tracker(
+                self.hass, self._sensor_source_id
+            ).async_add_meter(self)
         else:
             if self._collecting:
                 self._collecting()
@@ -669,9 +777,9 @@ class UtilityMeterSensor(RestoreSensor):
                 self._unit_of_measurement,
                 self._sensor_source_id,
             )
-            self._collecting = async_track_state_change_event(
-                self.hass, [self._sensor_source_id], self.async_reading
-            )
+            self._collecting = async_get_source_tracker(
+                self.hass, self._sensor_source_id
+            ).async_add_meter(self)
 
         self.async_on_remove(async_at_started(self.hass, async_source_tracking))
 
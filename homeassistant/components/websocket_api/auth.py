@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable
 from typing import TYPE_CHECKING, Any, Final
 
 from aiohttp.web import Request
@@ -54,6 +54,7 @@ class AuthPhase:
         logger: WebSocketAdapter,
         hass: HomeAssistant,
         send_message: Callable[[bytes | str | dict[str, Any]], None],
+        send_coalesced_message: Callable[[Hashable, bytes, Callable[[], bytes]], None],
         cancel_ws: CALLBACK_TYPE,
         request: Request,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
@@ -62,6 +63,7 @@ class AuthPhase:
         self._hass = hass
         # send_message will send a message to the client via the queue.
         self._send_message = send_message
+        self._send_coalesced_message = send_coalesced_message
         self._cancel_ws = cancel_ws
         self._logger = logger
         self._request = request
@@ -89,6 +91,7 @@ class AuthPhase:
                 self._send_message,
                 refresh_token.user,
                 refresh_token,
+                self._send_coalesced_message,
             )
             conn.subscriptions["auth"] = (
                 self._hass.auth.async_register_revoke_token_callback(
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from functools import lru_cache, partial
 import json
 import logging
-from typing import Any, cast
+from typing import Any
 
 import voluptuous as vol
 
@@ -49,10 +49,9 @@ from homeassistant.helpers.json import (
     JSON_DUMP,
     ExtendedJSONEncoder,
     find_paths_unserializable_data,
-    json_bytes,
     json_fragment,
 )
-from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.service import async_get_all_descriptions_json
 from homeassistant.loader import (
     IntegrationNotFound,
     async_get_integration,
@@ -66,8 +65,6 @@ from . import const, decorators, messages
 from .connection import ActiveConnection
 from .messages import construct_result_message
 
-ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -369,7 +366,7 @@ def _send_handle_get_states_response(
 
 @callback
 def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
+    send_coalesced_message: Callable[[Hashable, bytes, Callable[[], bytes]], None],
     entity_ids: set[str] | None,
     entity_filter: Callable[[str], bool] | None,
     user: User,
@@ -391,7 +388,13 @@ def _forward_entity_changes(
         and not permissions.check_entity(entity_id, POLICY_READ)
     ):
         return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    # A diff which was not sent yet is replaced with the complete state
+    # so a client which is slow to read the messages is not disconnected.
+    send_coalesced_message(
+        (message_id_as_bytes, entity_id),
+        messages.cached_state_diff_message(message_id_as_bytes, event),
+        partial(messages.cached_state_message, message_id_as_bytes, event),
+    )
 
 
 @callback
@@ -419,7 +422,7 @@ def handle_subscribe_entities(
         EVENT_STATE_CHANGED,
         partial(
             _forward_entity_changes,
-            connection.send_message,
+            connection.send_coalesced_message,
             entity_ids,
             entity_filter,
             connection.user,
@@ -486,28 +489,13 @@ def _send_handle_entities_init_response(
     )
 
 
-async def _async_get_all_descriptions_json(hass: HomeAssistant) -> bytes:
-    """Return JSON of descriptions (i.e. user documentation) for all service calls."""
-    descriptions = await async_get_all_descriptions(hass)
-    if ALL_SERVICE_DESCRIPTIONS_JSON_CACHE in hass.data:
-        cached_descriptions, cached_json_payload = hass.data[
-            ALL_SERVICE_DESCRIPTIONS_JSON_CACHE
-        ]
-        # If the descriptions are the same, return the cached JSON payload
-        if cached_descriptions is descriptions:
-            return cast(bytes, cached_json_payload)
-    json_payload = json_bytes(descriptions)
-    hass.data[ALL_SERVICE_DESCRIPTIONS_JSON_CACHE] = (descriptions, json_payload)
-    return json_payload
-
-
 @decorators.websocket_command({vol.Required("type"): "get_services"})
 @decorators.async_response
 async def handle_get_services(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get services command."""
-    payload = await _async_get_all_descriptions_json(hass)
+    payload = await async_get_all_descriptions_json(hass)
     connection.send_message(construct_result_message(msg["id"], payload))
 
 
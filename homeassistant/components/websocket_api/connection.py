@@ -37,6 +37,7 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "_send_coalesced_message",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -54,11 +55,14 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        send_coalesced_message: Callable[[Hashable, bytes, Callable[[], bytes]], None]
+        | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        self._send_coalesced_message = send_coalesced_message
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
@@ -123,6 +127,20 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    @callback
+    def send_coalesced_message(
+        self, key: Hashable, message: bytes, replacement: Callable[[], bytes]
+    ) -> None:
+        """Send a message which supersedes the queued message with the same key.
+
+        If the message with the same key was not sent yet, it is replaced with
+        the message returned by replacement instead of queueing another one.
+        """
+        if self._send_coalesced_message is None:
+            self.send_message(message)
+            return
+        self._send_coalesced_message(key, message, replacement)
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
@@ -245,6 +263,7 @@ class ActiveConnection:
                 )
         self.subscriptions.clear()
         self.send_message = self._connect_closed_error
+        self._send_coalesced_message = None
         current_request.set(None)
         current_connection.set(None)
 
@@ -34,6 +34,11 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages from which a queued message is replaced
+# by a later message that supersedes it, such as a newer state of
+# the same entity for the same subscription.
+PENDING_MSG_COALESCE: Final = 128
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable
 import datetime as dt
 from functools import partial
 import logging
@@ -25,6 +25,7 @@ from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_COALESCE,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -80,6 +81,8 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_message_queue_offset",
+        "_coalesce_positions",
         "_ready_future",
         "_release_ready_queue_size",
     )
@@ -103,6 +106,11 @@ class WebSocketHandler:
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
         self._message_queue: deque[bytes] = deque()
+        # The number of messages the writer took off the queue, and the
+        # position since the start of the connection of the queued
+        # messages which may be superseded by a later message.
+        self._message_queue_offset: int = 0
+        self._coalesce_positions: dict[Hashable, int] = {}
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
 
@@ -155,13 +163,16 @@ class WebSocketHandler:
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    self._message_queue_offset += 1
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
                     continue
 
                 coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                self._message_queue_offset += len(message_queue)
                 message_queue.clear()
+                self._coalesce_positions.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_bytes_text(coalesced_messages)
@@ -234,6 +245,34 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _send_coalesced_message(
+        self, key: Hashable, message: bytes, replacement: Callable[[], bytes]
+    ) -> None:
+        """Queue sending a message which supersedes the queued one with the same key.
+
+        Once the client falls behind by PENDING_MSG_COALESCE messages, the
+        message with the same key which was not written yet is replaced in the
+        queue with the message returned by replacement, which must not depend
+        on the replaced message. A client which is not reading the messages
+        fast enough then only gets the latest message for each key instead of
+        being disconnected when the queue overflows.
+
+        Async friendly.
+        """
+        message_queue = self._message_queue
+        offset = self._message_queue_offset
+        if (
+            not self._closing
+            and len(message_queue) >= PENDING_MSG_COALESCE
+            and (position := self._coalesce_positions.get(key)) is not None
+            and 0 <= (index := position - offset) < len(message_queue)
+        ):
+            message_queue[index] = replacement()
+            return
+        self._coalesce_positions[key] = offset + len(message_queue)
+        self._send_message(message)
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -336,7 +375,13 @@ class WebSocketHandler:
 
         send_bytes_text = partial(send_frame, opcode=WSMsgType.TEXT)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._send_coalesced_message,
+            self._cancel,
+            request,
+            send_bytes_text,
         )
         connection: ActiveConnection | None = None
         disconnect_warn: str | None = None
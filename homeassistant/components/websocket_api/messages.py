@@ -177,6 +177,46 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def cached_state_message(
+    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+) -> bytes:
+    """Return an event message with the complete new state of the entity.
+
+    The message supersedes the previous state diff messages of the entity,
+    so it can replace them when they were not sent yet.
+    """
+    return b"".join(
+        (
+            _partial_cached_state_message(event)[:-1],
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_message(event: Event[EventStateChangedData]) -> bytes:
+    """Cache and serialize the event to json.
+
+    The message is constructed without the id which
+    will be appended in cached_state_message
+    """
+    return (
+        _message_to_json_bytes_or_none({"type": "event", "event": _state_event(event)})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+
+
+def _state_event(
+    event: Event[EventStateChangedData],
+) -> dict[str, list[str] | dict[str, CompressedState]]:
+    """Convert a state_changed event to the addition or removal of the entity."""
+    if (new_state := event.data["new_state"]) is None:
+        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
+    return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import timedelta
 from logging import Logger, getLogger
+import random
 from typing import TYPE_CHECKING, Any, Protocol
 
 from homeassistant import config_entries
@@ -67,9 +69,12 @@ DATA_DOMAIN_PLATFORM_ENTITIES: HassKey[dict[tuple[str, str], dict[str, Entity]]]
     HassKey("domain_platform_entities")
 )
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+POLLING_LATENCY_SAMPLES = 200
 
 _LOGGER = getLogger(__name__)
 
+type BatchServiceHandler = Callable[[dict[Entity, dict[str, Any]]], Awaitable[None]]
+
 
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
@@ -110,6 +115,121 @@ class EntityPlatformModule(Protocol):
         """Set up an integration platform from a config entry."""
 
 
+class _StaggeredPolling:
+    """Poll each entity of a platform on its own phase of the scan interval.
+
+    Each entity gets a random offset within the scan interval, so the updates
+    of a platform are spread over the interval instead of all starting on the
+    same tick. Concurrency is still limited by the PARALLEL_UPDATES semaphore
+    of the entities.
+    """
+
+    __slots__ = (
+        "_platform",
+        "_timers",
+        "_updating",
+        "latencies",
+        "overruns",
+    )
+
+    def __init__(self, platform: EntityPlatform) -> None:
+        """Initialize the scheduler."""
+        self._platform = platform
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._updating: set[str] = set()
+        self.latencies: deque[float] = deque(maxlen=POLLING_LATENCY_SAMPLES)
+        self.overruns = 0
+
+    @callback
+    def async_schedule(self, entities: Iterable[Entity]) -> None:
+        """Start polling entities which are not polled yet."""
+        platform = self._platform
+        loop = platform.hass.loop
+        interval = platform.scan_interval_seconds
+        now = loop.time()
+        for entity in entities:
+            entity_id = entity.entity_id
+            if entity_id in self._timers:
+                continue
+            # The first update sets the phase the entity keeps
+            first = now + random.random() * interval
+            self._timers[entity_id] = loop.call_at(
+                first, self._async_handle_entity_interval, entity, first
+            )
+
+    @callback
+    def async_unschedule(self, entity_id: str) -> None:
+        """Stop polling an entity."""
+        if (timer := self._timers.pop(entity_id, None)) is not None:
+            timer.cancel()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop polling all entities."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+
+    @callback
+    def _async_handle_entity_interval(self, entity: Entity, scheduled: float) -> None:
+        """Update an entity and schedule its next update."""
+        platform = self._platform
+        entity_id = entity.entity_id
+        if (
+            entity.hass is None
+            or platform.entities.get(entity_id) is not entity
+            or not entity.should_poll
+        ):
+            self._timers.pop(entity_id, None)
+            return
+
+        loop = platform.hass.loop
+        interval = platform.scan_interval_seconds
+        now = loop.time()
+        # Keep the phase of the entity, skipping the ticks missed
+        scheduled += interval
+        if scheduled <= now:
+            scheduled += interval * ((now - scheduled) // interval + 1)
+        self._timers[entity_id] = loop.call_at(
+            scheduled, self._async_handle_entity_interval, entity, scheduled
+        )
+
+        if entity_id in self._updating:
+            self.overruns += 1
+            log = (
+                platform.logger.warning if self.overruns == 1 else platform.logger.debug
+            )
+            log(
+                "Updating %s %s took longer than the scheduled update interval %s"
+                " (%s overruns, update latency p50 %.3fs, p95 %.3fs)",
+                platform.platform_name,
+                entity_id,
+                platform.scan_interval,
+                self.overruns,
+                self.latency_percentile(50),
+                self.latency_percentile(95),
+            )
+            return
+
+        self._updating.add(entity_id)
+        platform.async_create_polling_task(self._async_update_entity(entity, now))
+
+    async def _async_update_entity(self, entity: Entity, started: float) -> None:
+        """Update an entity and record the update latency."""
+        try:
+            await entity.async_update_ha_state(True)
+        finally:
+            self._updating.discard(entity.entity_id)
+            self.latencies.append(self._platform.hass.loop.time() - started)
+
+    def latency_percentile(self, percentile: int) -> float:
+        """Return a percentile of the recent update latencies in seconds."""
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, len(latencies) * percentile // 100)]
+
+
 class EntityPlatform:
     """Manage the entities for a single platform.
 
@@ -153,8 +273,14 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Scheduler spreading the updates over the scan interval, if the
+        # platform opted in with STAGGER_UPDATES
+        self._staggered_polling: _StaggeredPolling | None = None
+        if getattr(platform, "STAGGER_UPDATES", False):
+            self._staggered_polling = _StaggeredPolling(self)
 
         self.parallel_updates: asyncio.Semaphore | None = None
+        self.batch_service_handlers: dict[tuple[str, str], BatchServiceHandler] = {}
         self._update_in_sequence: bool = False
 
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
@@ -647,6 +773,17 @@ class EntityPlatform:
 
         await add_func(coros, entities, timeout)
 
+        if (staggered_polling := self._staggered_polling) is not None:
+            if not (self.config_entry and self.config_entry.pref_disable_polling):
+                staggered_polling.async_schedule(
+                    entity
+                    for entity in entities
+                    if entity.entity_id
+                    and entity.entity_id in self.entities
+                    and entity.should_poll
+                )
+            return
+
         if (
             (self.config_entry and self.config_entry.pref_disable_polling)
             or self._async_polling_timer is not None
@@ -675,16 +812,21 @@ class EntityPlatform:
             self.scan_interval_seconds,
             self._async_handle_interval_callback,
         )
+        self.async_create_polling_task(self._async_update_entity_states())
+
+    @callback
+    def async_create_polling_task(self, target: Coroutine[Any, Any, None]) -> None:
+        """Create a background task polling entities of the platform."""
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
-                self._async_update_entity_states(),
+                target,
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
         else:
             self.hass.async_create_background_task(
-                self._async_update_entity_states(),
+                target,
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
@@ -948,6 +1090,8 @@ class EntityPlatform:
         if self._async_polling_timer is not None:
             self._async_polling_timer.cancel()
             self._async_polling_timer = None
+        if self._staggered_polling is not None:
+            self._staggered_polling.async_cancel()
 
     @callback
     def async_prepare(self) -> None:
@@ -968,6 +1112,9 @@ class EntityPlatform:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
 
+        if self._staggered_polling is not None:
+            self._staggered_polling.async_unschedule(entity_id)
+
         # Clean up polling job if no longer needed
         if self._async_polling_timer is not None and not any(
             entity.should_poll for entity in self.entities.values()
@@ -1015,6 +1162,25 @@ class EntityPlatform:
             supports_response=supports_response,
         )
 
+    @callback
+    def async_register_batch_service_handler(
+        self, domain: str, service: str, handler: BatchServiceHandler
+    ) -> None:
+        """Register a handler to call an entity service on entities at once.
+
+        When a call of the entity service targets more than one entity of this
+        platform, the handler is called once instead of calling the service
+        method on each entity. This allows sending a single group or
+        multicast command to the devices.
+
+        The handler gets a mapping of the entities to the keyword arguments
+        their service method would have been called with. Only services
+        registered with the name of an entity method are batched, services
+        registered with a function are called on each entity since the
+        function may process the service data for each entity.
+        """
+        self.batch_service_handlers[(domain, service)] = handler
+
     async def _async_update_entity_states(self) -> None:
         """Update the states of all the polling entities.
 
@@ -10,8 +10,18 @@ timer.
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Callable, Container, Hashable, KeysView, Mapping
+from collections import UserDict, defaultdict
+from collections.abc import (
+    Callable,
+    Container,
+    Hashable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+    ValuesView,
+)
 from datetime import datetime, timedelta
 from enum import StrEnum
 import logging
@@ -438,6 +448,153 @@ class DeletedRegistryEntry:
         )
 
 
+def _entry_from_storage(entity: dict[str, Any]) -> RegistryEntry:
+    """Create an entry from its storage representation."""
+    return RegistryEntry(
+        aliases=set(entity["aliases"]),
+        area_id=entity["area_id"],
+        categories=entity["categories"],
+        capabilities=entity["capabilities"],
+        config_entry_id=entity["config_entry_id"],
+        created_at=datetime.fromisoformat(entity["created_at"]),
+        device_class=entity["device_class"],
+        device_id=entity["device_id"],
+        disabled_by=RegistryEntryDisabler(entity["disabled_by"])
+        if entity["disabled_by"]
+        else None,
+        entity_category=EntityCategory(entity["entity_category"])
+        if entity["entity_category"]
+        else None,
+        entity_id=entity["entity_id"],
+        hidden_by=RegistryEntryHider(entity["hidden_by"])
+        if entity["hidden_by"]
+        else None,
+        icon=entity["icon"],
+        id=entity["id"],
+        has_entity_name=entity["has_entity_name"],
+        labels=set(entity["labels"]),
+        modified_at=datetime.fromisoformat(entity["modified_at"]),
+        name=entity["name"],
+        options=entity["options"],
+        original_device_class=entity["original_device_class"],
+        original_icon=entity["original_icon"],
+        original_name=entity["original_name"],
+        platform=entity["platform"],
+        supported_features=entity["supported_features"],
+        translation_key=entity["translation_key"],
+        unique_id=entity["unique_id"],
+        previous_unique_id=entity["previous_unique_id"],
+        unit_of_measurement=entity["unit_of_measurement"],
+    )
+
+
+def _deleted_entry_from_storage(entity: dict[str, Any]) -> DeletedRegistryEntry:
+    """Create a deleted entry from its storage representation."""
+    return DeletedRegistryEntry(
+        config_entry_id=entity["config_entry_id"],
+        created_at=datetime.fromisoformat(entity["created_at"]),
+        entity_id=entity["entity_id"],
+        id=entity["id"],
+        modified_at=datetime.fromisoformat(entity["modified_at"]),
+        orphaned_timestamp=entity["orphaned_timestamp"],
+        platform=entity["platform"],
+        unique_id=entity["unique_id"],
+    )
+
+
+class DeletedEntityRegistryItems(UserDict[tuple[str, str, str], DeletedRegistryEntry]):
+    """Container for deleted entity registry items.
+
+    Maps (domain, platform, unique_id) -> deleted entry.
+
+    Deleted entries are only looked up when an entity is re-added, so entries
+    loaded from storage are kept in their storage representation and only
+    turned into DeletedRegistryEntry objects on first access. Entries which
+    were never accessed are saved back as they were loaded.
+    """
+
+    data: dict[tuple[str, str, str], DeletedRegistryEntry]
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._stored: dict[tuple[str, str, str], dict[str, Any]] = {}
+
+    def add_stored(self, key: tuple[str, str, str], entity: dict[str, Any]) -> None:
+        """Add an entry in its storage representation."""
+        self.data.pop(key, None)
+        self._stored[key] = entity
+
+    def __getitem__(self, key: tuple[str, str, str]) -> DeletedRegistryEntry:
+        """Get an entry, creating it from storage if needed."""
+        if (entity := self._stored.pop(key, None)) is not None:
+            self.data[key] = _deleted_entry_from_storage(entity)
+        return self.data[key]
+
+    def __setitem__(
+        self, key: tuple[str, str, str], entry: DeletedRegistryEntry
+    ) -> None:
+        """Add an item."""
+        self._stored.pop(key, None)
+        self.data[key] = entry
+
+    def __delitem__(self, key: tuple[str, str, str]) -> None:
+        """Remove an item."""
+        if self._stored.pop(key, None) is None:
+            del self.data[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Return if the key is in the container."""
+        return key in self.data or key in self._stored
+
+    def __iter__(self) -> Iterator[tuple[str, str, str]]:
+        """Iterate over a snapshot of the keys.
+
+        Accessing an entry moves it between the internal dicts,
+        so the keys are copied before iterating.
+        """
+        return iter([*self.data, *self._stored])
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.data) + len(self._stored)
+
+    def get_keys_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[tuple[str, str, str]]:
+        """Get keys of entries for config entry."""
+        return [
+            key
+            for key, entry in self.data.items()
+            if entry.config_entry_id == config_entry_id
+        ] + [
+            key
+            for key, entity in self._stored.items()
+            if entity["config_entry_id"] == config_entry_id
+        ]
+
+    def get_keys_orphaned_before(self, timestamp: float) -> list[tuple[str, str, str]]:
+        """Get keys of entries which became orphaned before timestamp."""
+        return [
+            key
+            for key, entry in self.data.items()
+            if (orphaned_timestamp := entry.orphaned_timestamp) is not None
+            and orphaned_timestamp < timestamp
+        ] + [
+            key
+            for key, entity in self._stored.items()
+            if (orphaned_timestamp := entity["orphaned_timestamp"]) is not None
+            and orphaned_timestamp < timestamp
+        ]
+
+    def storage_fragments(self) -> list[json_fragment | dict[str, Any]]:
+        """Return the entries in their storage representation."""
+        return [
+            *(entry.as_storage_fragment for entry in self.data.values()),
+            *self._stored.values(),
+        ]
+
+
 class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
@@ -550,55 +707,175 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
     Maintains six additional indexes:
-    - id -> entry
+    - id -> entity_id
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> dict[key, True]
     - device_id -> dict[key, True]
     - area_id -> dict[key, True]
     - label -> dict[key, True]
+
+    Entries loaded from storage are indexed from their storage representation
+    and only turned into RegistryEntry objects on first access. Entries which
+    were never accessed are saved back as they were loaded.
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
-        self._entry_ids: dict[str, RegistryEntry] = {}
+        self._stored: dict[str, dict[str, Any]] = {}
+        self._entry_ids: dict[str, str] = {}
         self._index: dict[tuple[str, str, str], str] = {}
         self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
 
+    def add_stored(self, key: str, domain: str, entity: dict[str, Any]) -> None:
+        """Add an entry in its storage representation."""
+        if key in self.data or key in self._stored:
+            self._unindex_entry(key)
+            self.data.pop(key, None)
+        self._stored[key] = entity
+        self._index_values(
+            key,
+            entity["id"],
+            (domain, entity["platform"], entity["unique_id"]),
+            entity["config_entry_id"],
+            entity["device_id"],
+            entity["area_id"],
+            entity["labels"],
+        )
+
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
-        self._entry_ids[entry.id] = entry
-        self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._index_values(
+            key,
+            entry.id,
+            (entry.domain, entry.platform, entry.unique_id),
+            entry.config_entry_id,
+            entry.device_id,
+            entry.area_id,
+            entry.labels,
+        )
+
+    def _index_values(
+        self,
+        key: str,
+        entry_id: str,
+        index_key: tuple[str, str, str],
+        config_entry_id: str | None,
+        device_id: str | None,
+        area_id: str | None,
+        labels: Iterable[str],
+    ) -> None:
+        """Index the values of an entry."""
+        self._entry_ids[entry_id] = key
+        self._index[index_key] = key
         # python has no ordered set, so we use a dict with True values
         # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
-        if (config_entry_id := entry.config_entry_id) is not None:
+        if config_entry_id is not None:
             self._config_entry_id_index[config_entry_id][key] = True
-        if (device_id := entry.device_id) is not None:
+        if device_id is not None:
             self._device_id_index[device_id][key] = True
-        if (area_id := entry.area_id) is not None:
+        if area_id is not None:
             self._area_id_index[area_id][key] = True
-        for label in entry.labels:
+        for label in labels:
             self._labels_index[label][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
     ) -> None:
         """Unindex an entry."""
-        entry = self.data[key]
-        del self._entry_ids[entry.id]
-        del self._index[(entry.domain, entry.platform, entry.unique_id)]
-        if config_entry_id := entry.config_entry_id:
+        if (entity := self._stored.get(key)) is not None:
+            entry_id: str = entity["id"]
+            index_key = (
+                split_entity_id(key)[0],
+                entity["platform"],
+                entity["unique_id"],
+            )
+            config_entry_id: str | None = entity["config_entry_id"]
+            device_id: str | None = entity["device_id"]
+            area_id: str | None = entity["area_id"]
+            labels: Iterable[str] = entity["labels"]
+        else:
+            entry = self.data[key]
+            entry_id = entry.id
+            index_key = (entry.domain, entry.platform, entry.unique_id)
+            config_entry_id = entry.config_entry_id
+            device_id = entry.device_id
+            area_id = entry.area_id
+            labels = entry.labels
+        del self._entry_ids[entry_id]
+        del self._index[index_key]
+        if config_entry_id:
             self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
-        if device_id := entry.device_id:
+        if device_id:
             self._unindex_entry_value(key, device_id, self._device_id_index)
-        if area_id := entry.area_id:
+        if area_id:
             self._unindex_entry_value(key, area_id, self._area_id_index)
-        if labels := entry.labels:
-            for label in labels:
-                self._unindex_entry_value(key, label, self._labels_index)
+        for label in labels:
+            self._unindex_entry_value(key, label, self._labels_index)
+
+    def __getitem__(self, key: str) -> RegistryEntry:
+        """Get an entry, creating it from storage if needed."""
+        if (entity := self._stored.pop(key, None)) is not None:
+            self.data[key] = _entry_from_storage(entity)
+        return self.data[key]
+
+    def __setitem__(self, key: str, entry: RegistryEntry) -> None:
+        """Add an item."""
+        if key in self.data or key in self._stored:
+            self._unindex_entry(key, entry)
+            self._stored.pop(key, None)
+        self.data[key] = entry
+        self._index_entry(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        self._unindex_entry(key)
+        if self._stored.pop(key, None) is None:
+            del self.data[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Return if the key is in the container."""
+        return key in self.data or key in self._stored
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over a snapshot of the keys.
+
+        Accessing an entry moves it between the internal dicts,
+        so the keys are copied before iterating.
+        """
+        return iter([*self.data, *self._stored])
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.data) + len(self._stored)
+
+    def _create_stored(self) -> None:
+        """Create all entries which are still in their storage representation."""
+        if stored := self._stored:
+            data = self.data
+            for key, entity in stored.items():
+                data[key] = _entry_from_storage(entity)
+            stored.clear()
+
+    def values(self) -> ValuesView[RegistryEntry]:
+        """Return the underlying values to avoid __iter__ overhead."""
+        self._create_stored()
+        return self.data.values()
+
+    def items(self) -> ItemsView[str, RegistryEntry]:
+        """Return the underlying items to avoid __iter__ overhead."""
+        self._create_stored()
+        return self.data.items()
+
+    def storage_fragments(self) -> list[json_fragment | dict[str, Any]]:
+        """Return the entries in their storage representation."""
+        return [
+            *(entry.as_storage_fragment for entry in self.data.values()),
+            *self._stored.values(),
+        ]
 
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
@@ -610,37 +887,35 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
 
     def get_entry(self, key: str) -> RegistryEntry | None:
         """Get entry from id."""
-        return self._entry_ids.get(key)
+        if (entity_id := self._entry_ids.get(key)) is None:
+            return None
+        return self[entity_id]
 
     def get_entries_for_device_id(
         self, device_id: str, include_disabled_entities: bool = False
     ) -> list[RegistryEntry]:
         """Get entries for device."""
-        data = self.data
         return [
             entry
             for key in self._device_id_index.get(device_id, ())
-            if not (entry := data[key]).disabled_by or include_disabled_entities
+            if not (entry := self[key]).disabled_by or include_disabled_entities
         ]
 
     def get_entries_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[RegistryEntry]:
         """Get entries for config entry."""
-        data = self.data
         return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+            self[key] for key in self._config_entry_id_index.get(config_entry_id, ())
         ]
 
     def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
         """Get entries for area."""
-        data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        return [self[key] for key in self._area_id_index.get(area_id, ())]
 
     def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
         """Get entries for label."""
-        data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return [self[key] for key in self._labels_index.get(label, ())]
 
 
 def _validate_item(
@@ -700,7 +975,7 @@ def _validate_item(
 class EntityRegistry(BaseRegistry):
     """Class to hold a registry of entities."""
 
-    deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry]
+    deleted_entities: DeletedEntityRegistryItems
     entities: EntityRegistryItems
     _entities_data: dict[str, RegistryEntry]
 
@@ -712,6 +987,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_VERSION_MAJOR,
             STORAGE_KEY,
             atomic_writes=True,
+            journal=True,
             minor_version=STORAGE_VERSION_MINOR,
         )
         self.hass.bus.async_listen(
@@ -729,11 +1005,15 @@ class EntityRegistry(BaseRegistry):
         """Get EntityEntry for an entity_id or entity entry id.
 
         We retrieve the RegistryEntry from the underlying dict to avoid
-        the overhead of the UserDict __getitem__.
+        the overhead of the UserDict __getitem__ for entries which were
+        already created.
         """
-        return self._entities_data.get(entity_id_or_uuid) or self.entities.get_entry(
-            entity_id_or_uuid
-        )
+        if (entry := self._entities_data.get(entity_id_or_uuid)) is not None:
+            return entry
+        entities = self.entities
+        if entity_id_or_uuid in entities:
+            return entities[entity_id_or_uuid]
+        return entities.get_entry(entity_id_or_uuid)
 
     @callback
     def async_get_entity_id(
@@ -1260,7 +1540,7 @@ class EntityRegistry(BaseRegistry):
 
         data = await self._store.async_load()
         entities = EntityRegistryItems()
-        deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
+        deleted_entities = DeletedEntityRegistryItems()
 
         if data is not None:
             for entity in data["entities"]:
@@ -1289,42 +1569,8 @@ class EntityRegistry(BaseRegistry):
                     )
                     continue
 
-                entities[entity["entity_id"]] = RegistryEntry(
-                    aliases=set(entity["aliases"]),
-                    area_id=entity["area_id"],
-                    categories=entity["categories"],
-                    capabilities=entity["capabilities"],
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    device_class=entity["device_class"],
-                    device_id=entity["device_id"],
-                    disabled_by=RegistryEntryDisabler(entity["disabled_by"])
-                    if entity["disabled_by"]
-                    else None,
-                    entity_category=EntityCategory(entity["entity_category"])
-                    if entity["entity_category"]
-                    else None,
-                    entity_id=entity["entity_id"],
-                    hidden_by=RegistryEntryHider(entity["hidden_by"])
-                    if entity["hidden_by"]
-                    else None,
-                    icon=entity["icon"],
-                    id=entity["id"],
-                    has_entity_name=entity["has_entity_name"],
-                    labels=set(entity["labels"]),
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    name=entity["name"],
-                    options=entity["options"],
-                    original_device_class=entity["original_device_class"],
-                    original_icon=entity["original_icon"],
-                    original_name=entity["original_name"],
-                    platform=entity["platform"],
-                    supported_features=entity["supported_features"],
-                    translation_key=entity["translation_key"],
-                    unique_id=entity["unique_id"],
-                    previous_unique_id=entity["previous_unique_id"],
-                    unit_of_measurement=entity["unit_of_measurement"],
-                )
+                # Entries are created on first access
+                entities.add_stored(entity["entity_id"], domain, entity)
             for entity in data["deleted_entities"]:
                 try:
                     domain = split_entity_id(entity["entity_id"])[0]
@@ -1337,20 +1583,9 @@ class EntityRegistry(BaseRegistry):
                     )
                 except (TypeError, ValueError):
                     continue
-                key = (
-                    split_entity_id(entity["entity_id"])[0],
-                    entity["platform"],
-                    entity["unique_id"],
-                )
-                deleted_entities[key] = DeletedRegistryEntry(
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    entity_id=entity["entity_id"],
-                    id=entity["id"],
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    orphaned_timestamp=entity["orphaned_timestamp"],
-                    platform=entity["platform"],
-                    unique_id=entity["unique_id"],
+                # Deleted entries are created on first access
+                deleted_entities.add_stored(
+                    (domain, entity["platform"], entity["unique_id"]), entity
                 )
 
         self.deleted_entities = deleted_entities
@@ -1361,10 +1596,8 @@ class EntityRegistry(BaseRegistry):
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
         return {
-            "entities": [entry.as_storage_fragment for entry in self.entities.values()],
-            "deleted_entities": [
-                entry.as_storage_fragment for entry in self.deleted_entities.values()
-            ],
+            "entities": self.entities.storage_fragments(),
+            "deleted_entities": self.deleted_entities.storage_fragments(),
         }
 
     @callback
@@ -1393,9 +1626,8 @@ class EntityRegistry(BaseRegistry):
             for entry in self.entities.get_entries_for_config_entry_id(config_entry_id)
         ]:
             self.async_remove(entity_id)
-        for key, deleted_entity in list(self.deleted_entities.items()):
-            if config_entry_id != deleted_entity.config_entry_id:
-                continue
+        for key in self.deleted_entities.get_keys_for_config_entry_id(config_entry_id):
+            deleted_entity = self.deleted_entities[key]
             # Add a time stamp when the deleted entity became orphaned
             self.deleted_entities[key] = attr.evolve(
                 deleted_entity, orphaned_timestamp=now_time, config_entry_id=None
@@ -1410,13 +1642,11 @@ class EntityRegistry(BaseRegistry):
         growing without bound.
         """
         now_time = time.time()
-        for key, deleted_entity in list(self.deleted_entities.items()):
-            if (orphaned_timestamp := deleted_entity.orphaned_timestamp) is None:
-                continue
-
-            if orphaned_timestamp + ORPHANED_ENTITY_KEEP_SECONDS < now_time:
-                self.deleted_entities.pop(key)
-                self.async_schedule_save()
+        for key in self.deleted_entities.get_keys_orphaned_before(
+            now_time - ORPHANED_ENTITY_KEEP_SECONDS
+        ):
+            del self.deleted_entities[key]
+            self.async_schedule_save()
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
@@ -1606,9 +1836,10 @@ def _async_setup_entity_restore(hass: HomeAssistant, registry: EntityRegistry) -
     def _write_unavailable_states(_: Event) -> None:
         """Make sure state machine contains entry for each registered entity."""
         existing = set(hass.states.async_entity_ids())
+        entities = registry.entities
 
-        for entry in registry.entities.values():
-            if entry.entity_id in existing or entry.disabled:
+        for entity_id in entities:
+            if entity_id in existing or (entry := entities[entity_id]).disabled:
                 continue
 
             entry.write_unavailable_state(hass)
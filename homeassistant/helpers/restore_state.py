@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 import logging
 from typing import Any, Self, cast
 
+from propcache import cached_property
+
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, State, callback, valid_entity_id
 from homeassistant.exceptions import HomeAssistantError
@@ -18,7 +20,7 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -35,6 +37,10 @@ STATE_DUMP_INTERVAL = timedelta(minutes=15)
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
+# How long the last seen time of an entity whose state did not change is kept
+# before it is updated, this allows unchanged states to be skipped when dumping
+LAST_SEEN_UPDATE_INTERVAL = timedelta(days=1)
+
 
 class ExtraStoredData(ABC):
     """Object to hold extra stored data."""
@@ -81,6 +87,11 @@ class StoredState:
             "last_seen": self.last_seen,
         }
 
+    @cached_property
+    def json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the stored state."""
+        return json_fragment(json_bytes(self.as_dict()))
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Self:
         """Initialize a stored state from a dict."""
@@ -96,6 +107,41 @@ class StoredState:
         )
 
 
+class RestoredStoredState(StoredState):
+    """Object to represent a stored state loaded from storage.
+
+    The state and extra data are only decoded when accessed.
+    """
+
+    def __init__(self, json_dict: dict[str, Any]) -> None:
+        """Initialize a stored state from its storage representation."""
+        self.json_dict = json_dict
+
+    @cached_property
+    def state(self) -> State:  # type: ignore[override]
+        """Return the stored state."""
+        return cast(State, State.from_dict(self.json_dict["state"]))
+
+    @cached_property
+    def extra_data(self) -> ExtraStoredData | None:  # type: ignore[override]
+        """Return the stored extra data."""
+        if extra_data_dict := self.json_dict.get("extra_data"):
+            return RestoredExtraData(extra_data_dict)
+        return None
+
+    @cached_property
+    def last_seen(self) -> datetime:  # type: ignore[override]
+        """Return when the entity was last seen."""
+        last_seen = self.json_dict["last_seen"]
+        if isinstance(last_seen, str):
+            return cast(datetime, dt_util.parse_datetime(last_seen))
+        return cast(datetime, last_seen)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the stored state to be JSON serialized."""
+        return self.json_dict
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -108,6 +154,15 @@ def async_get(hass: HomeAssistant) -> RestoreStateData:
     return RestoreStateData(hass)
 
 
+def _extra_data_changed(
+    old_extra_data: ExtraStoredData | None, new_extra_data: ExtraStoredData | None
+) -> bool:
+    """Return if the extra data changed."""
+    if old_extra_data is None or new_extra_data is None:
+        return old_extra_data is not new_extra_data
+    return old_extra_data.as_dict() != new_extra_data.as_dict()
+
+
 class RestoreStateData:
     """Helper class for managing the helper saved data."""
 
@@ -134,11 +189,12 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+        self.store = Store[list[Any]](
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        self._last_stored_states: dict[str, StoredState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -163,8 +219,9 @@ class RestoreStateData:
             _LOGGER.debug("Not creating cache - no saved states found")
             self.last_states = {}
         else:
+            # Stored states are decoded when an entity asks for them
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+                item["state"]["entity_id"]: RestoredStoredState(item)
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
@@ -177,6 +234,10 @@ class RestoreStateData:
         This includes the states of all registered entities, as well as the
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
+
+        The stored state of an entity whose state and extra data did not
+        change since the last call is reused, so it does not have to be
+        serialized again, unless its last seen time is due for an update.
         """
         now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
@@ -188,15 +249,24 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                current_states_by_entity_id[entity_id],
-                entity.extra_restore_state_data,
-                now,
-            )
-            for entity_id, entity in self.entities.items()
-            if entity_id in current_states_by_entity_id
-        ]
+        last_stored_states = self._last_stored_states
+        current_stored_states: dict[str, StoredState] = {}
+        last_seen_update_time = now - LAST_SEEN_UPDATE_INTERVAL
+        for entity_id, entity in self.entities.items():
+            if (state := current_states_by_entity_id.get(entity_id)) is None:
+                continue
+            extra_data = entity.extra_restore_state_data
+            if (
+                (last_stored_state := last_stored_states.get(entity_id)) is None
+                or last_stored_state.state is not state
+                or last_stored_state.last_seen < last_seen_update_time
+                or _extra_data_changed(last_stored_state.extra_data, extra_data)
+            ):
+                last_stored_state = StoredState(state, extra_data, now)
+            current_stored_states[entity_id] = last_stored_state
+        self._last_stored_states = current_stored_states
+
+        stored_states = list(current_stored_states.values())
         expiration_time = now - STATE_EXPIRATION
 
         for entity_id, stored_state in self.last_states.items():
@@ -218,12 +288,9 @@ class RestoreStateData:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            # The stored states are serialized through their cached
+            # json_fragment, and only changed ones are written to the journal
+            await self.store.async_save(self.async_get_stored_states())
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
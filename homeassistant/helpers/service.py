@@ -11,12 +11,14 @@ import logging
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_CONTROL
 from homeassistant.const import (
     ATTR_AREA_ID,
     ATTR_DEVICE_ID,
+    ATTR_DOMAIN,
     ATTR_ENTITY_ID,
     ATTR_FLOOR_ID,
     ATTR_LABEL_ID,
@@ -28,13 +30,17 @@ from homeassistant.const import (
     CONF_TARGET,
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
 )
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
+    Service,
     ServiceCall,
     ServiceResponse,
     SupportsResponse,
@@ -63,11 +69,13 @@ from . import (
     translation,
 )
 from .group import expand_entity_ids
+from .json import json_bytes, json_fragment
 from .selector import TargetSelector
 from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
     from .entity import Entity
+    from .entity_platform import BatchServiceHandler, EntityPlatform
 
 CONF_SERVICE_ENTITY_ID = "entity_id"
 
@@ -76,9 +84,13 @@ _LOGGER = logging.getLogger(__name__)
 SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]] = (
     HassKey("service_description_cache")
 )
-ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
-    tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
-] = HassKey("all_service_descriptions_cache")
+ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[AllServiceDescriptions] = HassKey(
+    "all_service_descriptions_cache"
+)
+TARGET_RESOLUTION_CACHE: HassKey[TargetResolutionCache] = HassKey(
+    "target_resolution_cache"
+)
+TARGET_RESOLUTION_CACHE_SIZE = 256
 
 
 @cache
@@ -502,7 +514,7 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
 
 
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -526,15 +538,105 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
-    dev_reg = device_registry.async_get(hass)
-    area_reg = area_registry.async_get(hass)
+    resolved = _async_get_target_resolution_cache(hass).async_resolve(selector)
+    # The resolved targets are cached, so only copy from them
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
 
-    if selector.floor_ids:
-        floor_reg = floor_registry.async_get(hass)
-        for floor_id in selector.floor_ids:
-            if floor_id not in floor_reg.floors:
-                selected.missing_floors.add(floor_id)
+
+class TargetResolutionCache:
+    """Cache of device, area, floor and label targets resolved to entities.
+
+    Resolved targets are keyed by the targeted ids and a generation which
+    is bumped whenever one of the registries is updated, so outdated entries
+    are never returned and age out of the LRU.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._generation = 0
+        self._registries: tuple[Any, ...] = ()
+        self._resolved: LRU[tuple[Any, ...], SelectedEntities] = LRU(
+            TARGET_RESOLUTION_CACHE_SIZE
+        )
+        for event_type in (
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+        ):
+            hass.bus.async_listen(event_type, self._async_registry_updated)
+
+    @callback
+    def _async_registry_updated(self, event: Event[Any]) -> None:
+        """Invalidate the resolved targets."""
+        self._generation += 1
+
+    @callback
+    def async_get_stats(self) -> tuple[int, int]:
+        """Return the number of cache hits and misses."""
+        return self._resolved.get_stats()
+
+    @callback
+    def async_resolve(self, selector: ServiceTargetSelector) -> SelectedEntities:
+        """Resolve the device, area, floor and label ids of a target selector."""
+        hass = self._hass
+        registries = (
+            entity_registry.async_get(hass),
+            device_registry.async_get(hass),
+            area_registry.async_get(hass),
+            floor_registry.async_get(hass),
+            label_registry.async_get(hass),
+        )
+        if registries != self._registries:
+            # The registries were replaced, which does not fire events
+            self._registries = registries
+            self._generation += 1
+        key = (
+            self._generation,
+            frozenset(selector.device_ids),
+            frozenset(selector.area_ids),
+            frozenset(selector.floor_ids),
+            frozenset(selector.label_ids),
+        )
+        if (resolved := self._resolved.get(key)) is None:
+            resolved = self._resolved[key] = _async_resolve_registry_targets(
+                selector, *registries
+            )
+        return resolved
+
+
+@callback
+def _async_get_target_resolution_cache(hass: HomeAssistant) -> TargetResolutionCache:
+    """Return the target resolution cache."""
+    if (cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        cache = hass.data[TARGET_RESOLUTION_CACHE] = TargetResolutionCache(hass)
+    return cache
+
+
+def _async_resolve_registry_targets(
+    selector: ServiceTargetSelector,
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+    floor_reg: floor_registry.FloorRegistry,
+    label_reg: label_registry.LabelRegistry,
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label ids of a target selector."""
+    selected = SelectedEntities()
+    entities = ent_reg.entities
+
+    for floor_id in selector.floor_ids:
+        if floor_id not in floor_reg.floors:
+            selected.missing_floors.add(floor_id)
 
     for area_id in selector.area_ids:
         if area_id not in area_reg.areas:
@@ -544,24 +646,19 @@ def async_extract_referenced_entity_ids(  # noqa: C901
         if device_id not in dev_reg.devices:
             selected.missing_devices.add(device_id)
 
-    if selector.label_ids:
-        label_reg = label_registry.async_get(hass)
-        for label_id in selector.label_ids:
-            if label_id not in label_reg.labels:
-                selected.missing_labels.add(label_id)
+    for label_id in selector.label_ids:
+        if label_id not in label_reg.labels:
+            selected.missing_labels.add(label_id)
 
-            for entity_entry in entities.get_entries_for_label(label_id):
-                if (
-                    entity_entry.entity_category is None
-                    and entity_entry.hidden_by is None
-                ):
-                    selected.indirectly_referenced.add(entity_entry.entity_id)
+        for entity_entry in entities.get_entries_for_label(label_id):
+            if entity_entry.entity_category is None and entity_entry.hidden_by is None:
+                selected.indirectly_referenced.add(entity_entry.entity_id)
 
-            for device_entry in dev_reg.devices.get_devices_for_label(label_id):
-                selected.referenced_devices.add(device_entry.id)
+        for device_entry in dev_reg.devices.get_devices_for_label(label_id):
+            selected.referenced_devices.add(device_entry.id)
 
-            for area_entry in area_reg.areas.get_areas_for_label(label_id):
-                selected.referenced_areas.add(area_entry.id)
+        for area_entry in area_reg.areas.get_areas_for_label(label_id):
+            selected.referenced_areas.add(area_entry.id)
 
     # Find areas for targeted floors
     if selector.floor_ids:
@@ -682,43 +779,188 @@ def async_get_cached_service_description(
     return hass.data.get(SERVICE_DESCRIPTION_CACHE, {}).get((domain, service))
 
 
+class AllServiceDescriptions:
+    """Descriptions of all services, rebuilt per domain.
+
+    Domains are marked as changed when their services are registered or
+    removed, so only the descriptions and the JSON of these domains have to
+    be rebuilt.
+    """
+
+    __slots__ = ("_json", "_json_fragments", "changed_domains", "descriptions")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the descriptions and track the service changes."""
+        self.descriptions: dict[str, dict[str, Any]] = {}
+        self.changed_domains: set[str] = set(hass.services.async_services_internal())
+        self._json_fragments: dict[str, json_fragment] = {}
+        self._json: bytes | None = None
+        for event_type in (EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED):
+            hass.bus.async_listen(event_type, self._async_service_changed)
+
+    @callback
+    def _async_service_changed(self, event: Event) -> None:
+        """Mark the domain of a registered or removed service as changed."""
+        self.changed_domains.add(event.data[ATTR_DOMAIN])
+
+    @callback
+    def async_update_domains(
+        self, domain_descriptions: dict[str, dict[str, Any] | None]
+    ) -> None:
+        """Replace the descriptions of domains, None removes a domain."""
+        descriptions = self.descriptions.copy()
+        for domain, services in domain_descriptions.items():
+            self._json_fragments.pop(domain, None)
+            if services is None:
+                descriptions.pop(domain, None)
+            else:
+                descriptions[domain] = services
+        # Callers may still hold the previous descriptions,
+        # so they are replaced instead of being updated in place.
+        self.descriptions = descriptions
+        self._json = None
+
+    @callback
+    def async_get_json(self) -> bytes:
+        """Return the descriptions as JSON.
+
+        The JSON of each domain is kept until the domain changes.
+        """
+        if self._json is None:
+            fragments = self._json_fragments
+            for domain, services in self.descriptions.items():
+                if domain not in fragments:
+                    fragments[domain] = json_fragment(json_bytes(services))
+            self._json = json_bytes(
+                {domain: fragments[domain] for domain in self.descriptions}
+            )
+        return self._json
+
+
+@callback
+def _async_build_description(
+    domain: str,
+    service_name: str,
+    service: Service,
+    yaml_description: dict[str, Any],
+    translations: dict[str, Any],
+) -> dict[str, Any]:
+    """Build the description of a service from its YAML and translations."""
+    # Don't warn for missing services, because it triggers false
+    # positives for things like scripts, that register as a service
+    #
+    # When name & description are in the translations use those;
+    # otherwise fallback to backwards compatible behavior from
+    # the time when we didn't have translations for descriptions yet.
+    # This mimics the behavior of the frontend.
+    description = {
+        "name": translations.get(
+            f"component.{domain}.services.{service_name}.name",
+            yaml_description.get("name", ""),
+        ),
+        "description": translations.get(
+            f"component.{domain}.services.{service_name}.description",
+            yaml_description.get("description", ""),
+        ),
+        "fields": dict(yaml_description.get("fields", {})),
+    }
+
+    # Translate fields names & descriptions as well
+    for field_name, field_schema in description["fields"].items():
+        if name := translations.get(
+            f"component.{domain}.services.{service_name}.fields.{field_name}.name"
+        ):
+            field_schema["name"] = name
+        if desc := translations.get(
+            f"component.{domain}.services.{service_name}.fields.{field_name}.description"
+        ):
+            field_schema["description"] = desc
+        if example := translations.get(
+            f"component.{domain}.services.{service_name}.fields.{field_name}.example"
+        ):
+            field_schema["example"] = example
+
+    if "target" in yaml_description:
+        description["target"] = yaml_description["target"]
+
+    response = service.supports_response
+    if response is not SupportsResponse.NONE:
+        description["response"] = {
+            "optional": response is SupportsResponse.OPTIONAL,
+        }
+
+    return description
+
+
+@callback
+def _async_get_all_service_descriptions(hass: HomeAssistant) -> AllServiceDescriptions:
+    """Return the descriptions of all services, tracking the service changes."""
+    if (all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE)) is None:
+        all_cache = hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE] = AllServiceDescriptions(
+            hass
+        )
+    return all_cache
+
+
 @bind_hass
 async def async_get_all_descriptions(
     hass: HomeAssistant,
 ) -> dict[str, dict[str, Any]]:
     """Return descriptions (i.e. user documentation) for all service calls."""
+    all_cache = _async_get_all_service_descriptions(hass)
+    # If no services changed since the last call, we can return the cache
+    if not (changed_domains := all_cache.changed_domains):
+        return all_cache.descriptions
+    all_cache.changed_domains = set()
+
+    try:
+        domain_descriptions = await _async_get_domain_descriptions(
+            hass, changed_domains
+        )
+    except BaseException:
+        all_cache.changed_domains |= changed_domains
+        raise
+
+    all_cache.async_update_domains(domain_descriptions)
+    return all_cache.descriptions
+
+
+@bind_hass
+async def async_get_all_descriptions_json(hass: HomeAssistant) -> bytes:
+    """Return JSON of descriptions (i.e. user documentation) for all service calls."""
+    await async_get_all_descriptions(hass)
+    return hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE].async_get_json()
+
+
+async def _async_get_domain_descriptions(
+    hass: HomeAssistant, domains: set[str]
+) -> dict[str, dict[str, Any] | None]:
+    """Return the descriptions of the services of domains.
+
+    None is returned for the domains without services.
+    """
     descriptions_cache = hass.data.setdefault(SERVICE_DESCRIPTION_CACHE, {})
 
     # We don't mutate services here so we avoid calling
     # async_services which makes a copy of every services
     # dict.
-    services = hass.services.async_services_internal()
-
-    # See if there are new services not seen before.
-    # Any service that we saw before already has an entry in description_cache.
-    all_services = {
-        (domain, service_name)
-        for domain, services_by_domain in services.items()
-        for service_name in services_by_domain
+    all_services = hass.services.async_services_internal()
+    # We must make a copy in case new services get added
+    # while we are loading the missing ones so we do not
+    # add the new ones to the cache without their descriptions
+    services = {
+        domain: all_services[domain].copy()
+        for domain in domains
+        if domain in all_services
     }
-    # If we have a complete cache, check if it is still valid
-    all_cache: tuple[set[tuple[str, str]], dict[str, dict[str, Any]]] | None
-    if all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE):
-        previous_all_services, previous_descriptions_cache = all_cache
-        # If the services are the same, we can return the cache
-        if previous_all_services == all_services:
-            return previous_descriptions_cache
 
     # Files we loaded for missing descriptions
     loaded: dict[str, JSON_TYPE] = {}
-    # We try to avoid making a copy in the event the cache is good,
-    # but now we must make a copy in case new services get added
-    # while we are loading the missing ones so we do not
-    # add the new ones to the cache without their descriptions
-    services = {domain: service.copy() for domain, service in services.items()}
-
     if domains_with_missing_services := {
-        domain for domain, _ in all_services.difference(descriptions_cache)
+        domain
+        for domain, services_map in services.items()
+        for service_name in services_map
+        if (domain, service_name) not in descriptions_cache
     }:
         ints_or_excs = await async_get_integrations(hass, domains_with_missing_services)
         integrations: list[Integration] = []
@@ -742,10 +984,9 @@ async def async_get_all_descriptions(
     )
 
     # Build response
-    descriptions: dict[str, dict[str, Any]] = {}
+    descriptions: dict[str, dict[str, Any] | None] = dict.fromkeys(domains)
     for domain, services_map in services.items():
-        descriptions[domain] = {}
-        domain_descriptions = descriptions[domain]
+        descriptions[domain] = domain_descriptions = {}
 
         for service_name, service in services_map.items():
             cache_key = (domain, service_name)
@@ -764,55 +1005,13 @@ async def async_get_all_descriptions(
             yaml_description = (
                 domain_yaml.get(service_name) or {}  # type: ignore[union-attr]
             )
-
-            # Don't warn for missing services, because it triggers false
-            # positives for things like scripts, that register as a service
-            #
-            # When name & description are in the translations use those;
-            # otherwise fallback to backwards compatible behavior from
-            # the time when we didn't have translations for descriptions yet.
-            # This mimics the behavior of the frontend.
-            description = {
-                "name": translations.get(
-                    f"component.{domain}.services.{service_name}.name",
-                    yaml_description.get("name", ""),
-                ),
-                "description": translations.get(
-                    f"component.{domain}.services.{service_name}.description",
-                    yaml_description.get("description", ""),
-                ),
-                "fields": dict(yaml_description.get("fields", {})),
-            }
-
-            # Translate fields names & descriptions as well
-            for field_name, field_schema in description["fields"].items():
-                if name := translations.get(
-                    f"component.{domain}.services.{service_name}.fields.{field_name}.name"
-                ):
-                    field_schema["name"] = name
-                if desc := translations.get(
-                    f"component.{domain}.services.{service_name}.fields.{field_name}.description"
-                ):
-                    field_schema["description"] = desc
-                if example := translations.get(
-                    f"component.{domain}.services.{service_name}.fields.{field_name}.example"
-                ):
-                    field_schema["example"] = example
-
-            if "target" in yaml_description:
-                description["target"] = yaml_description["target"]
-
-            response = service.supports_response
-            if response is not SupportsResponse.NONE:
-                description["response"] = {
-                    "optional": response is SupportsResponse.OPTIONAL,
-                }
-
+            description = _async_build_description(
+                domain, service_name, service, yaml_description, translations
+            )
             descriptions_cache[cache_key] = description
 
             domain_descriptions[service_name] = description
 
-    hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE] = (all_services, descriptions)
     return descriptions
 
 
@@ -853,8 +1052,9 @@ def async_set_service_schema(
             "optional": response == SupportsResponse.OPTIONAL,
         }
 
-    hass.data.pop(ALL_SERVICE_DESCRIPTIONS_CACHE, None)
     descriptions_cache[(domain, service)] = description
+    if (all_cache := hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE)) is not None:
+        all_cache.changed_domains.add(domain)
 
 
 def _get_permissible_entity_candidates(
@@ -990,6 +1190,19 @@ async def entity_service_call(
             )
         return None
 
+    # Only services calling an entity method with the service data are batched,
+    # a service function may process the service data for each entity
+    if (
+        isinstance(data, dict)
+        and not return_response
+        and len(entities) > 1
+        and (batches := _get_batched_entities(entities, call))
+    ):
+        await _async_handle_batched_entity_calls(
+            hass, entities, batches, func, data, call
+        )
+        return None
+
     if len(entities) == 1:
         # Single entity case avoids creating task
         entity = entities[0]
@@ -1021,6 +1234,83 @@ async def entity_service_call(
             raise result from None
         response_data[entity.entity_id] = result
 
+    await _async_update_polling_entities(entities, call.context)
+
+    return response_data if return_response and response_data else None
+
+
+def _get_batched_entities(
+    entities: list[Entity], call: ServiceCall
+) -> dict[EntityPlatform, list[Entity]]:
+    """Return the entities by platform for platforms with a batch handler."""
+    key = (call.domain, call.service)
+    by_platform: dict[EntityPlatform, list[Entity]] = {}
+    for entity in entities:
+        if (platform := entity.platform) is not None and (
+            key in platform.batch_service_handlers
+        ):
+            by_platform.setdefault(platform, []).append(entity)
+    return {
+        platform: platform_entities
+        for platform, platform_entities in by_platform.items()
+        if len(platform_entities) > 1
+    }
+
+
+async def _async_handle_batched_entity_calls(
+    hass: HomeAssistant,
+    entities: list[Entity],
+    batches: dict[EntityPlatform, list[Entity]],
+    func: str | HassJob,
+    data: dict[str, Any],
+    call: ServiceCall,
+) -> None:
+    """Handle an entity service call with batch handlers.
+
+    Entities of platforms without a batch handler are called one by one.
+    """
+    key = (call.domain, call.service)
+    context = call.context
+    batched = {entity for batch in batches.values() for entity in batch}
+    calls: list[Coroutine[Any, Any, Any]] = [
+        batch[0].async_request_call(
+            _handle_batched_entity_call(
+                platform.batch_service_handlers[key],
+                {entity: data.copy() for entity in batch},
+                context,
+            )
+        )
+        for platform, batch in batches.items()
+    ]
+    calls.extend(
+        entity.async_request_call(
+            _handle_entity_call(hass, entity, func, data, context)
+        )
+        for entity in entities
+        if entity not in batched
+    )
+    for result in await asyncio.gather(*calls, return_exceptions=True):
+        if isinstance(result, BaseException):
+            raise result from None
+
+    await _async_update_polling_entities(entities, context)
+
+
+async def _handle_batched_entity_call(
+    handler: BatchServiceHandler,
+    entity_kwargs: dict[Entity, dict[str, Any]],
+    context: Context,
+) -> None:
+    """Call a batch service handler."""
+    for entity in entity_kwargs:
+        entity.async_set_context(context)
+    await handler(entity_kwargs)
+
+
+async def _async_update_polling_entities(
+    entities: list[Entity], context: Context
+) -> None:
+    """Update the state of polling entities after a service call."""
     tasks: list[asyncio.Task[None]] = []
 
     for entity in entities:
@@ -1029,7 +1319,7 @@ async def entity_service_call(
 
         # Context expires if the turn on commands took a long time.
         # Set context again so it's there when we update
-        entity.async_set_context(call.context)
+        entity.async_set_context(context)
         tasks.append(create_eager_task(entity.async_update_ha_state(True)))
 
     if tasks:
@@ -1038,8 +1328,6 @@ async def entity_service_call(
         for future in done:
             future.result()  # pop exception if have
 
-    return response_data if return_response and response_data else None
-
 
 async def _handle_entity_call(
     hass: HomeAssistant,
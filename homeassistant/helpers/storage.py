@@ -7,6 +7,7 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
@@ -30,9 +31,9 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
-from homeassistant.util import json as json_util
+from homeassistant.util import json as json_util, uuid as uuid_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
@@ -49,6 +50,8 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -227,6 +230,147 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+class _JournalState:
+    """State of a journaled store as written to disk.
+
+    Only a hash of each encoded item is kept to find the changed items on the
+    next save. Fragments are kept with their hash so unchanged fragments are
+    not encoded again, they are shared with the owner of the data.
+    """
+
+    __slots__ = ("journal_id", "hashes", "fragments", "base_size", "journal_size")
+
+    def __init__(
+        self,
+        journal_id: str,
+        encoded: _JournalEncoding,
+        base_size: int,
+        journal_size: int,
+    ) -> None:
+        """Initialize the journal state."""
+        self.journal_id = journal_id
+        self.hashes = encoded.hashes
+        self.fragments = encoded.fragments
+        self.base_size = base_size
+        self.journal_size = journal_size
+
+
+class _JournalEncoding:
+    """Data of a journaled store encoded for a single save.
+
+    The data is encoded per top level key, or under the None key if the
+    data itself is a list. Lists are encoded per item, unchanged fragments
+    are kept as is and only encoded when they are written.
+    """
+
+    __slots__ = ("hashes", "encoded", "fragments")
+
+    def __init__(self) -> None:
+        """Initialize the encoding."""
+        self.hashes: dict[str | None, int | list[int]] = {}
+        self.encoded: dict[
+            str | None, bytes | list[bytes | json_helper.json_fragment]
+        ] = {}
+        self.fragments: dict[int, tuple[json_helper.json_fragment, int]] = {}
+
+
+def _journal_item_bytes(items: list[bytes | json_helper.json_fragment]) -> bytes:
+    """Return the items joined for a journal record."""
+    return b",".join(
+        item if type(item) is bytes else json_helper.json_bytes(item) for item in items
+    )
+
+
+def _journal_splices(
+    key_prefix: bytes,
+    old: list[int],
+    new: list[int],
+    items: list[bytes | json_helper.json_fragment],
+) -> list[bytes]:
+    """Return the journal records to turn the old list into the new list.
+
+    Items are compared by the hashes of their encoding. Items between the
+    common prefix and suffix are written as a single splice, unless the list
+    kept its length, then each run of changed items is written as a splice
+    of its own.
+    """
+    start = 0
+    old_end = len(old)
+    new_end = len(new)
+    while start < old_end and start < new_end and old[start] == new[start]:
+        start += 1
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    if old_end != new_end:
+        runs = [(start, old_end, new_end)]
+    else:
+        runs = []
+        idx = start
+        while idx < new_end:
+            if old[idx] == new[idx]:
+                idx += 1
+                continue
+            run_start = idx
+            while idx < new_end and old[idx] != new[idx]:
+                idx += 1
+            runs.append((run_start, idx, idx))
+
+    return [
+        b'{%b"start":%d,"delete":%d,"items":[%b]}\n'
+        % (
+            key_prefix,
+            run_start,
+            old_run_end - run_start,
+            _journal_item_bytes(items[run_start:new_run_end]),
+        )
+        for run_start, old_run_end, new_run_end in runs
+    ]
+
+
+def _journal_records(
+    old: dict[str | None, int | list[int]], new: _JournalEncoding
+) -> list[bytes]:
+    """Return the journal records to turn the old data into the new data.
+
+    Unchanged values are skipped.
+    """
+    records: list[bytes] = [
+        b'{"key":%b,"removed":true}\n' % json_helper.json_bytes(key)
+        for key in old.keys() - new.hashes.keys()
+    ]
+    for key, value_hash in new.hashes.items():
+        if (old_hash := old.get(key)) == value_hash:
+            continue
+        key_prefix = b"" if key is None else b'"key":%b,' % json_helper.json_bytes(key)
+        value = new.encoded[key]
+        if not isinstance(value, list):
+            records.append(b'{%b"value":%b}\n' % (key_prefix, value))
+        elif isinstance(old_hash, list) and isinstance(value_hash, list):
+            records.extend(_journal_splices(key_prefix, old_hash, value_hash, value))
+        else:
+            records.append(
+                b'{%b"value":[%b]}\n' % (key_prefix, _journal_item_bytes(value))
+            )
+    return records
+
+
+def _apply_journal_record(data: dict[str, Any], record: dict[str, Any]) -> None:
+    """Apply a journal record to the data loaded from the store file."""
+    if "key" in record:
+        container, key = data["data"], record["key"]
+    else:
+        container, key = data, "data"
+    if "removed" in record:
+        container.pop(key, None)
+    elif "items" in record:
+        start = record["start"]
+        container[key][start : start + record["delete"]] = record["items"]
+    else:
+        container[key] = record["value"]
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -240,10 +384,19 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         *,
         atomic_writes: bool = False,
         encoder: type[JSONEncoder] | None = None,
+        journal: bool = False,
         minor_version: int = 1,
         read_only: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A journaled store appends the changed parts of the data to a journal
+        file next to the store file instead of rewriting the whole file on
+        every save, and compacts the journal into the store file once it has
+        grown larger than the store file. Lists, either the data itself or
+        its top level values, are journaled per item, which suits large stores
+        such as the registries where a save usually changes a few items.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -257,6 +410,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._journal = journal
+        self._journal_state: _JournalState | None = None
+        self._journal_compacted = True
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
 
@@ -265,6 +421,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -326,6 +487,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -387,6 +552,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             if data == {}:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -421,6 +590,38 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         return stored
 
+    def _replay_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the changes in the journal to the data loaded from the store file."""
+        try:
+            with open(self.journal_path, "rb") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return data
+
+        try:
+            header = json_util.json_loads_object(lines[0])
+        except (IndexError, *json_util.JSON_DECODE_EXCEPTIONS):
+            header = {}
+        # The journal of a store file which has since been compacted is stale
+        if "journal_id" not in data or header.get("journal_id") != data["journal_id"]:
+            _LOGGER.debug("%s: Ignoring stale journal", self.key)
+            return data
+
+        for line_no, line in enumerate(lines[1:], 2):
+            try:
+                _apply_journal_record(data, json_util.json_loads_object(line))
+            except (KeyError, TypeError, *json_util.JSON_DECODE_EXCEPTIONS):
+                # A write interrupted by a crash or power loss leaves an
+                # incomplete last record, everything before it is intact.
+                _LOGGER.warning(
+                    "Ignoring invalid journal record for %s at %s line %s",
+                    self.key,
+                    self.journal_path,
+                    line_no,
+                )
+                break
+        return data
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -519,6 +720,18 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
         await self._async_handle_write_data()
+        if not self._journal_compacted:
+            await self._async_compact_journal()
+
+    async def _async_compact_journal(self) -> None:
+        """Compact the journal into the store file."""
+        async with self._write_lock:
+            if self._journal_compacted or self._read_only:
+                return
+            try:
+                await self.hass.async_add_executor_job(self._compact_journal_file)
+            except HomeAssistantError as err:
+                _LOGGER.error("Error compacting journal for %s: %s", self.key, err)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -542,6 +755,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if not self._journal_compacted:
+                # Compact the journal into the store file when shutting down
+                self._async_ensure_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -552,6 +769,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            self._write_journaled_data(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -561,6 +782,150 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+    def _encode_journal_data(
+        self, stored: Any, fragments: dict[int, tuple[json_helper.json_fragment, int]]
+    ) -> _JournalEncoding:
+        """Encode the data per top level key, or as a list if it is one.
+
+        Fragments which were already encoded on the previous save are not
+        encoded again.
+        """
+        encoding = _JournalEncoding()
+        if isinstance(stored, Mapping):
+            for key, value in stored.items():
+                self._encode_journal_value(encoding, key, value, fragments)
+        else:
+            self._encode_journal_value(encoding, None, stored, fragments)
+        return encoding
+
+    def _encode_journal_value(
+        self,
+        encoding: _JournalEncoding,
+        key: str | None,
+        value: Any,
+        fragments: dict[int, tuple[json_helper.json_fragment, int]],
+    ) -> None:
+        """Encode a value of the data, lists are encoded per item."""
+        if not isinstance(value, (list, tuple)):
+            encoded = self._encode_journal_item(value)
+            encoding.encoded[key] = encoded
+            encoding.hashes[key] = hash(encoded)
+            return
+
+        items: list[bytes | json_helper.json_fragment] = []
+        hashes: list[int] = []
+        new_fragments = encoding.fragments
+        for item in value:
+            if type(item) is not json_helper.json_fragment:
+                encoded = self._encode_journal_item(item)
+                items.append(encoded)
+                hashes.append(hash(encoded))
+                continue
+            # Fragments are immutable and the state keeps a reference
+            # to them, so their id can't be reused by another object
+            if (known := fragments.get(id(item))) is not None:
+                item_hash = known[1]
+                items.append(item)
+            else:
+                encoded = self._encode_journal_item(item)
+                item_hash = hash(encoded)
+                items.append(encoded)
+            new_fragments[id(item)] = (item, item_hash)
+            hashes.append(item_hash)
+        encoding.encoded[key] = items
+        encoding.hashes[key] = hashes
+
+    def _encode_journal_item(self, item: Any) -> bytes:
+        """Encode an item as a single line of JSON."""
+        if self._encoder and self._encoder is not json_helper.JSONEncoder:
+            return json.dumps(item, cls=self._encoder).encode()
+        return json_helper.json_bytes(item)
+
+    def _write_journaled_data(self, path: str, data: dict) -> None:
+        """Append the changed data to the journal or compact the journal."""
+        state = self._journal_state
+        encoding: _JournalEncoding | None
+        try:
+            encoding = self._encode_journal_data(
+                data["data"], state.fragments if state is not None else {}
+            )
+        except (TypeError, ValueError):
+            # Let the full write report where the bad data is
+            encoding = None
+
+        if (
+            encoding is None
+            or state is None
+            or state.journal_size > state.base_size
+            # The data changed between a list and a dict
+            or (None in encoding.hashes) != (None in state.hashes)
+            # Leave a current store file behind when shutting down
+            or self.hass.state is CoreState.final_write
+        ):
+            self._compact_journal(path, data, encoding)
+            return
+
+        if not (records := _journal_records(state.hashes, encoding)):
+            state.fragments = encoding.fragments
+            return
+
+        _LOGGER.debug(
+            "Appending %s changes for %s to %s",
+            len(records),
+            self.key,
+            self.journal_path,
+        )
+        journal_data = b"".join(records)
+        try:
+            with open(self.journal_path, "ab") as journal:
+                journal.write(journal_data)
+                journal.flush()
+                if self._atomic_writes:
+                    os.fsync(journal.fileno())
+        except OSError as error:
+            # The journal may end in a partial record, start a new one
+            self._journal_state = None
+            _LOGGER.exception("Saving file failed: %s", self.journal_path)
+            raise WriteError(error) from error
+        state.hashes = encoding.hashes
+        state.fragments = encoding.fragments
+        state.journal_size += len(journal_data)
+        self._journal_compacted = False
+
+    def _compact_journal(
+        self,
+        path: str,
+        data: dict,
+        encoding: _JournalEncoding | None,
+    ) -> None:
+        """Write the whole data to the store file and start a new journal."""
+        self._journal_state = None
+        journal_id = uuid_util.random_uuid_hex()
+        data["journal_id"] = journal_id
+        _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        json_helper.save_json(
+            path,
+            data,
+            self._private,
+            encoder=self._encoder,
+            atomic_writes=self._atomic_writes,
+        )
+        # The store file is written first, if we crash before the new journal
+        # is written the old journal no longer matches and is ignored.
+        header = json_helper.json_bytes({"journal_id": journal_id}) + b"\n"
+        method = write_utf8_file_atomic if self._atomic_writes else write_utf8_file
+        method(self.journal_path, header, self._private, mode="wb")
+        self._journal_compacted = True
+        if encoding is not None:
+            self._journal_state = _JournalState(
+                journal_id, encoding, os.path.getsize(path), len(header)
+            )
+
+    def _compact_journal_file(self) -> None:
+        """Apply the journal to the store file and start a new journal."""
+        if data := json_util.load_json_object(self.path):
+            self._compact_journal(self.path, self._replay_journal(data), None)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -573,3 +938,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal:
+            self._journal_state = None
+            self._journal_compacted = True
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
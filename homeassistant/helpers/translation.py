@@ -15,6 +15,7 @@ from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
+    __version__,
 )
 from homeassistant.core import Event, HomeAssistant, async_get_hass, callback
 from homeassistant.loader import (
@@ -26,12 +27,17 @@ from homeassistant.loader import (
 from homeassistant.util.json import load_json
 
 from . import singleton
+from .storage import Store
 
 _LOGGER = logging.getLogger(__name__)
 
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
 LOCALE_EN = "en"
 
+TRANSLATION_BUNDLE_STORAGE_KEY = "core.translations"
+TRANSLATION_BUNDLE_STORAGE_VERSION = 1
+TRANSLATION_BUNDLE_SAVE_DELAY = 60
+
 
 def recursive_flatten(
     prefix: str, data: dict[str, dict[str, Any] | str]
@@ -71,6 +77,32 @@ def _load_translations_files_by_language(
     return loaded
 
 
+def _get_translation_fingerprints(
+    languages: list[str], integrations: dict[str, Integration]
+) -> dict[str, list[Any]]:
+    """Return what the flattened translations of integrations depend on.
+
+    The translation files are not read, only their modification times.
+    """
+    fingerprints: dict[str, list[Any]] = {}
+    for domain, integration in integrations.items():
+        fingerprint: list[Any] = [
+            str(integration.version or __version__),
+            integration.name,
+        ]
+        for language in languages:
+            mtime_ns: int | None = None
+            if integration.has_translations:
+                with suppress(OSError):
+                    translation_file = (
+                        integration.file_path / "translations" / f"{language}.json"
+                    )
+                    mtime_ns = translation_file.stat().st_mtime_ns
+            fingerprint.append(mtime_ns)
+        fingerprints[domain] = fingerprint
+    return fingerprints
+
+
 def build_resources(
     translation_strings: dict[str, dict[str, dict[str, Any] | str]],
     components: set[str],
@@ -144,16 +176,71 @@ class _TranslationsCacheData:
     cache: dict[str, dict[str, dict[str, dict[str, str]]]]
 
 
+class _TranslationBundle:
+    """Flattened translations of a language, kept across restarts.
+
+    The translations of an integration are reused as long as its version,
+    name and translation files are unchanged.
+    """
+
+    __slots__ = ("store", "components")
+
+    def __init__(self, hass: HomeAssistant, language: str) -> None:
+        """Initialize the bundle."""
+        self.store = Store[dict[str, Any]](
+            hass,
+            TRANSLATION_BUNDLE_STORAGE_VERSION,
+            f"{TRANSLATION_BUNDLE_STORAGE_KEY}.{language}",
+            private=True,
+        )
+        self.components: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the bundle."""
+        if data := await self.store.async_load():
+            self.components = data["components"]
+
+    @callback
+    def async_get_strings(
+        self, domain: str, fingerprint: list[Any]
+    ) -> dict[str, dict[str, str]] | None:
+        """Return the flattened strings by category if they are unchanged."""
+        if (entry := self.components.get(domain)) is None or entry[
+            "fingerprint"
+        ] != fingerprint:
+            return None
+        strings: dict[str, dict[str, str]] = entry["strings"]
+        return strings
+
+    @callback
+    def async_set_strings(
+        self,
+        domain: str,
+        fingerprint: list[Any],
+        strings: dict[str, dict[str, str]],
+    ) -> None:
+        """Store the flattened strings by category."""
+        self.components[domain] = {"fingerprint": fingerprint, "strings": strings}
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule saving the bundle."""
+        self.store.async_delay_save(
+            lambda: {"components": self.components}, TRANSLATION_BUNDLE_SAVE_DELAY
+        )
+
+
 class _TranslationCache:
     """Cache for flattened translations."""
 
-    __slots__ = ("hass", "cache_data", "lock")
+    __slots__ = ("hass", "cache_data", "lock", "bundles")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the cache."""
         self.hass = hass
         self.cache_data = _TranslationsCacheData({}, {})
         self.lock = asyncio.Lock()
+        self.bundles: dict[str, _TranslationBundle] = {}
 
     @callback
     def async_is_loaded(self, language: str, components: set[str]) -> bool:
@@ -229,6 +316,15 @@ class _TranslationCache:
                 continue
             integrations[domain] = int_or_exc
 
+        fingerprints = await self.hass.async_add_executor_job(
+            _get_translation_fingerprints, languages, integrations
+        )
+        if bundle := await self._async_get_bundle(language):
+            if restored := self._restore_from_bundle(language, bundle, fingerprints):
+                loaded[language].update(restored)
+                if not (components := components - restored):
+                    return
+
         translation_by_language_strings = await _async_get_component_strings(
             self.hass, languages, components, integrations
         )
@@ -255,6 +351,63 @@ class _TranslationCache:
 
         loaded[language].update(components)
 
+        # Only keep languages with translation files, the modification
+        # time of the translation file of the language comes last
+        if bundle and any(
+            fingerprint[-1] is not None for fingerprint in fingerprints.values()
+        ):
+            self._add_to_bundle(language, bundle, components, fingerprints)
+
+    async def _async_get_bundle(self, language: str) -> _TranslationBundle | None:
+        """Return the persisted translations of a language."""
+        if (bundle := self.bundles.get(language)) is None:
+            # The language is used in the storage file name
+            if not language.replace("-", "").replace("_", "").isalnum():
+                return None
+            bundle = self.bundles[language] = _TranslationBundle(self.hass, language)
+            await bundle.async_load()
+        return bundle
+
+    @callback
+    def _restore_from_bundle(
+        self,
+        language: str,
+        bundle: _TranslationBundle,
+        fingerprints: dict[str, list[Any]],
+    ) -> set[str]:
+        """Restore unchanged translations from the bundle into the cache."""
+        cached = self.cache_data.cache.setdefault(language, {})
+        restored: set[str] = set()
+        for domain, fingerprint in fingerprints.items():
+            if (strings := bundle.async_get_strings(domain, fingerprint)) is None:
+                continue
+            for category, category_strings in strings.items():
+                cached.setdefault(category, {})[domain] = category_strings
+            restored.add(domain)
+        return restored
+
+    @callback
+    def _add_to_bundle(
+        self,
+        language: str,
+        bundle: _TranslationBundle,
+        components: set[str],
+        fingerprints: dict[str, list[Any]],
+    ) -> None:
+        """Add the translations built for components to the bundle."""
+        cached = self.cache_data.cache[language]
+        for domain in components.intersection(fingerprints):
+            bundle.async_set_strings(
+                domain,
+                fingerprints[domain],
+                {
+                    category: category_cache[domain]
+                    for category, category_cache in cached.items()
+                    if domain in category_cache
+                },
+            )
+        bundle.async_schedule_save()
+
     def _validate_placeholders(
         self,
         language: str,
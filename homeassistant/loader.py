@@ -29,7 +29,7 @@ from propcache import cached_property
 import voluptuous as vol
 
 from . import generated
-from .const import Platform
+from .const import Platform, __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -49,6 +49,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
@@ -132,6 +133,11 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_INTEGRATION_SNAPSHOT: HassKey[_IntegrationSnapshot] = HassKey(
+    "integration_snapshot"
+)
+INTEGRATION_SNAPSHOT_STORAGE_KEY = "core.integration_snapshot"
+INTEGRATION_SNAPSHOT_STORAGE_VERSION = 1
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -289,29 +295,38 @@ async def _async_get_custom_components(
     if hass.config.recovery_mode or hass.config.safe_mode:
         return {}
 
+    snapshot = hass.data.get(DATA_INTEGRATION_SNAPSHOT)
     try:
         import custom_components  # pylint: disable=import-outside-toplevel
     except ImportError:
+        if snapshot:
+            snapshot.custom_components_scanned({}, [])
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
+    def get_sub_directories(paths: list[str]) -> list[str]:
         """Return all sub directories in a set of paths."""
-        return [
-            entry
+        path_mtimes = _path_mtimes(paths)
+        if (
+            snapshot
+            and (dirs := snapshot.custom_component_dirs(path_mtimes)) is not None
+        ):
+            return dirs
+        dirs = [
+            entry.name
             for path in paths
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
         ]
+        if snapshot:
+            snapshot.custom_components_scanned(path_mtimes, dirs)
+        return dirs
 
     dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
+        get_sub_directories, list(custom_components.__path__)
     )
 
     integrations = await hass.async_add_executor_job(
-        _resolve_integrations_from_root,
-        hass,
-        custom_components,
-        [comp.name for comp in dirs],
+        _resolve_integrations_from_root, hass, custom_components, dirs
     )
     return {
         integration.domain: integration
@@ -659,31 +674,45 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        pkg_path = f"{root_module.__name__}.{domain}"
+        snapshot = hass.data.get(DATA_INTEGRATION_SNAPSHOT)
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            file_path = pathlib.Path(base) / domain
 
-            if not manifest_path.is_file():
-                continue
+            integration = (
+                snapshot.restore_integration(hass, pkg_path, file_path, domain)
+                if snapshot
+                else None
+            )
+            if integration is None:
+                manifest_path = file_path / "manifest.json"
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                if not manifest_path.is_file():
+                    continue
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
-            integration = cls(
-                hass,
-                f"{root_module.__name__}.{domain}",
-                file_path,
-                manifest,
-                None if is_virtual else set(os.listdir(file_path)),
-            )
+                if snapshot:
+                    # Stat before reading so a manifest that changes while we
+                    # read it does not end up in the snapshot as unchanged
+                    snapshot.track(file_path)
+
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                integration = cls(
+                    hass,
+                    pkg_path,
+                    file_path,
+                    manifest,
+                    None if is_virtual else set(os.listdir(file_path)),
+                )
 
             if not integration.import_executor:
                 _LOGGER.warning(IMPORT_EVENT_LOOP_WARNING, integration.domain)
@@ -1330,6 +1359,200 @@ def _resolve_integrations_from_root(
     return integrations
 
 
+def _path_mtimes(paths: Iterable[str]) -> dict[str, int]:
+    """Return the modification times of paths that exist."""
+    mtimes: dict[str, int] = {}
+    for path in paths:
+        with suppress(OSError):
+            mtimes[path] = os.stat(path).st_mtime_ns
+    return mtimes
+
+
+def _integration_mtimes(file_path: str) -> list[int] | None:
+    """Return the modification times of an integration directory and manifest."""
+    try:
+        return [
+            os.stat(file_path).st_mtime_ns,
+            os.stat(os.path.join(file_path, "manifest.json")).st_mtime_ns,
+        ]
+    except OSError:
+        return None
+
+
+class _IntegrationSnapshot:
+    """Integrations resolved on a previous start.
+
+    An integration is only restored from the snapshot while the modification
+    times of its directory and manifest are unchanged. Resolved dependencies
+    are only restored when this holds for every integration they include and
+    the custom integrations are unchanged, as a new custom integration can
+    override a built-in one.
+    """
+
+    def __init__(self, store: Store[dict[str, Any]], data: dict[str, Any] | None):
+        """Initialize the snapshot."""
+        self._store = store
+        self._data = data
+        self._integrations: dict[str, dict[str, Any]] = (
+            data["integrations"] if data else {}
+        )
+        self._mtimes: dict[str, list[int] | None] = {}
+        self._custom_components: dict[str, Any] | None = None
+        self._custom_components_unchanged = False
+        self.restored: set[str] = set()
+
+    def _current_mtimes(self, file_path: str) -> list[int] | None:
+        """Return the modification times of an integration, stat it once."""
+        if file_path not in self._mtimes:
+            self._mtimes[file_path] = _integration_mtimes(file_path)
+        return self._mtimes[file_path]
+
+    def _is_unchanged(self, domain: str) -> bool:
+        """Return if the snapshot entry for a domain is still valid."""
+        return (entry := self._integrations.get(domain)) is not None and (
+            self._current_mtimes(entry["file_path"]) == entry["mtimes"]
+        )
+
+    def track(self, file_path: pathlib.Path) -> None:
+        """Track an integration that is resolved from disk.
+
+        Must be called before its manifest is read.
+        """
+        self._current_mtimes(str(file_path))
+
+    def custom_components_scanned(
+        self, path_mtimes: dict[str, int], dirs: list[str]
+    ) -> None:
+        """Record the custom integration directories."""
+        self._custom_components = {"paths": path_mtimes, "dirs": dirs}
+        self._custom_components_unchanged = (
+            self._data is not None
+            and self._data["custom_components"] == self._custom_components
+        )
+
+    def custom_component_dirs(self, path_mtimes: dict[str, int]) -> list[str] | None:
+        """Return the custom integration directories if they are unchanged."""
+        if not self._data or self._data["custom_components"]["paths"] != path_mtimes:
+            return None
+        dirs: list[str] = self._data["custom_components"]["dirs"]
+        self.custom_components_scanned(path_mtimes, dirs)
+        return dirs
+
+    def restore_integration(
+        self,
+        hass: HomeAssistant,
+        pkg_path: str,
+        file_path: pathlib.Path,
+        domain: str,
+    ) -> Integration | None:
+        """Restore an integration if it is unchanged.
+
+        Runs in the executor as it stats the integration files.
+        """
+        if (
+            (entry := self._integrations.get(domain)) is None
+            or entry["pkg_path"] != pkg_path
+            or entry["file_path"] != str(file_path)
+            or not self._is_unchanged(domain)
+        ):
+            return None
+        integration = Integration(
+            hass,
+            pkg_path,
+            file_path,
+            cast(Manifest, dict(entry["manifest"])),
+            set(entry["top_level_files"]),
+        )
+        if (
+            self._custom_components_unchanged
+            and (all_dependencies := entry["all_dependencies"]) is not None
+            and all(self._is_unchanged(dep) for dep in all_dependencies)
+        ):
+            # pylint: disable-next=protected-access
+            integration._all_dependencies = set(all_dependencies)  # noqa: SLF001
+            # pylint: disable-next=protected-access
+            integration._all_dependencies_resolved = True  # noqa: SLF001
+        self.restored.add(domain)
+        return integration
+
+    def _snapshot_data(self, integrations: list[Integration]) -> dict[str, Any]:
+        """Return the snapshot data for resolved integrations."""
+        # Keep entries for integrations that were not needed on this start
+        entries = {
+            domain: entry
+            for domain, entry in self._integrations.items()
+            if self._mtimes.get(entry["file_path"], entry["mtimes"]) == entry["mtimes"]
+        }
+        for integration in integrations:
+            file_path = str(integration.file_path)
+            if (mtimes := self._mtimes.get(file_path)) is None:
+                continue
+            # pylint: disable=protected-access
+            entries[integration.domain] = {
+                "pkg_path": integration.pkg_path,
+                "file_path": file_path,
+                "mtimes": mtimes,
+                "manifest": integration.manifest,
+                "top_level_files": sorted(integration._top_level_files),  # noqa: SLF001
+                "all_dependencies": sorted(integration._all_dependencies)  # noqa: SLF001
+                if integration._all_dependencies_resolved  # noqa: SLF001
+                and integration._all_dependencies is not None  # noqa: SLF001
+                else None,
+            }
+        return {
+            "ha_version": __version__,
+            "custom_components": self._custom_components,
+            "integrations": entries,
+        }
+
+    async def async_save(self, integrations: list[Integration]) -> None:
+        """Save the snapshot if the resolved integrations changed."""
+        if self._custom_components is None:
+            return
+        data = self._snapshot_data(integrations)
+        if data == self._data:
+            return
+        self._data = data
+        await self._store.async_save(data)
+
+
+async def async_load_integration_snapshot(hass: HomeAssistant) -> None:
+    """Load the integrations resolved on the previous start.
+
+    Must be called before custom integrations are resolved.
+    """
+    if hass.config.recovery_mode or hass.config.safe_mode:
+        return
+
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store = Store[dict[str, Any]](
+        hass,
+        INTEGRATION_SNAPSHOT_STORAGE_VERSION,
+        INTEGRATION_SNAPSHOT_STORAGE_KEY,
+        private=True,
+    )
+    data = await store.async_load()
+    if data is not None and data.get("ha_version") != __version__:
+        data = None
+    hass.data[DATA_INTEGRATION_SNAPSHOT] = _IntegrationSnapshot(store, data)
+
+
+async def async_save_integration_snapshot(hass: HomeAssistant) -> None:
+    """Save the resolved integrations so the next start can reuse them."""
+    if (snapshot := hass.data.get(DATA_INTEGRATION_SNAPSHOT)) is None:
+        return
+    integrations = {
+        domain: int_or_fut
+        for domain, int_or_fut in hass.data[DATA_INTEGRATIONS].items()
+        if type(int_or_fut) is Integration
+    }
+    if isinstance(custom := hass.data.get(DATA_CUSTOM_COMPONENTS), dict):
+        integrations.update(custom)
+    await snapshot.async_save(list(integrations.values()))
+
+
 @callback
 def async_get_loaded_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration which is already loaded.
@@ -7,16 +7,24 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import os
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 
-from homeassistant import core
+from homeassistant import bootstrap, config_entries, core, loader
+from homeassistant.components import recorder
+from homeassistant.components.recorder import history
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import entity_registry as er, recorder as recorder_helper
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.storage import Store
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -44,10 +52,18 @@ def run(args):
 
 
 async def run_benchmark(bench):
-    """Run a benchmark."""
+    """Run a benchmark.
+
+    Benchmarks return their runtime, or their runtime and a description of
+    what else they measured.
+    """
     hass = core.HomeAssistant("")
-    runtime = await bench(hass)
-    print(f"Benchmark {bench.__name__} done in {runtime}s")
+    result = await bench(hass)
+    if isinstance(result, tuple):
+        runtime, details = result
+        print(f"Benchmark {bench.__name__} done in {runtime}s, {details}")
+    else:
+        print(f"Benchmark {bench.__name__} done in {result}s")
     await hass.async_stop()
 
 
@@ -308,3 +324,220 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+def _file_identity(path):
+    """Return the inode and size of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_size
+
+
+def _bytes_written(before, after):
+    """Return the bytes written to a file from its inode and size."""
+    if after is None:
+        return 0
+    # Files are rewritten by replacing them and journals are appended to
+    if before is None or before[0] != after[0]:
+        return after[1]
+    return after[1] - before[1]
+
+
+async def _store_save_changes(hass, journal):
+    """Save a 10,000 item store 100 times with one item changed each time."""
+    items = [{"id": str(idx), "value": "x" * 100} for idx in range(10**4)]
+    written = 0
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        store = Store(hass, 1, "benchmark", journal=journal)
+        await store.async_save({"items": items})
+
+        paths = (store.path, store.journal_path)
+        write_data = store._write_data  # noqa: SLF001
+
+        def _write_data(path, data):
+            """Write the data and count the bytes written to the files."""
+            nonlocal written
+            before = [_file_identity(file_path) for file_path in paths]
+            write_data(path, data)
+            written += sum(
+                _bytes_written(file_before, _file_identity(file_path))
+                for file_path, file_before in zip(paths, before, strict=True)
+            )
+
+        store._write_data = _write_data  # noqa: SLF001
+
+        start = timer()
+        for idx in range(100):
+            items[idx * 100] = {"id": str(idx * 100), "value": "y" * 100}
+            await store.async_save({"items": items})
+        return timer() - start, f"{written} bytes written"
+
+
+@benchmark
+async def store_save_changes(hass):
+    """Save a large store with small changes by rewriting the file."""
+    return await _store_save_changes(hass, False)
+
+
+@benchmark
+async def journaled_store_save_changes(hass):
+    """Save a large store with small changes by appending to the journal."""
+    return await _store_save_changes(hass, True)
+
+
+async def _entity_registry_load(hass, create_entries):
+    """Load a 40,000 entity registry and look up a tenth of the entries."""
+    entities = [
+        {
+            "aliases": [],
+            "area_id": None,
+            "categories": {},
+            "capabilities": None,
+            "config_entry_id": f"config_entry_{idx % 100}",
+            "created_at": "2024-02-14T12:00:00.900075+00:00",
+            "device_class": None,
+            "device_id": f"device_{idx // 4}",
+            "disabled_by": None,
+            "entity_category": None,
+            "entity_id": f"sensor.sensor_{idx}",
+            "hidden_by": None,
+            "icon": None,
+            "id": f"id_{idx}",
+            "has_entity_name": True,
+            "labels": [],
+            "modified_at": "2024-02-14T12:00:00.900075+00:00",
+            "name": None,
+            "options": {"sensor": {"suggested_display_precision": 1}},
+            "original_device_class": "temperature",
+            "original_icon": None,
+            "original_name": "Temperature",
+            "platform": "benchmark",
+            "supported_features": 0,
+            "translation_key": None,
+            "unique_id": str(idx),
+            "previous_unique_id": None,
+            "unit_of_measurement": "°C",
+        }
+        for idx in range(4 * 10**4)
+    ]
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        store = Store(
+            hass,
+            er.STORAGE_VERSION_MAJOR,
+            er.STORAGE_KEY,
+            minor_version=er.STORAGE_VERSION_MINOR,
+        )
+        await store.async_save({"entities": entities, "deleted_entities": []})
+        registry = er.EntityRegistry(hass)
+
+        start = timer()
+        await registry.async_load()
+        if create_entries:
+            registry.entities.values()
+        for idx in range(0, 4 * 10**4, 10):
+            registry.async_get(f"sensor.sensor_{idx}")
+        return timer() - start
+
+
+@benchmark
+async def entity_registry_load(hass):
+    """Load a large entity registry creating entries on first access."""
+    return await _entity_registry_load(hass, False)
+
+
+@benchmark
+async def entity_registry_load_all(hass):
+    """Load a large entity registry creating every entry."""
+    return await _entity_registry_load(hass, True)
+
+
+async def _recorder_history_queries(hass, read_pool):
+    """Run eight history queries at once, like a dashboard with eight cards."""
+    entity_ids = [f"sensor.benchmark_{idx}" for idx in range(8)]
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        loader.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+        recorder_helper.async_initialize_recorder(hass)
+        await async_setup_component(
+            hass,
+            recorder.DOMAIN,
+            {
+                recorder.DOMAIN: {
+                    "db_url": f"sqlite:///{config_dir}/benchmark.db",
+                    "commit_interval": 0,
+                }
+            },
+        )
+        await hass.async_start()
+        instance = recorder.get_instance(hass)
+        start_time = dt_util.utcnow()
+        for value in range(2000):
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, value, {"unit_of_measurement": "W"})
+            await asyncio.sleep(0)
+        await instance.async_block_till_done()
+
+        add_job = (
+            instance.async_add_read_executor_job
+            if read_pool
+            else instance.async_add_executor_job
+        )
+        start = timer()
+        results = await asyncio.gather(
+            *(
+                add_job(
+                    history.get_significant_states,
+                    hass,
+                    start_time,
+                    None,
+                    [entity_id],
+                )
+                for entity_id in entity_ids
+            )
+        )
+        runtime = timer() - start
+
+        assert all(
+            len(result[entity_ids[idx]]) == 2000 for idx, result in enumerate(results)
+        )
+        await hass.async_stop()
+    return runtime
+
+
+@benchmark
+async def recorder_history_queries(hass):
+    """Run concurrent history queries with the database executor."""
+    return await _recorder_history_queries(hass, False)
+
+
+@benchmark
+async def recorder_history_queries_read_pool(hass):
+    """Run concurrent history queries with the read only connection pool."""
+    return await _recorder_history_queries(hass, True)
+
+
+@benchmark
+async def assist_pipeline_audio(hass):
+    """Scale and chunk a minute of audio from a dozen voice satellites."""
+    # The requirements of assist_pipeline are only installed with it
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.assist_pipeline.audio import AudioChunkProcessor
+
+    satellites = 12
+    # 20ms of 16Khz 16-bit mono audio per chunk from the satellites
+    audio = os.urandom(640)
+    chunks_per_satellite = 60 * 50
+
+    processors = [AudioChunkProcessor() for _ in range(satellites)]
+    start = timer()
+    for _ in range(chunks_per_satellite):
+        for processor in processors:
+            for _chunk in processor.process(audio, 2.0):
+                pass
+    return timer() - start
@@ -6,6 +6,7 @@ from .input import UndefinedSubstitution, extract_inputs, substitute
 from .loader import (
     Secrets,
     YamlTypeError,
+    clear_parse_cache,
     load_yaml,
     load_yaml_dict,
     parse_yaml,
@@ -20,6 +21,7 @@ __all__ = [
     "save_yaml",
     "Secrets",
     "YamlTypeError",
+    "clear_parse_cache",
     "load_yaml",
     "load_yaml_dict",
     "secret_yaml",
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
 import fnmatch
 from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
+import time
 from typing import Any, TextIO, overload
 
+from lru import LRU
 import yaml
 
 try:
@@ -36,6 +40,39 @@ JSON_TYPE = list | dict | str
 
 _LOGGER = logging.getLogger(__name__)
 
+# Files modified this recently are not cached, as a change within the
+# resolution of the file system timestamps would go unnoticed
+_PARSE_CACHE_MIN_AGE_NS = 2_000_000_000
+# Enough for the files of large configurations split with !include_dir_*
+_PARSE_CACHE_SIZE = 1024
+
+# What a parsed file depends on besides its own content, for example
+# ("file", path, mtime_ns, size) for an included file
+type _Dependency = tuple[Any, ...]
+
+_DEPENDENCIES: ContextVar[list[_Dependency] | None] = ContextVar(
+    "yaml_dependencies", default=None
+)
+
+
+@dataclass(slots=True)
+class _ParsedFile:
+    """A parsed YAML file and what it depends on."""
+
+    mtime_ns: int
+    size: int
+    secrets_dir: Path | None
+    dependencies: tuple[_Dependency, ...]
+    content: JSON_TYPE | None
+
+
+_PARSE_CACHE: LRU[str, _ParsedFile] = LRU(_PARSE_CACHE_SIZE)
+
+
+def clear_parse_cache() -> None:
+    """Clear the cache of parsed YAML files."""
+    _PARSE_CACHE.clear()
+
 
 class YamlTypeError(HomeAssistantError):
     """Raised by load_yaml_dict if top level data is not a dict."""
@@ -218,17 +255,86 @@ class SafeLineLoader(PythonSafeLoader):
 type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
+def _add_dependency(dependency: _Dependency) -> None:
+    """Record a dependency of the file that is being parsed."""
+    if (dependencies := _DEPENDENCIES.get()) is not None:
+        dependencies.append(dependency)
+
+
+def _dependency_unchanged(dependency: _Dependency, secrets: Secrets | None) -> bool:
+    """Return if a dependency of a parsed file is unchanged."""
+    match dependency:
+        case ("file", path, mtime_ns, size):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False
+            return stat.st_mtime_ns == mtime_ns and stat.st_size == size
+        case ("dir", directory, pattern, files):
+            return tuple(_find_files(directory, pattern)) == files
+        case ("env", name, value):
+            return os.environ.get(name) == value
+        case ("secret", requester_path, name, value):
+            if secrets is None:
+                return False
+            try:
+                return secrets.get(requester_path, name) == value
+            except HomeAssistantError:
+                return False
+    return False
+
+
+def _copy_node(obj: Any) -> Any:
+    """Copy the containers of parsed YAML so the cached content is not modified."""
+    if isinstance(obj, dict):
+        new_obj: Any = obj.__class__(
+            {key: _copy_node(value) for key, value in obj.items()}
+        )
+    elif isinstance(obj, list):
+        new_obj = obj.__class__([_copy_node(value) for value in obj])
+    else:
+        # Scalars are immutable, including the annotated strings
+        return obj
+    try:  # suppress is much slower
+        new_obj.__config_file__ = obj.__config_file__
+        new_obj.__line__ = obj.__line__
+    except AttributeError:
+        pass
+    return new_obj
+
+
+def _get_parsed_file(
+    path: str, stat: os.stat_result, secrets: Secrets | None
+) -> _ParsedFile | None:
+    """Return the cached parse of a file if it and its dependencies are unchanged."""
+    if (
+        (parsed := _PARSE_CACHE.get(path)) is None
+        or parsed.mtime_ns != stat.st_mtime_ns
+        or parsed.size != stat.st_size
+        or parsed.secrets_dir != (secrets.config_dir if secrets else None)
+        or not all(
+            _dependency_unchanged(dependency, secrets)
+            for dependency in parsed.dependencies
+        )
+    ):
+        return None
+    return parsed
+
+
 def load_yaml(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> JSON_TYPE | None:
     """Load a YAML file.
 
+    Parsed files are cached until they, a file they include, a directory they
+    include, or a secret or environment variable they use changes.
+
     If opening the file raises an OSError it will be wrapped in a HomeAssistantError,
     except for FileNotFoundError which will be re-raised.
     """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            return _load_yaml_file(os.path.abspath(fname), conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
@@ -238,6 +344,50 @@ def load_yaml(
         raise HomeAssistantError(exc) from exc
 
 
+def _load_yaml_file(
+    path: str, conf_file: TextIO, secrets: Secrets | None
+) -> JSON_TYPE | None:
+    """Load an opened YAML file, using the parse cache if possible."""
+    try:
+        stat = os.fstat(conf_file.fileno())
+    except (OSError, ValueError):
+        # Not a real file, so it can not be cached and neither can the
+        # files including it
+        _add_dependency(("file", path, None, None))
+        return parse_yaml(conf_file, secrets)
+
+    file_dependency = ("file", path, stat.st_mtime_ns, stat.st_size)
+    if parsed := _get_parsed_file(path, stat, secrets):
+        _add_dependency(file_dependency)
+        for dependency in parsed.dependencies:
+            _add_dependency(dependency)
+        return _copy_node(parsed.content)
+
+    dependencies: list[_Dependency] = [file_dependency]
+    token = _DEPENDENCIES.set(dependencies)
+    try:
+        content = parse_yaml(conf_file, secrets)
+    finally:
+        _DEPENDENCIES.reset(token)
+
+    for dependency in dependencies:
+        _add_dependency(dependency)
+    min_mtime_ns = time.time_ns() - _PARSE_CACHE_MIN_AGE_NS
+    if all(
+        dependency[2] is not None and dependency[2] < min_mtime_ns
+        for dependency in dependencies
+        if dependency[0] == "file"
+    ):
+        _PARSE_CACHE[path] = _ParsedFile(
+            stat.st_mtime_ns,
+            stat.st_size,
+            secrets.config_dir if secrets else None,
+            tuple(dict.fromkeys(dependencies[1:])),
+            _copy_node(content),
+        )
+    return content
+
+
 def load_yaml_dict(
     fname: str | os.PathLike[str], secrets: Secrets | None = None
 ) -> dict:
@@ -404,12 +554,19 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
+def _find_included_files(directory: str, pattern: str) -> list[str]:
+    """Find the files to include and record them as a dependency."""
+    files = list(_find_files(directory, pattern))
+    _add_dependency(("dir", directory, pattern, tuple(files)))
+    return files
+
+
 @_raise_if_no_value
 def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDictClass:
     """Load multiple files from directory as a dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loc, "*.yaml"):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
@@ -429,7 +586,7 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping = NodeDictClass()
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -446,7 +603,7 @@ def _include_dir_list_yaml(
     loc = os.path.join(os.path.dirname(loader.get_name), node.value)
     return [
         loaded_yaml
-        for f in _find_files(loc, "*.yaml")
+        for f in _find_included_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
         and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
     ]
@@ -459,7 +616,7 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.get_name), node.value)
     merged_list: list[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
         loaded_yaml = load_yaml(fname, loader.secrets)
@@ -528,6 +685,7 @@ def _handle_scalar_tag(
 def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _add_dependency(("env", args[0], os.environ.get(args[0])))
 
     # Check for a default value
     if len(args) > 1:
@@ -543,7 +701,9 @@ def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
-    return loader.secrets.get(loader.get_name, node.value)
+    value = loader.secrets.get(loader.get_name, node.value)
+    _add_dependency(("secret", loader.get_name, node.value, value))
+    return value
 
 
 def add_constructor(tag: Any, constructor: Any) -> None:
@@ -603,7 +603,7 @@ def mock_registry(
     registry = er.EntityRegistry(hass)
     if mock_entries is None:
         mock_entries = {}
-    registry.deleted_entities = {}
+    registry.deleted_entities = er.DeletedEntityRegistryItems()
     registry.entities = er.EntityRegistryItems()
     registry._entities_data = registry.entities.data
     for key, entry in mock_entries.items():
@@ -915,6 +915,8 @@ class MockEntityPlatform(entity_platform.EntityPlatform):
         # Otherwise the constructor will blow up.
         if isinstance(platform, Mock) and isinstance(platform.PARALLEL_UPDATES, Mock):
             platform.PARALLEL_UPDATES = 0
+        if isinstance(platform, Mock) and isinstance(platform.STAGGER_UPDATES, Mock):
+            platform.STAGGER_UPDATES = False
 
         super().__init__(
             hass=hass,
@@ -0,0 +1,62 @@
+"""Tests for the vectorized audio processing of Assist."""
+
+import numpy as np
+
+from homeassistant.components.assist_pipeline.audio import (
+    AudioChunkProcessor,
+    multiply_volume,
+)
+
+
+def _pcm(*samples: int) -> bytes:
+    """Return 16-bit PCM audio of samples."""
+    return np.array(samples, dtype="<i2").tobytes()
+
+
+def test_multiply_volume() -> None:
+    """Test samples are scaled and clipped to signed 16-bit."""
+    samples = np.frombuffer(_pcm(1000, -1000, 3, 20000, -20000), dtype="<i2")
+
+    assert multiply_volume(samples, 2.0).tolist() == [
+        2000,
+        -2000,
+        6,
+        32767,
+        -32768,
+    ]
+    assert multiply_volume(samples, 0.5).tolist() == [500, -500, 1, 10000, -10000]
+
+
+def test_process_chunks() -> None:
+    """Test audio is split into chunks across calls."""
+    processor = AudioChunkProcessor(bytes_per_chunk=4)
+
+    assert list(processor.process(_pcm(1, 2, 3))) == [_pcm(1, 2)]
+    assert list(processor.process(_pcm(4, 5, 6, 7))) == [_pcm(3, 4), _pcm(5, 6)]
+    assert list(processor.process(_pcm(8))) == [_pcm(7, 8)]
+
+
+def test_process_volume() -> None:
+    """Test the volume of chunks is scaled."""
+    processor = AudioChunkProcessor(bytes_per_chunk=4)
+
+    assert list(processor.process(_pcm(1, 2, 20000), 2.0)) == [_pcm(2, 4)]
+    assert list(processor.process(_pcm(-20000), 2.0)) == [_pcm(32767, -32768)]
+
+
+def test_process_resample() -> None:
+    """Test audio is resampled to 16Khz continuously across calls."""
+    ramp = np.arange(0, 4800, dtype="<i2")
+
+    processor = AudioChunkProcessor(bytes_per_chunk=2, sample_rate=48000)
+    at_once = b"".join(processor.process(ramp.tobytes()))
+
+    processor = AudioChunkProcessor(bytes_per_chunk=2, sample_rate=48000)
+    in_parts = b"".join(
+        chunk
+        for part in np.array_split(ramp, 7)
+        for chunk in processor.process(part.tobytes())
+    )
+
+    assert in_parts == at_once
+    assert np.frombuffer(at_once, dtype="<i2").tolist() == list(range(0, 4798, 3))
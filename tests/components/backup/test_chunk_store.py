@@ -0,0 +1,122 @@
+"""Tests for the chunk store of the Backup integration."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+import tarfile
+
+from homeassistant.components.backup.chunk_store import (
+    CHUNK_SIZE,
+    ChunkStore,
+    manifest_as_json,
+    manifest_from_json,
+)
+from homeassistant.util.json import json_loads_object
+
+
+def _create_config_dir(tmp_path: Path) -> Path:
+    """Create a config directory with a few files."""
+    config_dir = tmp_path / "config"
+    (config_dir / ".storage").mkdir(parents=True)
+    (config_dir / ".storage" / "core.config").write_text("{}")
+    (config_dir / "large.bin").write_bytes(b"a" * CHUNK_SIZE + b"b")
+    (config_dir / "excluded.log").write_text("log")
+    (config_dir / "link").symlink_to("large.bin")
+    return config_dir
+
+
+def _stored_chunks(store: ChunkStore) -> set[Path]:
+    """Return the paths of the stored chunks."""
+    return {path for path in store.path.glob("*/*") if path.is_file()}
+
+
+def test_store_unchanged_files(tmp_path: Path) -> None:
+    """Test unchanged files are stored once."""
+    config_dir = _create_config_dir(tmp_path)
+    store = ChunkStore(tmp_path / "chunks")
+
+    entries = store.store(config_dir, ["*.log"], {})
+    assert {(entry.name, entry.type) for entry in entries} == {
+        ("", "dir"),
+        (".storage", "dir"),
+        (".storage/core.config", "file"),
+        ("large.bin", "file"),
+        ("link", "symlink"),
+    }
+    chunks = _stored_chunks(store)
+    assert len(chunks) == 3
+
+    assert store.store(config_dir, ["*.log"], {}) == entries
+    assert _stored_chunks(store) == chunks
+
+    # Only the changed chunk is stored again
+    (config_dir / "large.bin").write_bytes(b"a" * CHUNK_SIZE + b"c")
+    store.store(config_dir, ["*.log"], {})
+    assert len(_stored_chunks(store) - chunks) == 1
+
+
+def test_store_snapshots(tmp_path: Path) -> None:
+    """Test snapshots replace the live files."""
+    config_dir = _create_config_dir(tmp_path)
+    (config_dir / "home-assistant_v2.db").write_text("live")
+    (config_dir / "home-assistant_v2.db-wal").write_text("wal")
+    snapshot_path = tmp_path / "home-assistant_v2.db"
+    snapshot_path.write_text("snapshot")
+    store = ChunkStore(tmp_path / "chunks")
+
+    entries = store.store(
+        config_dir,
+        [],
+        {"home-assistant_v2.db": snapshot_path, "home-assistant_v2.db-wal": None},
+    )
+
+    names = [entry.name for entry in entries]
+    assert names.count("home-assistant_v2.db") == 1
+    assert "home-assistant_v2.db-wal" not in names
+    assert next(
+        entry for entry in entries if entry.name == "home-assistant_v2.db"
+    ).size == len("snapshot")
+
+
+def test_export(tmp_path: Path) -> None:
+    """Test exporting a manifest to a tar file."""
+    config_dir = _create_config_dir(tmp_path)
+    store = ChunkStore(tmp_path / "chunks")
+    entries = manifest_from_json(
+        json_loads_object(manifest_as_json(store.store(config_dir, ["*.log"], {})))
+    )
+
+    fileobj = io.BytesIO()
+    with tarfile.open(fileobj=fileobj, mode="w:gz") as tar_file:
+        store.export(entries, tar_file, "data")
+
+    fileobj.seek(0)
+    with tarfile.open(fileobj=fileobj, mode="r:gz") as tar_file:
+        assert set(tar_file.getnames()) == {
+            "data",
+            "data/.storage",
+            "data/.storage/core.config",
+            "data/large.bin",
+            "data/link",
+        }
+        assert tar_file.getmember("data/link").linkname == "large.bin"
+        large_file = tar_file.extractfile("data/large.bin")
+        assert large_file is not None
+        assert large_file.read() == b"a" * CHUNK_SIZE + b"b"
+
+
+def test_remove_unreferenced(tmp_path: Path) -> None:
+    """Test removing the chunks which are not referenced."""
+    config_dir = _create_config_dir(tmp_path)
+    store = ChunkStore(tmp_path / "chunks")
+    entries = store.store(config_dir, ["*.log"], {})
+    referenced = {digest for entry in entries for digest in entry.chunks}
+
+    assert store.remove_unreferenced(referenced) == 0
+    assert store.remove_unreferenced(set()) == 3
+    assert not _stored_chunks(store)
+
+    # The index of the removed chunks is not used
+    assert store.store(config_dir, ["*.log"], {}) == entries
+    assert len(_stored_chunks(store)) == 3
@@ -42,3 +42,22 @@ async def test_create_service(
         )
 
     assert generate_backup.called
+
+
+async def test_create_service_incremental(
+    hass: HomeAssistant,
+) -> None:
+    """Test generate incremental backup."""
+    await setup_backup_integration(hass)
+
+    with patch(
+        "homeassistant.components.backup.manager.BackupManager.generate_backup",
+    ) as generate_backup:
+        await hass.services.async_call(
+            DOMAIN,
+            "create",
+            {"incremental": True},
+            blocking=True,
+        )
+
+    generate_backup.assert_called_once_with(incremental=True)
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+from dataclasses import replace
 from pathlib import Path
+import threading
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -142,6 +147,85 @@ async def test_removing_backup(
     assert "Removed backup located at" in caplog.text
 
 
+async def test_removing_incremental_backup(hass: HomeAssistant) -> None:
+    """Test removing an incremental backup removes the unused chunks."""
+    manager = BackupManager(hass)
+    manager.backups = {
+        TEST_BACKUP.slug: replace(TEST_BACKUP, incremental=True),
+        "def456": replace(
+            TEST_BACKUP, slug="def456", path=Path("def456.tar"), incremental=True
+        ),
+    }
+    manager.loaded_backups = True
+
+    with (
+        patch("pathlib.Path.exists", return_value=True),
+        patch("pathlib.Path.unlink"),
+        patch.object(manager, "_read_manifest", return_value=({}, [])) as read_manifest,
+        patch.object(
+            manager.chunk_store, "remove_unreferenced", return_value=2
+        ) as remove_unreferenced,
+    ):
+        await manager.remove_backup(TEST_BACKUP.slug)
+
+    assert read_manifest.call_args[0][0].slug == "def456"
+    remove_unreferenced.assert_called_once_with(set())
+
+
+async def test_removing_backup_while_incremental_backup_runs(
+    hass: HomeAssistant,
+) -> None:
+    """Test unused chunks are only removed after an incremental backup is done."""
+    manager = BackupManager(hass)
+    manager.backups = {TEST_BACKUP.slug: replace(TEST_BACKUP, incremental=True)}
+    manager.loaded_backups = True
+    storing_chunks = asyncio.Event()
+    chunks_stored = threading.Event()
+
+    def _mock_generate_backup_contents(*args: Any) -> int:
+        hass.loop.call_soon_threadsafe(storing_chunks.set)
+        chunks_stored.wait(10)
+        return 0
+
+    with (
+        patch("pathlib.Path.mkdir"),
+        patch("pathlib.Path.exists", return_value=True),
+        patch("pathlib.Path.unlink"),
+        patch("shutil.rmtree"),
+        # Not a mock, so it runs in the executor
+        patch.object(
+            manager,
+            "_mkdir_and_generate_backup_contents",
+            _mock_generate_backup_contents,
+        ),
+        patch.object(manager, "_read_manifest", return_value=({}, [])) as read_manifest,
+        patch.object(
+            manager.chunk_store, "remove_unreferenced", return_value=0
+        ) as remove_unreferenced,
+    ):
+        backup_task = hass.async_create_task(manager.generate_backup(incremental=True))
+        await storing_chunks.wait()
+        remove_task = hass.async_create_task(manager.remove_backup(TEST_BACKUP.slug))
+        for _ in range(3):
+            await hass.async_add_executor_job(lambda: None)
+        assert not remove_task.done()
+        remove_unreferenced.assert_not_called()
+
+        chunks_stored.set()
+        backup = await backup_task
+        await remove_task
+
+    # The chunks of the new backup are referenced when the unused chunks are removed
+    assert read_manifest.call_args[0][0].slug == backup.slug
+    remove_unreferenced.assert_called_once_with(set())
+
+
+async def test_export_backup(hass: HomeAssistant) -> None:
+    """Test exporting a backup which is not incremental."""
+    manager = BackupManager(hass)
+    assert await manager.export_backup(TEST_BACKUP) == TEST_BACKUP.path
+
+
 async def test_removing_non_existing_backup(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -258,6 +342,7 @@ async def test_exception_plaform_pre(hass: HomeAssistant) -> None:
         Mock(
             async_pre_backup=_mock_step,
             async_post_backup=AsyncMock(),
+            spec=["async_pre_backup", "async_post_backup"],
         ),
     )
 
@@ -278,6 +363,7 @@ async def test_exception_plaform_post(hass: HomeAssistant) -> None:
         Mock(
             async_pre_backup=AsyncMock(),
             async_post_backup=_mock_step,
+            spec=["async_pre_backup", "async_post_backup"],
         ),
     )
 
@@ -285,6 +371,44 @@ async def test_exception_plaform_post(hass: HomeAssistant) -> None:
         await _mock_backup_generation(manager)
 
 
+async def test_generate_backup_with_snapshot_platform(hass: HomeAssistant) -> None:
+    """Test generating a backup with a platform which snapshots its files."""
+    manager = BackupManager(hass)
+    manager.loaded_backups = True
+    progress: list[dict[str, Any]] = []
+    manager.async_subscribe_progress(progress.append)
+
+    async def _mock_snapshot(
+        hass: HomeAssistant,
+        snapshot_dir: Path,
+        progress_callback: Callable[[float], None],
+    ) -> dict[str, Path | None]:
+        progress_callback(1.0)
+        return {
+            "home-assistant_v2.db": snapshot_dir / "home-assistant_v2.db",
+            "home-assistant_v2.db-wal": None,
+        }
+
+    platform = Mock(
+        async_pre_backup=AsyncMock(),
+        async_post_backup=AsyncMock(),
+        async_snapshot_backup=_mock_snapshot,
+        spec=["async_pre_backup", "async_post_backup", "async_snapshot_backup"],
+    )
+    await _setup_mock_domain(hass, platform)
+
+    await _mock_backup_generation(manager)
+
+    # The snapshot replaces the pre and post backup actions
+    assert not platform.async_pre_backup.called
+    assert not platform.async_post_backup.called
+    assert progress == [
+        {"stage": "snapshot", "domain": "some_domain", "progress": 1.0},
+        {"stage": "archive"},
+        {"stage": "done"},
+    ]
+
+
 async def test_loading_platforms_when_running_pre_backup_actions(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
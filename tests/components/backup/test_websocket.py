@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 from syrupy import SnapshotAssertion
 
+from homeassistant.components.backup.const import DATA_MANAGER
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
@@ -227,3 +228,22 @@ async def test_backup_start_excepion(
     ):
         await client.send_json_auto_id({"type": "backup/start"})
         assert snapshot == await client.receive_json()
+
+
+async def test_subscribe_progress(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test subscribing to the progress of backups."""
+    await setup_backup_integration(hass)
+
+    client = await hass_ws_client(hass)
+    await hass.async_block_till_done()
+
+    await client.send_json_auto_id({"type": "backup/subscribe_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+
+    hass.data[DATA_MANAGER]._async_report_progress({"stage": "archive"})
+    response = await client.receive_json()
+    assert response["event"] == {"stage": "archive"}
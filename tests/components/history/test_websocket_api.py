@@ -5,6 +5,7 @@ from datetime import timedelta
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import history
@@ -232,6 +233,93 @@ async def test_history_during_period_impossible_conditions(
     assert response["result"] == {}
 
 
+async def test_history_during_period_downsampled(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period downsamples the states with a unit."""
+    now = dt_util.utcnow()
+    start = now + timedelta(seconds=5)
+    end = start + timedelta(seconds=100)
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    hass.states.async_set("binary_sensor.door", STATE_OFF)
+    for offset in range(1, 100, 2):
+        freezer.move_to(start + timedelta(seconds=offset))
+        hass.states.async_set("sensor.power", str(offset), {"unit_of_measurement": "W"})
+        hass.states.async_set(
+            "binary_sensor.door", STATE_ON if offset % 4 == 1 else STATE_OFF
+        )
+        await async_recorder_block_till_done(hass)
+    freezer.move_to(end + timedelta(seconds=10))
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "entity_ids": ["sensor.power", "binary_sensor.door"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert list(response["result"]) == ["sensor.power", "binary_sensor.door"]
+
+    power_history = response["result"]["sensor.power"]
+    assert len(power_history) == 11
+    assert power_history[0] == {"s": "10", "lu": ANY}
+    assert power_history[1] == {"s": "9", "lu": ANY, "min": 1.0, "max": 9.0}
+    assert power_history[-1] == {"s": "99", "lu": ANY, "min": 91.0, "max": 99.0}
+    # The states without a unit are not downsampled
+    assert len(response["result"]["binary_sensor.door"]) == 51
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "include_start_time_state": False,
+            "no_attributes": True,
+            "resolution": 50,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "sensor.power": [
+            {"s": "49", "lu": ANY, "min": 1.0, "max": 49.0},
+            {"s": "99", "lu": ANY, "min": 51.0, "max": 99.0},
+        ]
+    }
+
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 10,
+            "resolution": 50,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 @pytest.mark.parametrize(
     "time_zone", ["UTC", "Europe/Berlin", "America/Chicago", "US/Hawaii"]
 )
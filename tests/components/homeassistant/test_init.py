@@ -23,6 +23,7 @@ from homeassistant.const import (
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
     EVENT_CORE_CONFIG_UPDATE,
+    EVENT_HOMEASSISTANT_STOP,
     SERVICE_SAVE_PERSISTENT_STATES,
     SERVICE_TOGGLE,
     SERVICE_TURN_OFF,
@@ -125,6 +126,25 @@ async def test_reload_core_conf(hass: HomeAssistant) -> None:
     assert state.attributes.get("hello") == "world"
 
 
+@patch("homeassistant.config.os.path.isfile", Mock(return_value=True))
+async def test_clear_yaml_parse_cache(hass: HomeAssistant) -> None:
+    """Test the YAML parse cache is cleared on core config reload and stop."""
+    await async_setup_component(hass, ha.DOMAIN, {})
+    files = {config.YAML_CONFIG_FILE: yaml.dump({ha.DOMAIN: {"country": "SE"}})}
+    with (
+        patch("homeassistant.components.homeassistant.clear_parse_cache") as mock_clear,
+        patch_yaml_files(files, True),
+    ):
+        await hass.services.async_call(
+            ha.DOMAIN, SERVICE_RELOAD_CORE_CONFIG, blocking=True
+        )
+        assert len(mock_clear.mock_calls) == 1
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        assert len(mock_clear.mock_calls) == 2
+
+
 @patch("homeassistant.config.os.path.isfile", Mock(return_value=True))
 @patch("homeassistant.components.homeassistant._LOGGER.error")
 @patch("homeassistant.config.async_process_ha_core_config")
@@ -13,6 +13,7 @@ import jwt
 import pytest
 import yarl
 
+from homeassistant.auth import jwt_wrapper
 from homeassistant.auth.const import GROUP_ID_READ_ONLY
 from homeassistant.auth.models import User
 from homeassistant.auth.providers import trusted_networks
@@ -333,6 +334,59 @@ async def test_auth_access_signed_path_with_refresh_token(
     assert req.status == HTTPStatus.UNAUTHORIZED
 
 
+async def test_auth_verified_tokens_cached(
+    hass: HomeAssistant,
+    app: web.Application,
+    aiohttp_client: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test verified access tokens and signatures are cached until revoked."""
+    app.router.add_get("/another_path", mock_handler)
+    await async_setup_auth(hass, app)
+    client = await aiohttp_client(app)
+
+    refresh_token = hass.auth.async_validate_access_token(hass_access_token)
+    signed_path = async_sign_path(
+        hass, "/", timedelta(seconds=5), refresh_token_id=refresh_token.id
+    )
+
+    with (
+        patch(
+            "homeassistant.components.http.auth.jwt_wrapper.verify_and_decode",
+            wraps=jwt_wrapper.verify_and_decode,
+        ) as mock_verify,
+        patch.object(
+            hass.auth,
+            "async_validate_access_token",
+            wraps=hass.auth.async_validate_access_token,
+        ) as mock_validate,
+    ):
+        for _ in range(3):
+            req = await client.get(signed_path)
+            assert req.status == HTTPStatus.OK
+            req = await client.get(
+                "/", headers={"Authorization": f"Bearer {hass_access_token}"}
+            )
+            assert req.status == HTTPStatus.OK
+
+        # Verified once for the signature and once for the access token
+        assert mock_verify.call_count == 2
+        assert mock_validate.call_count == 1
+
+        # The cached signature is still only valid for its path
+        req = await client.get(f"/another_path?{signed_path.split('?')[1]}")
+        assert req.status == HTTPStatus.UNAUTHORIZED
+
+        # Revoking the refresh token removes the cached tokens
+        hass.auth.async_remove_refresh_token(refresh_token)
+        req = await client.get(signed_path)
+        assert req.status == HTTPStatus.UNAUTHORIZED
+        req = await client.get(
+            "/", headers={"Authorization": f"Bearer {hass_access_token}"}
+        )
+        assert req.status == HTTPStatus.UNAUTHORIZED
+
+
 async def test_auth_access_signed_path_with_query_param(
     hass: HomeAssistant,
     app: web.Application,
@@ -911,6 +911,48 @@ async def test_light_turn_on_auth(
         )
 
 
+async def test_light_turn_on_batch_service_handler(hass: HomeAssistant) -> None:
+    """Test turning on lights of a platform with a batch handler."""
+    entities = [
+        MockLight("Test_0", STATE_ON),
+        MockLight("Test_1", STATE_ON),
+    ]
+    setup_test_component_platform(hass, light.DOMAIN, entities)
+    for entity, brightness in zip(entities, (100, 50), strict=True):
+        entity.supported_color_modes = {light.ColorMode.BRIGHTNESS}
+        entity.color_mode = light.ColorMode.BRIGHTNESS
+        entity.brightness = brightness
+
+    assert await async_setup_component(hass, "light", {"light": {"platform": "test"}})
+    await hass.async_block_till_done()
+
+    batches: list[dict] = []
+
+    async def handle_turn_on(entity_kwargs: dict) -> None:
+        batches.append(entity_kwargs)
+
+    entities[0].platform.async_register_batch_service_handler(
+        light.DOMAIN, SERVICE_TURN_ON, handle_turn_on
+    )
+
+    await hass.services.async_call(
+        light.DOMAIN,
+        SERVICE_TURN_ON,
+        {
+            ATTR_ENTITY_ID: [entity.entity_id for entity in entities],
+            "brightness_step": -10,
+        },
+        blocking=True,
+    )
+
+    # The service data is processed for each light, so the lights are not batched
+    assert batches == []
+    _, data = entities[0].last_call("turn_on")
+    assert data == {light.ATTR_BRIGHTNESS: 90}
+    _, data = entities[1].last_call("turn_on")
+    assert data == {light.ATTR_BRIGHTNESS: 40}
+
+
 async def test_light_brightness_step(hass: HomeAssistant) -> None:
     """Test that light context works."""
     entities = [
@@ -17,8 +17,15 @@ from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook.models import EventAsRow, LazyEventPartialState
 from homeassistant.components.logbook.processor import EventProcessor
+from homeassistant.components.logbook.queries import statement_for_request
 from homeassistant.components.logbook.queries.common import PSEUDO_EVENT_STATE_CHANGED
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.db_schema import EventDataTargets
+from homeassistant.components.recorder.models import extract_event_type_ids
+from homeassistant.components.recorder.util import (
+    execute_stmt_lambda_element,
+    session_scope,
+)
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.components.sensor import SensorStateClass
 from homeassistant.const import (
@@ -46,6 +53,7 @@ from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entityfilter import CONF_ENTITY_GLOBS
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .common import MockRow, mock_humanify
 
@@ -2764,6 +2772,57 @@ async def test_get_events_with_device_ids(
     assert isinstance(results[3]["when"], float)
 
 
+async def test_statement_before_event_data_targets_extracted(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the queries match the event data until the targets are extracted."""
+    hass.bus.async_fire("mock_event", {"entity_id": "switch.test", "message": "a"})
+    hass.bus.async_fire("mock_event", {"device_id": "abc123", "message": "b"})
+    await async_wait_recording_done(hass)
+    assert recorder_mock.use_event_data_targets is True
+
+    def _delete_event_data_targets() -> None:
+        with session_scope(session=recorder_mock.get_session()) as session:
+            session.query(EventDataTargets).delete()
+
+    await recorder_mock.async_add_executor_job(_delete_event_data_targets)
+
+    def _get_messages(
+        entity_ids: list[str] | None,
+        device_ids: list[str] | None,
+        use_event_data_targets: bool,
+    ) -> list[str]:
+        with session_scope(session=recorder_mock.get_session()) as session:
+            event_type_ids = tuple(
+                extract_event_type_ids(
+                    recorder_mock.event_type_manager.get_many(("mock_event",), session)
+                )
+            )
+            stmt = statement_for_request(
+                dt_util.utcnow() - timedelta(hours=1),
+                dt_util.utcnow() + timedelta(hours=1),
+                event_type_ids,
+                entity_ids,
+                [],
+                device_ids,
+                use_event_data_targets=use_event_data_targets,
+            )
+            return [
+                json_loads(row.event_data)["message"]
+                for row in execute_stmt_lambda_element(session, stmt, orm_rows=False)
+                if not row.context_only
+            ]
+
+    # The targets of the existing event data are still being extracted
+    assert _get_messages(["switch.test"], None, False) == ["a"]
+    assert _get_messages(None, ["abc123"], False) == ["b"]
+    assert _get_messages(["switch.test"], ["abc123"], False) == ["a", "b"]
+
+    assert _get_messages(["switch.test"], None, True) == []
+    assert _get_messages(None, ["abc123"], True) == []
+    assert _get_messages(["switch.test"], ["abc123"], True) == []
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_logbook_select_entities_context_id(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
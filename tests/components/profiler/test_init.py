@@ -1,10 +1,15 @@
 """Test the Profiler config flow."""
 
+import asyncio
 from datetime import timedelta
 from functools import lru_cache
+import json
 import logging
 import os
 from pathlib import Path
+import threading
+import time
+from types import CodeType
 from unittest.mock import patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -18,6 +23,7 @@ from homeassistant.components.profiler import (
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_DUMP_SAMPLER,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
@@ -27,16 +33,24 @@ from homeassistant.components.profiler import (
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_START_LOOP_MONITOR,
+    SERVICE_START_SAMPLER,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_STOP_LOOP_MONITOR,
+    SERVICE_STOP_SAMPLER,
 )
 from homeassistant.components.profiler.const import DOMAIN
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.components.profiler.loop_monitor import REPORT_INTERVAL
+from homeassistant.components.profiler.sampler import StackSampler
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, STATE_UNAVAILABLE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -446,3 +460,182 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_sampler(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, tmp_path: Path
+) -> None:
+    """Test the sampling profiler."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/sampler"})
+    msg = await client.receive_json()
+    assert not msg["success"]
+
+    with pytest.raises(HomeAssistantError, match="Sampler not started"):
+        await hass.services.async_call(DOMAIN, SERVICE_DUMP_SAMPLER, {}, blocking=True)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_SAMPLER, {"interval": 0.5}, blocking=True
+    )
+    with pytest.raises(HomeAssistantError, match="Sampler already running"):
+        await hass.services.async_call(DOMAIN, SERVICE_START_SAMPLER, {}, blocking=True)
+
+    sampler: StackSampler = hass.data[DOMAIN]["sampler"]
+    assert sampler.running
+    # Sample from the event loop to always find the loop busy
+    sampler.sample()
+
+    await client.send_json_auto_id({"type": "profiler/sampler"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    report = msg["result"]
+    assert report["running"] is True
+    assert report["samples"] >= 1
+    assert report["threads"]["event_loop"] >= 1
+    assert sum(report["integrations"].values()) == report["samples"]
+    flamegraph = report["flamegraph"]
+    assert flamegraph["value"] == report["samples"]
+    assert "event_loop" in [child["name"] for child in flamegraph["children"]]
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_SAMPLER, {}, blocking=True)
+    assert not sampler.running
+    with pytest.raises(HomeAssistantError, match="Sampler not running"):
+        await hass.services.async_call(DOMAIN, SERVICE_STOP_SAMPLER, {}, blocking=True)
+
+    written: list[str] = []
+
+    def _mock_path(filename: str) -> str:
+        written.append(str(tmp_path / filename))
+        return written[-1]
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(DOMAIN, SERVICE_DUMP_SAMPLER, {}, blocking=True)
+
+    speedscope_path, collapsed_path = written
+    speedscope = json.loads(Path(speedscope_path).read_text())
+    assert speedscope["profiles"][0]["type"] == "sampled"
+    assert speedscope["shared"]["frames"]
+    collapsed = Path(collapsed_path).read_text()
+    assert collapsed.startswith("event_loop;")
+
+    # Unloading stops a running sampler and waits for its thread to exit
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_SAMPLER, {"interval": 0.5}, blocking=True
+    )
+    sampler = hass.data[DOMAIN]["sampler"]
+    assert sampler.running
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not sampler.running
+    assert not any(thread.name == "ProfilerSampler" for thread in threading.enumerate())
+
+
+def test_sampler_integration_attribution() -> None:
+    """Test samples are attributed to the innermost integration."""
+
+    def _code(filename: str) -> CodeType:
+        return compile("pass", filename, "exec")
+
+    core = _code("/srv/homeassistant/core.py")
+    hue = _code("/srv/homeassistant/components/hue/light.py")
+    custom = _code("/config/custom_components/my_custom/sensor.py")
+    library = _code("/srv/site-packages/aiohue/v2/__init__.py")
+
+    sampler = StackSampler(0)
+    assert sampler._get_integration((core, hue, library)) == "hue"
+    assert sampler._get_integration((core, hue, custom, library)) == "my_custom"
+    assert sampler._get_integration((core, library)) == "homeassistant"
+    assert sampler._get_integration((library,)) == "other"
+
+
+def _block_event_loop() -> None:
+    """Block the event loop well past the stall threshold of the test."""
+    time.sleep(0.6)
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_loop_monitor(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the event loop monitor."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    lag_entity_id, utilization_entity_id, stalls_entity_id = (
+        entity_registry.async_get_entity_id("sensor", DOMAIN, f"{entry.entry_id}_{key}")
+        for key in ("event_loop_lag", "event_loop_utilization", "event_loop_stalls")
+    )
+    assert hass.states.get(stalls_entity_id).state == STATE_UNAVAILABLE
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/loop_monitor/subscribe"})
+    msg = await client.receive_json()
+    assert not msg["success"]
+
+    original_handle_run = getattr(asyncio.Handle, "_run")
+    await hass.services.async_call(
+        DOMAIN, SERVICE_START_LOOP_MONITOR, {"stall_threshold": 0.5}, blocking=True
+    )
+    with pytest.raises(HomeAssistantError, match="already running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_LOOP_MONITOR, {}, blocking=True
+        )
+    assert getattr(asyncio.Handle, "_run") is not original_handle_run
+
+    await client.send_json_auto_id({"type": "profiler/loop_monitor/subscribe"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    msg = await client.receive_json()
+    assert msg["event"]["type"] == "report"
+
+    @callback
+    def _listener(event: Event) -> None:
+        pass
+
+    hass.bus.async_listen("test_event", _listener)
+    hass.bus.async_fire("test_event")
+    hass.loop.call_soon(_block_event_loop)
+    await hass.async_block_till_done()
+
+    msg = await client.receive_json()
+    assert msg["event"]["type"] == "stall"
+    assert msg["event"]["stall"]["callback"] == "_block_event_loop"
+    assert "Event loop blocked for" in caplog.text
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=REPORT_INTERVAL))
+    await hass.async_block_till_done()
+    msg = await client.receive_json()
+    assert msg["event"]["type"] == "report"
+    report = msg["event"]["report"]
+    assert report["stall_count"] == 1
+    assert report["events"]["test_event"]["count"] == 1
+    assert "listen test_event: test_loop_monitor.<locals>._listener" in report["jobs"]
+    assert report["lag"]["count"] >= 1
+    assert hass.states.get(stalls_entity_id).state == "1"
+    assert hass.states.get(lag_entity_id).state != STATE_UNAVAILABLE
+    assert hass.states.get(utilization_entity_id).state != STATE_UNAVAILABLE
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_LOOP_MONITOR, {}, blocking=True)
+    assert getattr(asyncio.Handle, "_run") is original_handle_run
+    assert "async_run_hass_job" not in hass.__dict__
+    assert hass.states.get(stalls_entity_id).state == STATE_UNAVAILABLE
+    with pytest.raises(HomeAssistantError, match="not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_LOOP_MONITOR, {}, blocking=True
+        )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -1,14 +1,23 @@
 """Test backup platform for the Recorder integration."""
 
+from pathlib import Path
+import sqlite3
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant.components.recorder import Recorder
-from homeassistant.components.recorder.backup import async_post_backup, async_pre_backup
+from homeassistant.components.recorder.backup import (
+    async_post_backup,
+    async_pre_backup,
+    async_snapshot_backup,
+)
+from homeassistant.components.recorder.util import dburl_to_path
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
+from .common import async_wait_recording_done
+
 
 async def test_async_pre_backup(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Test pre backup."""
@@ -70,3 +79,61 @@ async def test_async_post_backup_failure(
     ):
         await async_post_backup(hass)
     assert unlock_mock.called
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_async_snapshot_backup(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test copying the database without locking it."""
+    db_path = Path(dburl_to_path(recorder_mock.db_url))
+    hass.config.config_dir = str(db_path.parent)
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+
+    progress: list[float] = []
+    with patch(
+        "homeassistant.components.recorder.core.Recorder.lock_database"
+    ) as lock_mock:
+        snapshots = await async_snapshot_backup(hass, tmp_path, progress.append)
+        await hass.async_block_till_done()
+    assert not lock_mock.called
+
+    snapshot_path = tmp_path / db_path.name
+    assert snapshots == {
+        db_path.name: snapshot_path,
+        f"{db_path.name}-wal": None,
+        f"{db_path.name}-shm": None,
+    }
+    assert progress[-1] == 1.0
+
+    def _read_snapshot() -> list[tuple[str]]:
+        with sqlite3.connect(snapshot_path) as conn:
+            return conn.execute(
+                "SELECT entity_id FROM states_meta WHERE entity_id = 'sensor.test'"
+            ).fetchall()
+
+    assert await hass.async_add_executor_job(_read_snapshot) == [("sensor.test",)]
+
+
+async def test_async_snapshot_backup_outside_config_dir(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test there is nothing to copy if the database is not in the config dir."""
+    assert await async_snapshot_backup(hass, tmp_path, lambda _: None) == {}
+
+
+async def test_async_snapshot_backup_with_migration(
+    recorder_mock: Recorder, hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test copying the database during a migration."""
+    with (
+        patch(
+            "homeassistant.components.recorder.backup.async_migration_in_progress",
+            return_value=True,
+        ),
+        pytest.raises(HomeAssistantError),
+    ):
+        await async_snapshot_backup(hass, tmp_path, lambda _: None)
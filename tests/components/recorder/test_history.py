@@ -5,19 +5,24 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
+import re
 from unittest.mock import sentinel
 
 from freezegun import freeze_time
 import pytest
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.engine import Dialect
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
     StateAttributes,
     States,
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.history import modern
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
@@ -928,6 +933,138 @@ async def test_state_changes_during_period_multiple_entities_single_test(
         assert hist[entity_id][0].state == value
 
 
+@pytest.mark.parametrize("no_attributes", [True, False])
+async def test_get_downsampled_states(hass: HomeAssistant, no_attributes: bool) -> None:
+    """Test the states are downsampled to buckets."""
+    entity_id = "sensor.power"
+    attributes = {"unit_of_measurement": "W"}
+    now = dt_util.utcnow()
+    start = now + timedelta(seconds=5)
+
+    with freeze_time(now) as freezer:
+        hass.states.async_set(entity_id, "20", attributes)
+        for offset, state in (
+            (1, "10"),
+            (20, "30"),
+            (40, "unavailable"),
+            (70, "5"),
+            # Just past the middle of the second bucket
+            (95, "8"),
+            (130, "unknown"),
+        ):
+            freezer.move_to(start + timedelta(seconds=offset))
+            hass.states.async_set(entity_id, state, attributes)
+            await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_downsampled_states(
+        hass,
+        start,
+        start + timedelta(seconds=200),
+        [entity_id, "sensor.not_recorded"],
+        60,
+        no_attributes=no_attributes,
+    )
+
+    start_state = {"s": "20", "lu": start.timestamp()}
+    if not no_attributes:
+        start_state["a"] = attributes
+    assert hist == {
+        entity_id: [
+            start_state,
+            {
+                "s": "unavailable",
+                "lu": pytest.approx((start + timedelta(seconds=40)).timestamp()),
+                "min": 10.0,
+                "max": 30.0,
+            },
+            {
+                "s": "8",
+                "lu": pytest.approx((start + timedelta(seconds=95)).timestamp()),
+                "min": 5.0,
+                "max": 8.0,
+            },
+            {
+                "s": "unknown",
+                "lu": pytest.approx((start + timedelta(seconds=130)).timestamp()),
+            },
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    ("dialect_name", "dialect", "expected"),
+    [
+        (
+            SupportedDialect.SQLITE,
+            sqlite.dialect(),
+            "CASE WHEN (states.state GLOB '*[0-9]*') "
+            "THEN CAST(states.state AS FLOAT) END",
+        ),
+        (
+            SupportedDialect.MYSQL,
+            mysql.dialect(),
+            "CASE WHEN (states.state REGEXP '{pattern}') THEN states.state + 0 END",
+        ),
+        (
+            SupportedDialect.POSTGRESQL,
+            postgresql.dialect(),
+            "CASE WHEN (states.state ~ '{pattern}') "
+            "THEN CAST(states.state AS FLOAT) END",
+        ),
+    ],
+)
+def test_downsampled_numeric_state(
+    dialect_name: SupportedDialect, dialect: Dialect, expected: str
+) -> None:
+    """Test only numeric states are cast to a number on each dialect."""
+    numeric_state = modern._numeric_state(dialect_name)
+    assert str(
+        numeric_state.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    ) == expected.format(pattern=modern._NUMERIC_STATE_PATTERN)
+
+    pattern = re.compile(modern._NUMERIC_STATE_PATTERN)
+    for state in ("5", "-1.5", "+2.", ".5", "1e10", "1.5E-3"):
+        assert pattern.match(state)
+    for state in ("unavailable", "1.2.3", "12abc", "", "1e999", "-"):
+        assert not pattern.match(state)
+
+
+@pytest.mark.parametrize(
+    ("dialect_name", "dialect", "expected"),
+    [
+        (
+            SupportedDialect.SQLITE,
+            sqlite.dialect(),
+            "CAST((states.last_updated_ts - 100.0) / (60.0 + 0.0) AS INTEGER)",
+        ),
+        (
+            SupportedDialect.MYSQL,
+            mysql.dialect(),
+            "floor((states.last_updated_ts - 100.0) / 60.0)",
+        ),
+        (
+            SupportedDialect.POSTGRESQL,
+            postgresql.dialect(),
+            "floor((states.last_updated_ts - 100.0) / CAST(60.0 AS FLOAT))",
+        ),
+    ],
+)
+def test_downsampled_bucket_index(
+    dialect_name: SupportedDialect, dialect: Dialect, expected: str
+) -> None:
+    """Test the states are put in buckets rounding down on each dialect."""
+    bucket_index = modern._bucket_index(100.0, 60.0, dialect_name)
+    assert (
+        str(
+            bucket_index.compile(
+                dialect=dialect, compile_kwargs={"literal_binds": True}
+            )
+        )
+        == expected
+    )
+
+
 @pytest.mark.freeze_time("2039-01-19 03:14:07.555555-00:00")
 async def test_get_full_significant_states_past_year_2038(
     hass: HomeAssistant,
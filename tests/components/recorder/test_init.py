@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -34,6 +35,7 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_READER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -42,6 +44,7 @@ from homeassistant.components.recorder.const import (
 from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
     EventData,
+    EventDataTargets,
     Events,
     EventTypes,
     RecorderRuns,
@@ -134,6 +137,7 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        db_read_pool_size=4,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
     )
@@ -854,6 +858,42 @@ async def test_saving_state_and_removing_entity(
         assert states[2].state is None
 
 
+async def test_saving_states_meta_continuous(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test the continuous flag of the states meta is kept up to date."""
+
+    def _get_continuous() -> dict[str, bool | None]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return dict(session.query(StatesMeta.entity_id, StatesMeta.continuous))
+
+    hass.states.async_set("sensor.temperature", "20", {"unit_of_measurement": "°C"})
+    hass.states.async_set("sensor.text", "on")
+    hass.states.async_set("counter.mine", "1")
+    hass.states.async_set("light.mine", "on", {"unit_of_measurement": "lx"})
+    await async_wait_recording_done(hass)
+
+    assert _get_continuous() == {
+        "sensor.temperature": True,
+        "sensor.text": False,
+        "counter.mine": True,
+        "light.mine": False,
+    }
+
+    hass.states.async_set("sensor.temperature", "21")
+    hass.states.async_set("sensor.text", "off", {"unit_of_measurement": "x"})
+    hass.states.async_remove("counter.mine")
+    await async_wait_recording_done(hass)
+
+    assert _get_continuous() == {
+        "sensor.temperature": False,
+        "sensor.text": True,
+        "counter.mine": True,
+        "light.mine": False,
+    }
+
+
 async def test_saving_state_with_oversized_attributes(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -921,6 +961,33 @@ async def test_saving_event_with_oversized_data(
     assert json_loads(events["test_event_too_big"]) == {}
 
 
+async def test_saving_event_data_targets(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test the entity and device ids of event data are saved."""
+    hass.bus.async_fire("test_event", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test_event", {"device_id": "abc", "entity_id": "light.bed"})
+    hass.bus.async_fire("test_event", {"entity_id": ["light.a", "light.b"]})
+    hass.bus.async_fire("test_event", {"device_id": "abc", "a": "b" * 32768})
+    hass.bus.async_fire("test_event", {"other": "data"})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        targets = [
+            (entity_id, device_id)
+            for _, entity_id, device_id in session.query(
+                Events.event_id,
+                EventDataTargets.entity_id,
+                EventDataTargets.device_id,
+            )
+            .join(EventDataTargets, Events.data_id == EventDataTargets.data_id)
+            .order_by(Events.event_id)
+        ]
+
+    assert targets == [("light.kitchen", None), ("light.bed", "abc")]
+
+
 async def test_saving_event_invalid_context_ulid(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
@@ -2362,7 +2429,10 @@ async def test_connect_args_priority(hass: HomeAssistant, config_url) -> None:
 
     with (
         patch("sqlalchemy.engine.url.URL._get_entrypoint", MockEntrypoint),
-        patch("sqlalchemy.engine.create.util.get_cls_kwargs", return_value=["echo"]),
+        patch(
+            "sqlalchemy.engine.create.util.get_cls_kwargs",
+            return_value=["echo", "pool_size"],
+        ),
     ):
         await async_setup_component(
             hass,
@@ -2746,3 +2816,36 @@ async def test_empty_entity_id(
     hass.bus.async_fire("hello", {"entity_id": ""})
     await async_wait_recording_done(hass)
     assert "Invalid entity ID" not in caplog.text
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_read_executor_job(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test read only jobs run concurrently with read only connections."""
+    instance = await async_setup_recorder_instance(hass, {"db_read_pool_size": 3})
+    # Each job waits for the others, so they must run concurrently
+    barrier = threading.Barrier(3, timeout=10)
+
+    def _read_job() -> tuple[str, int]:
+        barrier.wait()
+        with session_scope(hass=hass, read_only=True) as session:
+            query_only = session.execute(text("PRAGMA query_only")).scalar_one()
+        return threading.current_thread().name, query_only
+
+    results = await asyncio.gather(
+        *(instance.async_add_read_executor_job(_read_job) for _ in range(3))
+    )
+    assert len({name for name, _ in results}) == 3
+    for name, query_only in results:
+        assert name.startswith(DB_READER_PREFIX)
+        assert query_only == 1
+
+    def _worker_job() -> int:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.execute(text("PRAGMA query_only")).scalar_one()
+
+    assert await instance.async_add_executor_job(_worker_job) == 0
@@ -1470,3 +1470,88 @@ def test_update_states_table_with_foreign_key_options_unsupported_engine(
         match="_update_states_table_with_foreign_key_options not supported for sqlite",
     ):
         migration._update_states_table_with_foreign_key_options(session_maker, engine)
+
+
+async def test_extract_event_data_targets(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test extracting the targets of the event data recorded before schema 50."""
+    instance = await async_setup_recorder_instance(hass)
+    shared_datas = (
+        '{"entity_id":"light.kitchen"}',
+        '{"device_id":"abc"}',
+        '{"other":"data"}',
+        '{"entity_id":["light.a","light.b"]}',
+        '{"entity_id":"light.bed","device_id":"def"}',
+        "not json",
+    )
+
+    def _insert_event_data() -> None:
+        with session_scope(hass=hass) as session:
+            session.add_all(
+                db_schema.EventData(shared_data=shared_data, hash=1)
+                for shared_data in shared_datas
+            )
+
+    def _get_targets() -> list[tuple[str, str | None, str | None]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                tuple(row)
+                for row in session.query(
+                    db_schema.EventData.shared_data,
+                    db_schema.EventDataTargets.entity_id,
+                    db_schema.EventDataTargets.device_id,
+                )
+                .join(
+                    db_schema.EventDataTargets,
+                    db_schema.EventData.data_id == db_schema.EventDataTargets.data_id,
+                )
+                .order_by(db_schema.EventData.data_id)
+            ]
+
+    await instance.async_add_executor_job(_insert_event_data)
+    assert await instance.async_add_executor_job(_get_targets) == []
+
+    def _needs_migrate(
+        migrator: migration.EventDataTargetsMigration,
+    ) -> migration.DataMigrationStatus:
+        with session_scope(hass=hass, read_only=True) as session:
+            return migrator.needs_migrate_impl(instance, session)
+
+    migrator = migration.EventDataTargetsMigration(50, {})
+    assert await instance.async_add_executor_job(
+        _needs_migrate, migrator
+    ) == migration.DataMigrationStatus(needs_migrate=True, migration_done=False)
+
+    # The event data is processed in batches
+    instance.use_event_data_targets = False
+    instance.max_bind_vars = 2
+    batches = 1
+    while not await instance.async_add_executor_job(migrator.migrate_data, instance):
+        assert instance.use_event_data_targets is False
+        batches += 1
+    assert batches > 2
+    assert instance.use_event_data_targets is True
+    expected = [
+        ('{"entity_id":"light.kitchen"}', "light.kitchen", None),
+        ('{"device_id":"abc"}', None, "abc"),
+        ('{"entity_id":"light.bed","device_id":"def"}', "light.bed", "def"),
+    ]
+    assert await instance.async_add_executor_job(_get_targets) == expected
+
+    # Event data which already has targets is skipped when the migration restarts
+    migrator = migration.EventDataTargetsMigration(50, {})
+    while not await instance.async_add_executor_job(migrator.migrate_data, instance):
+        pass
+    assert await instance.async_add_executor_job(_get_targets) == expected
+
+    # The migration is marked as done
+    def _get_migration_changes() -> dict[str, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return {
+                change.migration_id: change.version
+                for change in session.query(db_schema.MigrationChanges)
+            }
+
+    migration_changes = await instance.async_add_executor_job(_get_migration_changes)
+    assert migration_changes[migration.EventDataTargetsMigration.migration_id] == 1
@@ -9,7 +9,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsCalendarRuns,
+    StatisticsDay,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -35,6 +39,7 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.tasks import CompileMissingCalendarStatisticsTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant
@@ -1844,6 +1849,150 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-10-10 00:00:00+00:00")
+async def test_daily_statistics_from_calendar_table(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone,
+) -> None:
+    """Test daily statistics are compiled and served from the calendar table."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 23:00:00"))
+    period3 = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 00:00:00"))
+    period4 = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 23:00:00"))
+
+    external_statistics = (
+        {"start": period1, "last_reset": None, "state": 0, "sum": 2},
+        {"start": period2, "last_reset": None, "state": 1, "sum": 3},
+        {"start": period3, "last_reset": None, "state": 2, "sum": 4},
+        {"start": period4, "last_reset": None, "state": 3, "sum": 5},
+    )
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+    day1_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00"))
+    day1_end = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 00:00:00"))
+    day2_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 00:00:00"))
+    day2_end = dt_util.as_utc(dt_util.parse_datetime("2022-10-05 00:00:00"))
+    expected_stats = {
+        "test:total_energy_import": [
+            {
+                "start": day1_start.timestamp(),
+                "end": day1_end.timestamp(),
+                "last_reset": None,
+                "state": 1.0,
+                "sum": 3.0,
+            },
+            {
+                "start": day2_start.timestamp(),
+                "end": day2_end.timestamp(),
+                "last_reset": None,
+                "state": 3.0,
+                "sum": 5.0,
+            },
+        ]
+    }
+    stats = statistics_during_period(
+        hass, period1, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    assert stats == expected_stats
+
+    recorder.get_instance(hass).queue_task(CompileMissingCalendarStatisticsTask())
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsDay).count() == 2
+        assert {run.time_zone for run in session.query(StatisticsCalendarRuns)} == {
+            timezone
+        }
+
+    # The compiled days are read from the calendar table
+    with patch.object(
+        statistics,
+        "_reduce_statistics_per_day",
+        side_effect=AssertionError("should not reduce hourly statistics"),
+    ):
+        stats = statistics_during_period(
+            hass, period1, period="day", statistic_ids={"test:total_energy_import"}
+        )
+    assert stats == expected_stats
+
+    stats = statistics_during_period(
+        hass,
+        start_time=period1,
+        statistic_ids={"test:total_energy_import"},
+        period="day",
+        types={"change"},
+    )
+    assert stats == {
+        "test:total_energy_import": [
+            {
+                "start": day1_start.timestamp(),
+                "end": day1_end.timestamp(),
+                "change": 3.0,
+            },
+            {
+                "start": day2_start.timestamp(),
+                "end": day2_end.timestamp(),
+                "change": 2.0,
+            },
+        ]
+    }
+
+    # Importing hourly statistics recompiles the affected day
+    async_add_external_statistics(
+        hass,
+        external_metadata,
+        ({"start": period2, "last_reset": None, "state": 1, "sum": 10},),
+    )
+    await async_wait_recording_done(hass)
+    stats = statistics_during_period(
+        hass, period1, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    assert stats["test:total_energy_import"][0]["sum"] == 10.0
+
+    # Calendar statistics compiled for another time zone are not used,
+    # they are rebuilt for the new time zone
+    await hass.config.async_set_time_zone("Pacific/Auckland")
+    stats = statistics_during_period(
+        hass, period1, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    expected_stats = statistics._reduce_statistics_per_day(
+        statistics_during_period(
+            hass,
+            period1 - timedelta(days=1),
+            period="hour",
+            statistic_ids={"test:total_energy_import"},
+            types={"last_reset", "state", "sum"},
+        ),
+        {"last_reset", "state", "sum"},
+    )
+    assert stats == expected_stats
+
+    recorder.get_instance(hass).queue_task(CompileMissingCalendarStatisticsTask())
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        assert {run.time_zone for run in session.query(StatisticsCalendarRuns)} == {
+            "Pacific/Auckland"
+        }
+    stats = statistics_during_period(
+        hass, period1, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    assert stats == expected_stats
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -1,6 +1,7 @@
 """The tests for the TTS component."""
 
 import asyncio
+from collections.abc import AsyncGenerator
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any
@@ -18,6 +19,7 @@ from homeassistant.components.media_player import (
     SERVICE_PLAY_MEDIA,
     MediaType,
 )
+from homeassistant.components.tts.const import DATA_TTS_MANAGER
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import ATTR_ENTITY_ID, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, State
@@ -41,6 +43,7 @@ from .common import (
 
 from tests.common import (
     MockModule,
+    async_fire_time_changed,
     async_mock_service,
     mock_integration,
     mock_platform,
@@ -1224,6 +1227,132 @@ async def test_load_cache_retrieve_without_mem_cache(
     assert await req.read() == tts_data
 
 
+async def test_cache_evicts_least_recently_used(
+    hass: HomeAssistant,
+    mock_tts_cache_dir: Path,
+    hass_ws_client: WebSocketGenerator,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the caches evict the least recently used messages."""
+
+    class MessageEntity(MockTTSEntity):
+        """Entity returning the message as audio."""
+
+        def get_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioType:
+            """Load TTS data."""
+            return ("mp3", message.encode())
+
+    await mock_config_entry_setup(hass, MessageEntity(DEFAULT_LANG))
+    manager = hass.data[DATA_TTS_MANAGER]
+    manager.cache_max_size = 20
+    manager.memory_max_size = 20
+
+    cache_keys: dict[str, str] = {}
+    for message in ("message 1", "message 2", "message 1", "message 3"):
+        media_source_id = tts.generate_media_source_id(hass, message, "tts.test")
+        assert await tts.async_get_media_source_audio(hass, media_source_id) == (
+            "mp3",
+            message.encode(),
+        )
+        cache_keys.setdefault(message, next(reversed(manager.mem_cache)))
+        await hass.async_block_till_done()
+
+    # Message 2 is the least recently used
+    assert list(manager.mem_cache) == [cache_keys["message 1"], cache_keys["message 3"]]
+    assert manager.mem_cache_size == 18
+    assert list(manager.file_cache) == [
+        cache_keys["message 1"],
+        cache_keys["message 3"],
+    ]
+    assert sorted(path.name for path in mock_tts_cache_dir.iterdir()) == sorted(
+        cache_file["filename"] for cache_file in manager.file_cache.values()
+    )
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "tts/cache/info"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == {
+        "memory": {"entries": 2, "size": 18, "max_size": 20},
+        "file": {"entries": 2, "size": 18, "max_size": 20},
+        "memory_hits": 1,
+        "file_hits": 0,
+        "misses": 3,
+        "memory_evictions": 1,
+        "file_evictions": 1,
+    }
+
+    freezer.tick(tts.STORAGE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[tts.STORAGE_KEY]["data"] == {
+        "cache_dir": str(mock_tts_cache_dir),
+        "files": {
+            cache_key: manager.file_cache[cache_key]
+            for cache_key in (cache_keys["message 1"], cache_keys["message 3"])
+        },
+    }
+
+
+async def test_load_cache_index(
+    hass: HomeAssistant,
+    mock_tts_entity: MockTTSEntity,
+    mock_tts_cache_dir: Path,
+    hass_client: ClientSessionGenerator,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the stored index of the cache is reconciled with the cache dir."""
+    tts_data = b"hello"
+    indexed_key = "42f18378fd4393d18c8dd11d03fa9563c1e54491_en-us_-_tts.test"
+    indexed_filename = f"{indexed_key}.mp3"
+    # Written after the index was last saved
+    unindexed_key = "5c0e61b5d8c2ec9c1b0a6a9b8cde0b24a4e3c1d2_en-us_-_tts.test"
+    unindexed_filename = f"{unindexed_key}.mp3"
+    for filename in (indexed_filename, unindexed_filename):
+        await hass.async_add_executor_job(
+            (mock_tts_cache_dir / filename).write_bytes, tts_data
+        )
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "minor_version": 1,
+        "key": tts.STORAGE_KEY,
+        "data": {
+            "cache_dir": str(mock_tts_cache_dir),
+            "files": {
+                indexed_key: {
+                    "filename": indexed_filename,
+                    "size": len(tts_data),
+                    "accessed": 0,
+                },
+                # Removed after the index was last saved
+                "a9cc7e5c1a4a6d1e3f1d3b5e0c9a0b7d7c2b1e4f_en-us_-_tts.test": {
+                    "filename": (
+                        "a9cc7e5c1a4a6d1e3f1d3b5e0c9a0b7d7c2b1e4f_en-us_-_tts.test.mp3"
+                    ),
+                    "size": 1000,
+                    "accessed": 0,
+                },
+            },
+        },
+    }
+    await mock_config_entry_setup(hass, mock_tts_entity)
+
+    tts_manager = hass.data[DATA_TTS_MANAGER]
+    assert list(tts_manager.file_cache) == [indexed_key, unindexed_key]
+    assert tts_manager.file_cache[indexed_key]["accessed"] == 0
+    assert tts_manager.file_cache[unindexed_key]["filename"] == unindexed_filename
+    assert tts_manager.file_cache_size == 2 * len(tts_data)
+
+    client = await hass_client()
+    for filename in (indexed_filename, unindexed_filename):
+        req = await client.get(f"/api/tts_proxy/{filename}")
+        assert req.status == HTTPStatus.OK
+        assert await req.read() == tts_data
+
+
 @pytest.mark.parametrize(
     ("setup", "data", "expected_url_suffix"),
     [
@@ -1571,6 +1700,92 @@ async def test_fetching_in_async(
     )
 
 
+async def test_streaming_in_async(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    mock_tts_cache_dir: Path,
+) -> None:
+    """Test the audio of a streaming engine is served while it is produced."""
+    tts_chunks: asyncio.Queue[bytes | Exception | None] = asyncio.Queue()
+
+    class EntityWithStreaming(MockTTSEntity):
+        """Entity that streams the audio."""
+
+        _attr_supports_streaming = True
+
+        async def async_stream_tts_audio(
+            self, message: str, language: str, options: dict[str, Any]
+        ) -> tts.TtsAudioStreamType:
+            async def _chunks() -> AsyncGenerator[bytes]:
+                while (chunk := await tts_chunks.get()) is not None:
+                    if isinstance(chunk, Exception):
+                        raise chunk
+                    yield chunk
+
+            return ("mp3", _chunks())
+
+    await mock_config_entry_setup(hass, EntityWithStreaming(DEFAULT_LANG))
+
+    media_source_id = tts.generate_media_source_id(
+        hass,
+        "test message",
+        "tts.test",
+        "en_US",
+        cache=None,
+    )
+    extension, stream = await tts.async_get_media_source_audio_stream(
+        hass, media_source_id
+    )
+    assert extension == "mp3"
+    task = hass.async_create_task(
+        tts.async_get_media_source_audio(hass, media_source_id)
+    )
+
+    url = await get_media_source_url(hass, media_source_id)
+    client = await hass_client()
+    client_get_task = hass.async_create_task(client.get(url))
+
+    tts_chunks.put_nowait(b"chunk 1 ")
+    assert await anext(stream) == b"chunk 1 "
+
+    # The response is sent before the audio is complete
+    req = await client_get_task
+    assert req.status == HTTPStatus.OK
+    assert req.headers["Transfer-Encoding"] == "chunked"
+    assert await req.content.readexactly(8) == b"chunk 1 "
+    assert not task.done()
+
+    tts_chunks.put_nowait(b"chunk 2")
+    tts_chunks.put_nowait(None)
+    assert [chunk async for chunk in stream] == [b"chunk 2"]
+    assert await req.read() == b"chunk 2"
+    assert await task == ("mp3", b"chunk 1 chunk 2")
+
+    # The complete audio is served from the memory cache
+    req = await client.get(url)
+    assert req.status == HTTPStatus.OK
+    assert "Transfer-Encoding" not in req.headers
+    assert await req.read() == b"chunk 1 chunk 2"
+
+    await hass.async_block_till_done()
+    assert (mock_tts_cache_dir / url.rsplit("/", 1)[1]).read_bytes() == (
+        b"chunk 1 chunk 2"
+    )
+
+    # Test an error of the engine before the first chunk
+    media_source_id = tts.generate_media_source_id(
+        hass, "test message 2", "tts.test", "en_US", None, None
+    )
+    url = await get_media_source_url(hass, media_source_id)
+    client_get_task = hass.async_create_task(client.get(url))
+    done, _ = await asyncio.wait((client_get_task,), timeout=0.1)
+    assert not done
+
+    tts_chunks.put_nowait(HomeAssistantError("test error"))
+    req = await client_get_task
+    assert req.status == HTTPStatus.NOT_FOUND
+
+
 @pytest.mark.parametrize(
     ("setup", "engine_id", "extra_data"),
     [
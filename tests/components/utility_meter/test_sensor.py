@@ -1,6 +1,7 @@
 """The tests for the utility_meter sensor platform."""
 
 from datetime import timedelta
+from unittest.mock import patch
 
 from freezegun import freeze_time
 import pytest
@@ -11,6 +12,7 @@ from homeassistant.components.select import (
 )
 from homeassistant.components.sensor import (
     ATTR_STATE_CLASS,
+    DATA_COMPONENT as SENSOR_DATA_COMPONENT,
     SensorDeviceClass,
     SensorStateClass,
 )
@@ -18,6 +20,7 @@ from homeassistant.components.utility_meter import DEFAULT_OFFSET
 from homeassistant.components.utility_meter.const import (
     ATTR_VALUE,
     DAILY,
+    DATA_SOURCE_TRACKERS,
     DOMAIN,
     HOURLY,
     QUARTER_HOURLY,
@@ -31,6 +34,7 @@ from homeassistant.components.utility_meter.sensor import (
     COLLECTING,
     PAUSED,
     UtilityMeterSensor,
+    _validate_state,
 )
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
@@ -2028,3 +2032,53 @@ async def test_device_id(
     utility_meter_no_tariffs_entity = entity_registry.async_get("sensor.energy")
     assert utility_meter_no_tariffs_entity is not None
     assert utility_meter_no_tariffs_entity.device_id == source_entity.device_id
+
+
+async def test_shared_source_tracker(hass: HomeAssistant) -> None:
+    """Test utility meters sharing a source subscribe and parse it once."""
+    assert await async_setup_component(
+        hass,
+        DOMAIN,
+        {
+            "utility_meter": {
+                "energy_daily": {"source": "sensor.energy", "cycle": "daily"},
+                "energy_monthly": {"source": "sensor.energy", "cycle": "monthly"},
+                "energy_net": {"source": "sensor.energy", "net_consumption": True},
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    trackers = hass.data[DATA_SOURCE_TRACKERS]
+    assert list(trackers) == ["sensor.energy"]
+
+    with patch(
+        "homeassistant.components.utility_meter.sensor._validate_state",
+        wraps=_validate_state,
+    ) as mock_validate_state:
+        for value in (2, 5, 3):
+            hass.states.async_set(
+                "sensor.energy",
+                value,
+                {ATTR_UNIT_OF_MEASUREMENT: UnitOfEnergy.KILO_WATT_HOUR},
+            )
+            await hass.async_block_till_done()
+
+    # The first state change parses the old and new state, later ones
+    # reuse the previously parsed state
+    assert mock_validate_state.call_count == 4
+
+    assert hass.states.get("sensor.energy_daily").state == "3"
+    assert hass.states.get("sensor.energy_monthly").state == "3"
+    assert hass.states.get("sensor.energy_net").state == "1"
+
+    # The tracker is dropped once its last utility meter is removed
+    component = hass.data[SENSOR_DATA_COMPONENT]
+    for entity_id in ("sensor.energy_daily", "sensor.energy_monthly"):
+        await component.get_entity(entity_id).async_remove()
+        assert list(trackers) == ["sensor.energy"]
+    await component.get_entity("sensor.energy_net").async_remove()
+    assert not trackers
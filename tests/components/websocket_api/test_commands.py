@@ -1262,6 +1262,49 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_coalesces_pending_changes(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test pending state changes of an entity are replaced by its latest state."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 0})
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.kitchen"]}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "off"
+
+    with patch("homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE", 1):
+        for brightness in range(1, 100):
+            hass.states.async_set("light.kitchen", "on", {"brightness": brightness})
+
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 7
+        assert msg["event"] == {
+            "a": {
+                "light.kitchen": {
+                    "a": {"brightness": 99},
+                    "c": ANY,
+                    "lc": ANY,
+                    "lu": ANY,
+                    "s": "on",
+                }
+            }
+        }
+
+        hass.states.async_set("light.kitchen", "off", {"brightness": 0})
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {
+            "c": {
+                "light.kitchen": {
+                    "+": {"a": {"brightness": 0}, "c": ANY, "lc": ANY, "s": "off"}
+                }
+            }
+        }
+
+
 async def test_subscribe_unsubscribe_entities_with_filter(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -345,6 +345,51 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_coalesced_message_replaces_pending_message(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test a pending message is replaced once the client falls behind."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    def _message(value: int) -> bytes:
+        return b'{"id":1,"type":"event","event":%d}' % value
+
+    with patch("homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE", 2):
+        # Below the threshold the messages are queued
+        instance._send_coalesced_message("key", _message(1), lambda: _message(0))
+        instance._send_coalesced_message("key", _message(2), lambda: _message(0))
+        assert len(instance._message_queue) == 2
+
+        # Above the threshold the last message with the key is replaced
+        instance._send_coalesced_message("other", _message(3), lambda: _message(0))
+        instance._send_coalesced_message("key", _message(0), lambda: _message(4))
+        instance._send_coalesced_message("key", _message(0), lambda: _message(5))
+        assert len(instance._message_queue) == 3
+
+        for event in (1, 5, 3):
+            msg = await websocket_client.receive_json()
+            assert msg["event"] == event
+
+        # A message which was written is not replaced
+        instance._send_coalesced_message("key", _message(6), lambda: _message(0))
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == 6
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -164,6 +164,86 @@ async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> N
     assert len(update_err) == 1
 
 
+async def test_staggered_polling(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test platforms staggering their updates poll entities on their own phase."""
+    platform = MockPlatform()
+    platform.STAGGER_UPDATES = True
+    entity_platform = MockEntityPlatform(
+        hass, platform=platform, scan_interval=timedelta(seconds=20)
+    )
+    start = dt_util.utcnow()
+
+    updates: list[str] = []
+    release_update = asyncio.Event()
+
+    class PollingEntity(MockEntity):
+        """Entity recording its updates."""
+
+        async def async_update(self) -> None:
+            updates.append(self.entity_id)
+            if self.entity_id == "test_domain.slow":
+                await release_update.wait()
+
+    fast = PollingEntity(entity_id="test_domain.fast", should_poll=True)
+    slow = PollingEntity(entity_id="test_domain.slow", should_poll=True)
+    no_poll = PollingEntity(entity_id="test_domain.no_poll", should_poll=False)
+    with patch(
+        "homeassistant.helpers.entity_platform.random.random",
+        side_effect=[0.25, 0.75],
+    ):
+        await entity_platform.async_add_entities([fast, slow, no_poll])
+
+    staggered_polling = entity_platform._staggered_polling
+    assert staggered_polling is not None
+
+    # The fast entity polls at 5s and the slow one at 15s of each interval
+    async_fire_time_changed(hass, start + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert updates == ["test_domain.fast"]
+
+    async_fire_time_changed(hass, start + timedelta(seconds=16))
+    await hass.async_block_till_done()
+    assert updates == ["test_domain.fast", "test_domain.slow"]
+
+    # The entities keep their phase in the following intervals
+    async_fire_time_changed(hass, start + timedelta(seconds=21))
+    await hass.async_block_till_done()
+    assert updates == ["test_domain.fast", "test_domain.slow"]
+
+    async_fire_time_changed(hass, start + timedelta(seconds=26))
+    await hass.async_block_till_done()
+    assert updates == ["test_domain.fast", "test_domain.slow", "test_domain.fast"]
+
+    # The slow entity is still updating on its next phase
+    async_fire_time_changed(hass, start + timedelta(seconds=31))
+    await hass.async_block_till_done()
+    assert staggered_polling.overruns == 0
+    async_fire_time_changed(hass, start + timedelta(seconds=36))
+    await hass.async_block_till_done()
+    assert updates == ["test_domain.fast", "test_domain.slow", "test_domain.fast"]
+    assert staggered_polling.overruns == 1
+    assert "took longer than the scheduled update interval" in caplog.text
+
+    release_update.set()
+    await hass.async_block_till_done()
+    assert len(staggered_polling.latencies) == 3
+
+    async_fire_time_changed(hass, start + timedelta(seconds=46))
+    await hass.async_block_till_done()
+    assert updates[3:] == ["test_domain.fast"]
+
+    await entity_platform.async_remove_entity(fast.entity_id)
+    async_fire_time_changed(hass, start + timedelta(seconds=56))
+    await hass.async_block_till_done()
+    assert updates[4:] == ["test_domain.slow"]
+    assert list(staggered_polling._timers) == ["test_domain.slow"]
+
+    await entity_platform.async_reset()
+    assert not staggered_polling._timers
+
+
 async def test_update_state_adds_entities(hass: HomeAssistant) -> None:
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -1580,6 +1660,82 @@ async def test_platforms_sharing_services(hass: HomeAssistant) -> None:
     assert entity2 in entities
 
 
+async def test_batch_service_handler(hass: HomeAssistant) -> None:
+    """Test entities of a platform with a batch handler are called at once."""
+    calls: list[tuple[str, dict[str, Any]]] = []
+
+    class HelloEntity(MockEntity):
+        """Entity with a hello service method."""
+
+        async def async_hello(self, **kwargs: Any) -> None:
+            calls.append((self.entity_id, kwargs))
+
+    entity_platform1 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = HelloEntity(entity_id="mock_integration.entity_1")
+    entity2 = HelloEntity(entity_id="mock_integration.entity_2")
+    await entity_platform1.async_add_entities([entity1, entity2])
+
+    entity_platform2 = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity3 = HelloEntity(entity_id="mock_integration.entity_3")
+    await entity_platform2.async_add_entities([entity3])
+
+    batches: list[dict[Entity, dict[str, Any]]] = []
+
+    async def handle_batch(entity_kwargs: dict[Entity, dict[str, Any]]) -> None:
+        batches.append(entity_kwargs)
+
+    entity_platform1.async_register_batch_service_handler(
+        "mock_platform", "hello", handle_batch
+    )
+    entity_platform1.async_register_entity_service(
+        "hello", {vol.Optional("some"): str}, "async_hello"
+    )
+
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": "all", "some": "data"}, blocking=True
+    )
+    # The handler gets the keyword arguments of the service method of each entity
+    assert batches == [{entity1: {"some": "data"}, entity2: {"some": "data"}}]
+    assert calls == [("mock_integration.entity_3", {"some": "data"})]
+
+    # A single entity of the platform is called directly
+    batches.clear()
+    calls.clear()
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": entity1.entity_id}, blocking=True
+    )
+    assert batches == []
+    assert calls == [("mock_integration.entity_1", {})]
+
+    # Services registered with a function are called on each entity
+    async def handle_hello(entity: HelloEntity, call: ServiceCall) -> None:
+        await entity.async_hello(some=call.data["some"].upper())
+
+    entity_platform1.async_register_batch_service_handler(
+        "mock_platform", "hello_function", handle_batch
+    )
+    entity_platform1.async_register_entity_service(
+        "hello_function", {vol.Required("some"): str}, handle_hello
+    )
+
+    calls.clear()
+    await hass.services.async_call(
+        "mock_platform",
+        "hello_function",
+        {"entity_id": [entity1.entity_id, entity2.entity_id], "some": "data"},
+        blocking=True,
+    )
+    assert batches == []
+    assert sorted(calls) == [
+        ("mock_integration.entity_1", {"some": "DATA"}),
+        ("mock_integration.entity_2", {"some": "DATA"}),
+    ]
+
+
 async def test_register_entity_service_response_data(hass: HomeAssistant) -> None:
     """Test an entity service that does supports response data."""
 
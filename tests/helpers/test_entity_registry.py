@@ -19,7 +19,7 @@ from homeassistant.const import (
 from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import MaxLengthExceeded
 from homeassistant.helpers import device_registry as dr, entity_registry as er
-from homeassistant.util.dt import utc_from_timestamp
+from homeassistant.util.dt import utc_from_timestamp, utcnow
 
 from tests.common import (
     ANY,
@@ -580,6 +580,162 @@ async def test_load_bad_data(
     )
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_load_deleted_entities_on_demand(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test deleted entities are created from storage on first access."""
+    deleted_entities = [
+        {
+            "config_entry_id": "mock-id-1",
+            "created_at": "2024-02-14T12:00:00.900075+00:00",
+            "entity_id": "light.hue_1234",
+            "id": "00001",
+            "modified_at": "2024-02-14T12:00:00.900075+00:00",
+            "orphaned_timestamp": None,
+            "platform": "hue",
+            "unique_id": "1234",
+        },
+        {
+            "config_entry_id": None,
+            "created_at": "2024-02-14T12:00:00.900075+00:00",
+            "entity_id": "light.hue_5678",
+            "id": "00002",
+            "modified_at": "2024-02-14T12:00:00.900075+00:00",
+            "orphaned_timestamp": utcnow().timestamp(),
+            "platform": "hue",
+            "unique_id": "5678",
+        },
+    ]
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {"entities": [], "deleted_entities": deleted_entities},
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+
+    assert len(registry.deleted_entities) == 2
+    assert ("light", "hue", "1234") in registry.deleted_entities
+    assert not registry.deleted_entities.data
+
+    # Entries which were not accessed are stored as loaded
+    registry.async_schedule_save()
+    await flush_store(registry._store)
+    assert hass_storage[er.STORAGE_KEY]["data"]["deleted_entities"] == (
+        deleted_entities
+    )
+
+    deleted_entry = registry.deleted_entities[("light", "hue", "1234")]
+    assert deleted_entry == er.DeletedRegistryEntry(
+        config_entry_id="mock-id-1",
+        created_at=datetime.fromisoformat("2024-02-14T12:00:00.900075+00:00"),
+        entity_id="light.hue_1234",
+        id="00001",
+        modified_at=datetime.fromisoformat("2024-02-14T12:00:00.900075+00:00"),
+        orphaned_timestamp=None,
+        platform="hue",
+        unique_id="1234",
+    )
+    assert list(registry.deleted_entities.data) == [("light", "hue", "1234")]
+
+    # Clearing the config entry and purging work without creating entries
+    registry.async_clear_config_entry("mock-id-2")
+    freezer.tick(timedelta(seconds=er.ORPHANED_ENTITY_KEEP_SECONDS + 1))
+    registry.async_purge_expired_orphaned_entities()
+    assert list(registry.deleted_entities) == [("light", "hue", "1234")]
+
+    entry = registry.async_get_or_create("light", "hue", "1234")
+    assert entry.id == "00001"
+    assert len(registry.deleted_entities) == 0
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_load_entities_on_demand(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test entities are indexed from storage and created on first access."""
+    entities = [
+        {
+            "aliases": [],
+            "area_id": "kitchen",
+            "categories": {},
+            "capabilities": None,
+            "config_entry_id": "mock-id-1",
+            "created_at": "2024-02-14T12:00:00.900075+00:00",
+            "device_class": None,
+            "device_id": "mock-dev-1",
+            "disabled_by": None,
+            "entity_category": None,
+            "entity_id": f"light.hue_{unique_id}",
+            "hidden_by": None,
+            "icon": None,
+            "id": f"0000{unique_id}",
+            "has_entity_name": False,
+            "labels": ["label1"],
+            "modified_at": "2024-02-14T12:00:00.900075+00:00",
+            "name": None,
+            "options": {},
+            "original_device_class": None,
+            "original_icon": None,
+            "original_name": None,
+            "platform": "hue",
+            "supported_features": 0,
+            "translation_key": None,
+            "unique_id": unique_id,
+            "previous_unique_id": None,
+            "unit_of_measurement": None,
+        }
+        for unique_id in ("1234", "5678")
+    ]
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {"entities": entities, "deleted_entities": []},
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+
+    assert len(registry.entities) == 2
+    assert "light.hue_1234" in registry.entities
+    assert registry.async_get_entity_id("light", "hue", "5678") == "light.hue_5678"
+    assert not registry.entities.data
+
+    # Entries which were not accessed are stored as loaded
+    registry.async_schedule_save()
+    await flush_store(registry._store)
+    assert hass_storage[er.STORAGE_KEY]["data"]["entities"] == entities
+
+    entry = registry.async_get("00001234")
+    assert entry.entity_id == "light.hue_1234"
+    assert entry.area_id == "kitchen"
+    assert entry.labels == {"label1"}
+    assert list(registry.entities.data) == ["light.hue_1234"]
+    assert registry.async_get("light.hue_1234") is entry
+
+    assert er.async_entries_for_device(registry, "mock-dev-1") == [
+        entry,
+        registry.entities["light.hue_5678"],
+    ]
+
+    # Updating an entry which was not created yet updates the indexes
+    registry.async_update_entity("light.hue_5678", area_id="bedroom")
+    assert er.async_entries_for_area(registry, "kitchen") == [entry]
+    assert [
+        entry.entity_id for entry in er.async_entries_for_area(registry, "bedroom")
+    ] == ["light.hue_5678"]
+
+    registry.async_remove("light.hue_1234")
+    assert er.async_entries_for_label(registry, "label1") == [
+        registry.entities["light.hue_5678"]
+    ]
+    assert registry.async_get_entity_id("light", "hue", "1234") is None
+
+
 def test_async_get_entity_id(entity_registry: er.EntityRegistry) -> None:
     """Test that entity_id is returned."""
     entry = entity_registry.async_get_or_create("light", "hue", "1234")
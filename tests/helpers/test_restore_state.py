@@ -6,6 +6,7 @@ import logging
 from typing import Any
 from unittest.mock import Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -17,7 +18,10 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    LAST_SEEN_UPDATE_INTERVAL,
     STORAGE_KEY,
+    RestoredExtraData,
+    RestoredStoredState,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -94,6 +98,100 @@ async def test_caching_data(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_loading_is_lazy(hass: HomeAssistant) -> None:
+    """Test stored states are only decoded when an entity asks for them."""
+    now = dt_util.utcnow()
+    stored_states = [
+        StoredState(State("input_boolean.b0", "on"), None, now),
+        StoredState(State("input_boolean.b1", "on", {"a": 1}), None, now),
+    ]
+
+    data = async_get(hass)
+    await hass.async_block_till_done()
+    await data.store.async_save([state.as_dict() for state in stored_states])
+
+    # Emulate a fresh load
+    hass.data.pop(DATA_RESTORE_STATE)
+    await async_load(hass)
+    data = async_get(hass)
+
+    assert all(
+        isinstance(stored_state, RestoredStoredState)
+        and "state" not in stored_state.__dict__
+        for stored_state in data.last_states.values()
+    )
+
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    state = await entity.async_get_last_state()
+    assert state.state == "on"
+    assert state.attributes == {"a": 1}
+    assert state.last_updated == stored_states[1].state.last_updated
+    assert "state" not in data.last_states["input_boolean.b0"].__dict__
+
+    # States which were not decoded are dumped as they were loaded
+    written_states = json_round_trip(data.async_get_stored_states())
+    assert written_states == json_round_trip(
+        [state.as_dict() for state in stored_states]
+    )
+    assert "state" not in data.last_states["input_boolean.b0"].__dict__
+
+
+async def test_unchanged_states_are_reused(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test unchanged stored states are reused between dumps."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity1 = RestoreEntity()
+    entity1.hass = hass
+    entity1.entity_id = "input_boolean.b1"
+    entity2 = RestoreEntity()
+    entity2.hass = hass
+    entity2.entity_id = "input_boolean.b2"
+    await platform.async_add_entities([entity1, entity2])
+
+    data = async_get(hass)
+    hass.states.async_set("input_boolean.b1", "on")
+    hass.states.async_set("input_boolean.b2", "on")
+    first = {
+        stored_state.state.entity_id: stored_state
+        for stored_state in data.async_get_stored_states()
+    }
+
+    freezer.tick(timedelta(minutes=15))
+    hass.states.async_set("input_boolean.b2", "off")
+    second = {
+        stored_state.state.entity_id: stored_state
+        for stored_state in data.async_get_stored_states()
+    }
+    assert second["input_boolean.b1"] is first["input_boolean.b1"]
+    assert second["input_boolean.b2"] is not first["input_boolean.b2"]
+    assert second["input_boolean.b2"].last_seen == dt_util.utcnow()
+
+    # The last seen time is updated once it is due
+    freezer.tick(LAST_SEEN_UPDATE_INTERVAL)
+    third = {
+        stored_state.state.entity_id: stored_state
+        for stored_state in data.async_get_stored_states()
+    }
+    assert third["input_boolean.b1"] is not first["input_boolean.b1"]
+    assert third["input_boolean.b1"].last_seen == dt_util.utcnow()
+
+    # Changed extra data is not reused
+    with patch.object(
+        RestoreEntity,
+        "extra_restore_state_data",
+        RestoredExtraData({"changed": True}),
+    ):
+        fourth = {
+            stored_state.state.entity_id: stored_state
+            for stored_state in data.async_get_stored_states()
+        }
+    assert fourth["input_boolean.b1"] is not third["input_boolean.b1"]
+    assert fourth["input_boolean.b1"].extra_data.as_dict() == {"changed": True}
+
+
 async def test_async_get_instance_backwards_compatibility(hass: HomeAssistant) -> None:
     """Test async_get_instance backwards compatibility."""
     await async_load(hass)
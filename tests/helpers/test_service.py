@@ -41,8 +41,10 @@ from homeassistant.helpers import (
     service,
 )
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import json_bytes
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util.json import json_loads
 from homeassistant.util.yaml.loader import parse_yaml
 
 from tests.common import (
@@ -690,6 +692,44 @@ async def test_extract_entity_ids_from_area(
     )
 
 
+async def test_extract_entity_ids_from_area_cached(
+    hass: HomeAssistant, floor_area_mock
+) -> None:
+    """Test resolved targets are cached until a registry is updated."""
+    call = ServiceCall("light", "turn_on", {"area_id": "test-area"})
+
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_area",
+        "light.assigned_to_area",
+    }
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_area",
+        "light.assigned_to_area",
+    }
+    cache = hass.data[service.TARGET_RESOLUTION_CACHE]
+    assert cache.async_get_stats() == (1, 1)
+
+    # The order of the targeted ids does not matter
+    call = ServiceCall("light", "turn_on", {"area_id": ["test-area", "diff-area"]})
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_area",
+        "light.diff_area",
+        "light.assigned_to_area",
+    }
+    call = ServiceCall("light", "turn_on", {"area_id": ["diff-area", "test-area"]})
+    await service.async_extract_entity_ids(hass, call)
+    assert cache.async_get_stats() == (2, 2)
+
+    er.async_get(hass).async_update_entity(
+        "light.in_area", hidden_by=er.RegistryEntryHider.USER
+    )
+    call = ServiceCall("light", "turn_on", {"area_id": "test-area"})
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.assigned_to_area",
+    }
+    assert cache.async_get_stats() == (2, 3)
+
+
 async def test_extract_entity_ids_from_devices(
     hass: HomeAssistant, floor_area_mock
 ) -> None:
@@ -912,6 +952,37 @@ async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     assert await service.async_get_all_descriptions(hass) is descriptions
 
 
+async def test_async_get_all_descriptions_json(hass: HomeAssistant) -> None:
+    """Test only the changed domains are rebuilt in the descriptions JSON."""
+    assert await async_setup_component(hass, DOMAIN_GROUP, {DOMAIN_GROUP: {}})
+    assert await async_setup_component(hass, DOMAIN_LOGGER, {DOMAIN_LOGGER: {}})
+
+    payload = await service.async_get_all_descriptions_json(hass)
+    descriptions = await service.async_get_all_descriptions(hass)
+    assert json_loads(payload) == descriptions
+    assert await service.async_get_all_descriptions_json(hass) is payload
+
+    hass.services.async_register(DOMAIN_LOGGER, "new_service", lambda x: None, None)
+    with patch(
+        "homeassistant.helpers.service.json_bytes", side_effect=json_bytes
+    ) as mock_json_bytes:
+        new_payload = await service.async_get_all_descriptions_json(hass)
+
+    # Only the logger domain and the whole response were serialized
+    assert mock_json_bytes.call_count == 2
+    new_descriptions = await service.async_get_all_descriptions(hass)
+    assert new_descriptions is not descriptions
+    assert new_descriptions[DOMAIN_GROUP] is descriptions[DOMAIN_GROUP]
+    assert "new_service" in new_descriptions[DOMAIN_LOGGER]
+    assert json_loads(new_payload) == new_descriptions
+
+    for service_name in list(hass.services.async_services_for_domain(DOMAIN_LOGGER)):
+        hass.services.async_remove(DOMAIN_LOGGER, service_name)
+    payload = await service.async_get_all_descriptions_json(hass)
+    assert DOMAIN_LOGGER not in json_loads(payload)
+    assert DOMAIN_GROUP in json_loads(payload)
+
+
 async def test_async_get_all_descriptions_dot_keys(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions with keys starting with a period."""
     service_descriptions = """
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -20,7 +21,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1181,201 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journaled_store(tmpdir: py.path.local) -> None:
+    """Test a journaled store only appends the changes."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": str(idx), "value": "x" * 100} for idx in range(100)]
+        data = {"items": items, "other": "value", "removed": 1}
+        await store.async_save(data)
+        base_size = os.path.getsize(store.path)
+        journal_size = os.path.getsize(store.journal_path)
+
+        items[50] = {"id": "50", "value": "changed"}
+        await store.async_save(data)
+        del items[10]
+        await store.async_save(data)
+        items.append({"id": "100", "value": "new"})
+        await store.async_save(data)
+        del data["removed"]
+        data["added"] = True
+        await store.async_save(data)
+        await store.async_save(data)
+
+        # The store file is untouched and only the changes are appended
+        assert os.path.getsize(store.path) == base_size
+        journal = await hass.async_add_executor_job(Path(store.journal_path).read_bytes)
+        assert len(journal.splitlines()) == 6
+        assert len(journal) - journal_size < 300
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {
+            "items": items,
+            "other": "value",
+            "added": True,
+        }
+
+        # The journal is compacted into the store file once it outgrows it
+        for idx in range(100):
+            items[idx] = {"id": str(idx), "value": "y" * 100}
+            await store.async_save(data)
+        assert os.path.getsize(store.journal_path) < base_size
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert (await store3.async_load())["items"] == items
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_crash_recovery(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a journaled store recovers from an interrupted write."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = Path(store.journal_path)
+        await store.async_save({"items": [1, 2, 3]})
+        await store.async_save({"items": [1, 2, 3, 4]})
+        await store.async_save({"items": [1, 2, 3, 4, 5]})
+
+        # Simulate a crash while appending the last record
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        await hass.async_add_executor_job(journal_path.write_bytes, journal[:-5])
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == {"items": [1, 2, 3, 4]}
+        assert "Ignoring invalid journal record for storage-test" in caplog.text
+
+        # The first save after loading compacts the journal
+        await store2.async_save({"items": [1, 2, 3, 4, 6]})
+        store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store3.async_load() == {"items": [1, 2, 3, 4, 6]}
+
+        # Simulate a crash after compacting the store file
+        # but before starting the new journal
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        await store3.async_save({"items": [7]})
+        await hass.async_add_executor_job(
+            journal_path.write_bytes, journal + b'{"key":"items","value":[8]}\n'
+        )
+
+        store4 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store4.async_load() == {"items": [7]}
+
+        await store4.async_remove()
+        assert not os.path.exists(store.path)
+        assert not os.path.exists(store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_fragments(tmpdir: py.path.local) -> None:
+    """Test a journaled store only encodes changed fragments and keeps hashes."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [json_fragment(json_bytes({"id": idx})) for idx in range(100)]
+        await store.async_save({"items": items})
+
+        items[10] = json_fragment(json_bytes({"id": "changed"}))
+        with patch.object(
+            store, "_encode_journal_item", wraps=store._encode_journal_item
+        ) as encode_item:
+            await store.async_save({"items": items})
+        assert encode_item.call_count == 1
+
+        journal = await hass.async_add_executor_job(Path(store.journal_path).read_bytes)
+        assert journal.splitlines()[1:] == [
+            b'{"key":"items","start":10,"delete":1,"items":[{"id":"changed"}]}',
+        ]
+        # Only the hashes of the encoded items are kept
+        assert all(
+            type(item_hash) is int for item_hash in store._journal_state.hashes["items"]
+        )
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert (await store2.async_load())["items"][10] == {"id": "changed"}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_compacts_on_final_write(
+    tmpdir: py.path.local,
+) -> None:
+    """Test a journaled store leaves a current store file when stopping."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = Path(store.journal_path)
+        await store.async_save({"items": [1, 2, 3]})
+        header = await hass.async_add_executor_job(journal_path.read_bytes)
+        await store.async_save({"items": [1, 2, 3, 4]})
+
+        hass.set_state(CoreState.final_write)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        data = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+        assert data["data"] == {"items": [1, 2, 3, 4]}
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        assert len(journal.splitlines()) == 1
+        assert journal != header
+
+        # Pending writes are compacted into the store file as well
+        hass.set_state(CoreState.running)
+        await store.async_save({"items": [5]})
+        hass.set_state(CoreState.final_write)
+        store.async_delay_save(lambda: {"items": [5, 6]}, 10)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        data = await hass.async_add_executor_job(
+            json.loads, Path(store.path).read_text()
+        )
+        assert data["data"] == {"items": [5, 6]}
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        assert len(journal.splitlines()) == 1
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_list(tmpdir: py.path.local) -> None:
+    """Test a journaled store with a list writes each changed run of items."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = Path(store.journal_path)
+        items = [{"id": idx} for idx in range(100)]
+        await store.async_save(items)
+
+        items[10] = items[11] = {"id": "changed"}
+        items[90] = {"id": "changed"}
+        await store.async_save(items)
+
+        journal = await hass.async_add_executor_job(journal_path.read_bytes)
+        assert journal.splitlines()[1:] == [
+            b'{"start":10,"delete":2,"items":[{"id":"changed"},{"id":"changed"}]}',
+            b'{"start":90,"delete":1,"items":[{"id":"changed"}]}',
+        ]
+
+        del items[50]
+        await store.async_save(items)
+
+        store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store2.async_load() == items
+
+        # Switching between a list and a dict compacts the journal
+        await store.async_save({"items": items})
+        assert await store.async_load() == {"items": items}
+
+        await hass.async_stop(force=True)
@@ -1,6 +1,7 @@
 """Test the translation helper."""
 
 import asyncio
+from datetime import timedelta
 import pathlib
 from typing import Any
 from unittest.mock import Mock, call, patch
@@ -12,6 +13,9 @@ from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import translation
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture(autouse=True)
@@ -682,3 +686,46 @@ async def test_get_translations_still_has_title_without_translations_files(
     assert translations == {
         "component.component1.title": "Component 1",
     }
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_translation_bundle(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test flattened translations are kept across restarts."""
+
+    def new_cache() -> translation._TranslationCache:
+        """Return a cache as created on a restart."""
+        cache = translation._TranslationCache(hass)
+        cache.cache_data = type(cache.cache_data)({}, {})
+        return cache
+
+    translations = await new_cache().async_fetch("de", "entity", {"test"})
+    assert translations["component.test.entity.switch.other1.name"] == "Anderes 1"
+    assert await new_cache().async_fetch("invalid-language", "entity", {"test"})
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=translation.TRANSLATION_BUNDLE_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+
+    assert f"{translation.TRANSLATION_BUNDLE_STORAGE_KEY}.invalid-language" not in (
+        hass_storage
+    )
+    stored = hass_storage[f"{translation.TRANSLATION_BUNDLE_STORAGE_KEY}.de"]
+    assert stored["data"]["components"]["test"]["strings"]["entity"] == translations
+
+    # Unchanged translations are not loaded again
+    with patch(
+        "homeassistant.helpers.translation._load_translations_files_by_language",
+        wraps=translation._load_translations_files_by_language,
+    ) as mock_load:
+        cache = new_cache()
+        assert await cache.async_fetch("de", "entity", {"test"}) == translations
+        assert cache.async_is_loaded("de", {"test"})
+        assert not mock_load.called
+
+        # Translations of another version of the integration are loaded again
+        stored["data"]["components"]["test"]["fingerprint"][0] = "0.0.1"
+        assert await new_cache().async_fetch("de", "entity", {"test"}) == translations
+        assert mock_load.called
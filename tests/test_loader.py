@@ -1999,3 +1999,67 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_integration_snapshot(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test unchanged integrations are restored from the snapshot."""
+
+    async def async_restart() -> None:
+        """Reset the loader as if Home Assistant restarted."""
+        loader.async_setup(hass)
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        await loader.async_load_integration_snapshot(hass)
+
+    await async_restart()
+    integration = await loader.async_get_integration(hass, "logbook")
+    assert await integration.resolve_dependencies()
+    custom = await loader.async_get_custom_components(hass)
+    await loader.async_save_integration_snapshot(hass)
+
+    data = hass_storage[loader.INTEGRATION_SNAPSHOT_STORAGE_KEY]["data"]
+    assert data["custom_components"]["dirs"]
+    assert data["integrations"].keys() >= {"logbook", *custom}
+    assert data["integrations"]["logbook"]["all_dependencies"] == sorted(
+        integration.all_dependencies
+    )
+
+    await async_restart()
+    assert (await loader.async_get_custom_components(hass)).keys() == custom.keys()
+    integration = await loader.async_get_integration(hass, "logbook")
+    snapshot = hass.data[loader.DATA_INTEGRATION_SNAPSHOT]
+    assert snapshot.restored >= {"logbook", *custom}
+    assert integration.manifest["domain"] == "logbook"
+    assert integration.all_dependencies_resolved
+    assert integration.all_dependencies == set(
+        data["integrations"]["logbook"]["all_dependencies"]
+    )
+
+    # Nothing changed, so nothing is written
+    hass_storage.pop(loader.INTEGRATION_SNAPSHOT_STORAGE_KEY)
+    await loader.async_save_integration_snapshot(hass)
+    assert loader.INTEGRATION_SNAPSHOT_STORAGE_KEY not in hass_storage
+
+    # A changed dependency is resolved from disk again and
+    # the dependencies of logbook are no longer restored
+    data["integrations"]["http"]["mtimes"] = [0, 0]
+    hass_storage[loader.INTEGRATION_SNAPSHOT_STORAGE_KEY] = {
+        "version": loader.INTEGRATION_SNAPSHOT_STORAGE_VERSION,
+        "data": data,
+    }
+    await async_restart()
+    integration = await loader.async_get_integration(hass, "logbook")
+    http_integration = await loader.async_get_integration(hass, "http")
+    snapshot = hass.data[loader.DATA_INTEGRATION_SNAPSHOT]
+    assert "logbook" in snapshot.restored
+    assert "http" not in snapshot.restored
+    assert http_integration.domain == "http"
+    assert not integration.all_dependencies_resolved
+
+    # A snapshot of another Home Assistant version is ignored
+    data["ha_version"] = "0.1.0"
+    await async_restart()
+    await loader.async_get_integration(hass, "logbook")
+    assert not hass.data[loader.DATA_INTEGRATION_SNAPSHOT].restored
@@ -9,6 +9,7 @@ from typing import Any
 import unittest
 from unittest.mock import Mock, patch
 
+from lru import LRU
 import pytest
 import voluptuous as vol
 import yaml as pyyaml
@@ -767,3 +768,113 @@ def test_load_yaml_wrap_oserror(
         pytest.raises(load_yaml_exception),
     ):
         yaml_loader.load_yaml("bla")
+
+
+def _write_old_file(path: pathlib.Path, content: str) -> None:
+    """Write a file with a modification time old enough to be cached."""
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, (1_700_000_000, 1_700_000_000 + len(content)))
+
+
+@pytest.mark.usefixtures("try_both_loaders")
+def test_parse_cache(tmp_path: pathlib.Path) -> None:
+    """Test unchanged files are not parsed again."""
+    config_file = tmp_path / "configuration.yaml"
+    _write_old_file(
+        config_file,
+        "name: !secret name\n"
+        "home: !env_var HOME_NAME\n"
+        "script: !include script.yaml\n"
+        "automation: !include_dir_merge_list automations\n",
+    )
+    _write_old_file(tmp_path / "secrets.yaml", "name: Home\n")
+    _write_old_file(tmp_path / "script.yaml", "turn_on:\n  sequence: []\n")
+    (tmp_path / "automations").mkdir()
+    _write_old_file(tmp_path / "automations" / "one.yaml", "- id: one\n")
+    secrets = yaml_loader.Secrets(tmp_path)
+
+    def load() -> tuple[dict[str, Any], list[str]]:
+        """Load the configuration and return the names of the parsed files."""
+        with (
+            patch.dict(os.environ, {"HOME_NAME": "Our home"}),
+            patch(
+                "homeassistant.util.yaml.loader.parse_yaml",
+                wraps=yaml_loader.parse_yaml,
+            ) as mock_parse_yaml,
+        ):
+            config = yaml_loader.load_yaml_dict(config_file, secrets)
+        return config, [
+            pathlib.Path(call.args[0].name).name
+            for call in mock_parse_yaml.call_args_list
+        ]
+
+    config, parsed = load()
+    assert config == {
+        "name": "Home",
+        "home": "Our home",
+        "script": {"turn_on": {"sequence": []}},
+        "automation": [{"id": "one"}],
+    }
+    assert config["script"]["turn_on"].__line__ == 2
+    assert parsed == [
+        "configuration.yaml",
+        "secrets.yaml",
+        "script.yaml",
+        "one.yaml",
+    ]
+
+    # Modifying the result does not modify the cache
+    config["script"]["turn_off"] = {}
+    assert load() == ({**config, "script": {"turn_on": {"sequence": []}}}, [])
+    config, _ = load()
+    assert config["script"]["turn_on"].__line__ == 2
+    assert config["script"]["turn_on"].__config_file__ == str(tmp_path / "script.yaml")
+
+    # An included file changed
+    _write_old_file(tmp_path / "script.yaml", "turn_off:\n  sequence: []\n")
+    config, parsed = load()
+    assert config["script"] == {"turn_off": {"sequence": []}}
+    assert parsed == ["configuration.yaml", "script.yaml"]
+
+    # A file was added to an included directory
+    _write_old_file(tmp_path / "automations" / "two.yaml", "- id: two\n")
+    config, parsed = load()
+    assert config["automation"] == [{"id": "one"}, {"id": "two"}]
+    assert parsed == ["configuration.yaml", "two.yaml"]
+
+    # A secret changed
+    _write_old_file(tmp_path / "secrets.yaml", "name: House\n")
+    secrets = yaml_loader.Secrets(tmp_path)
+    config, parsed = load()
+    assert config["name"] == "House"
+    assert parsed == ["secrets.yaml", "configuration.yaml"]
+
+    # Files modified recently are not cached
+    (tmp_path / "script.yaml").write_text("turn_on:\n  sequence: []\n")
+    load()
+    _, parsed = load()
+    assert parsed == ["configuration.yaml", "script.yaml"]
+
+
+def test_parse_cache_eviction(tmp_path: pathlib.Path) -> None:
+    """Test the least recently used files are evicted from the parse cache."""
+    paths = [tmp_path / f"{name}.yaml" for name in ("one", "two", "three")]
+    for path in paths:
+        _write_old_file(path, f"name: {path.stem}\n")
+
+    def load(path: pathlib.Path) -> bool:
+        """Load a file and return if it was parsed."""
+        with patch(
+            "homeassistant.util.yaml.loader.parse_yaml",
+            wraps=yaml_loader.parse_yaml,
+        ) as mock_parse_yaml:
+            assert yaml_loader.load_yaml(path) == {"name": path.stem}
+        return mock_parse_yaml.called
+
+    with patch.object(yaml_loader, "_PARSE_CACHE", LRU(2)):
+        assert [load(path) for path in paths] == [True, True, True]
+        # The first file was evicted when the third one was cached
+        assert [load(path) for path in reversed(paths)] == [False, False, True]
+
+        yaml_loader.clear_parse_cache()
+        assert load(paths[0]) is True